@@ -27,17 +27,30 @@ import math
 import logging
 import traceback
 import gc
+import hashlib
 import tempfile
 import platform
 import shutil
 import weakref
 from datetime import datetime
 from pathlib import Path
-from collections import deque
+from collections import deque, OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from array import array
 import queue
 import subprocess
 
+# 🔥 프로덕션 모드 Windows 에서 python.exe 로 실행되면 무거운 모듈을 읽기 전에 콘솔 없는 pythonw.exe 로 다시 실행
+# (콘솔 창을 띄웠다 숨기는 대신 처음부터 콘솔 없이 - 패키징된 실행 파일은 제외)
+if (__name__ == '__main__' and os.name == 'nt' and not getattr(sys, 'frozen', False)
+        and not ('--debug' in sys.argv or os.getenv('DEBUG_MODE') == '1')
+        and os.path.basename(sys.executable).lower() == 'python.exe'):
+    _pythonw = os.path.join(os.path.dirname(sys.executable), 'pythonw.exe')
+    if os.path.exists(_pythonw):
+        subprocess.Popen([_pythonw, os.path.abspath(sys.argv[0])] + sys.argv[1:], close_fds=True)
+        sys.exit(0)
+
 # 🔥 중복 제거된 모듈 import
 from constants import VERSION, BUILD_DATE, COPYRIGHT
 from utils import resource_path, setup_logging, setup_window_icon, create_improved_arrow
@@ -45,6 +58,9 @@ from utils import resource_path, setup_logging, setup_window_icon, create_improv
 # 로깅 초기화
 logger = setup_logging()
 
+# 디버그 플래그 (핫 패스의 로그 문자열 생성 차단용)
+DEBUG = '--debug' in sys.argv or os.getenv('DEBUG_MODE') == '1'
+
 # 시스템 정보 로깅
 logger.info("=" * 60)
 logger.info(f"피드백 캔버스 V{VERSION}")
@@ -57,6 +73,7 @@ logger.info("=" * 60)
 # GUI 라이브러리
 try:
     import tkinter as tk
+    import _tkinter
     from tkinter import ttk, filedialog, messagebox, colorchooser, simpledialog, font
     logger.info("✓ tkinter 모듈 로드 성공")
 except ImportError as e:
@@ -65,9 +82,12 @@ except ImportError as e:
 
 # 이미지 처리
 try:
+    import PIL
     from PIL import Image, ImageTk, ImageDraw, ImageFont
     PIL_AVAILABLE = True
-    logger.info("✓ Pillow 모듈 로드 성공")
+    # Pillow-SIMD 빌드는 버전 문자열에 '.postN' 이 붙음 - 이 경우 SIMD 리샘플링을 그대로 사용
+    PILLOW_SIMD = '.post' in getattr(PIL, '__version__', '')
+    logger.info(f"✓ Pillow 모듈 로드 성공{' (SIMD)' if PILLOW_SIMD else ''}")
 except ImportError as e:
     logger.critical(f"Pillow 모듈이 필요합니다: {e}")
     messagebox.showerror("필수 모듈 오류", 
@@ -126,6 +146,847 @@ except ImportError as e:
     logger.warning(f"psutil 모듈이 없습니다: {e}")
     PSUTIL_AVAILABLE = False
 
+# 주석 좌표 벡터 연산
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+    logger.info("✓ NumPy 모듈 로드 성공")
+except ImportError as e:
+    logger.warning(f"NumPy 모듈이 없습니다: {e}")
+    NUMPY_AVAILABLE = False
+
+# 펜 획 JIT 가속 (긴 획의 스케일링 루프) + PDF 배경 이미지 분리형 Lanczos 커널
+try:
+    from numba import njit, prange
+
+    @njit(cache=True)
+    def _scale_points_jit(pts, scale_x, scale_y, out):
+        """(N, 2) 점 배열 스케일링 - 결과를 out 에 기록"""
+        for i in range(pts.shape[0]):
+            out[i, 0] = pts[i, 0] * scale_x
+            out[i, 1] = pts[i, 1] * scale_y
+
+    @njit(cache=True)
+    def _pdf_points_jit(pts, base_x, base_y, scale_x, scale_y, image_height, out):
+        """(N, 2) 이미지 좌표 → PDF 좌표 (Y축 뒤집기) - 결과를 out 에 기록"""
+        for i in range(pts.shape[0]):
+            out[i, 0] = base_x + pts[i, 0] * scale_x
+            out[i, 1] = base_y + (image_height - pts[i, 1]) * scale_y
+
+    @njit(cache=True, boundscheck=False)
+    def _pen_hits_rect(pts, min_x, min_y, max_x, max_y):
+        """(N, 2) 점 배열 중 하나라도 사각형 안에 있으면 True - 첫 적중에서 바로 종료"""
+        for i in range(pts.shape[0]):
+            x = pts[i, 0]
+            y = pts[i, 1]
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                return True
+        return False
+
+    @njit(cache=True, boundscheck=False)
+    def _wrap_breaks_jit(widths, space_width, max_width, out):
+        """탐욕적 줄바꿈 줄 시작 인덱스를 out 에 기록하고 줄 수 반환 - 단어별 경로와 같은 순서로 폭 누적"""
+        n = widths.shape[0]
+        count = 0
+        i = 0
+        while i < n:
+            out[count] = i
+            count += 1
+            width = widths[i]
+            j = i + 1
+            while j < n and width + space_width + widths[j] <= max_width:
+                width += space_width + widths[j]
+                j += 1
+            i = j
+        return count
+
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def _resample_rows_jit(src, starts, weights, out):
+        """(H, W, C) uint8 의 각 행을 가로 방향으로 리샘플 - out (H, 출력 W, C) float32
+        
+        Pillow 처럼 중간 결과도 0~255 로 클리핑해 반올림한다 (세로 단계 입력이 Pillow 와 같아짐).
+        """
+        ksize = weights.shape[1]
+        for y in prange(src.shape[0]):
+            for j in range(starts.shape[0]):
+                start = starts[j]
+                for c in range(src.shape[2]):
+                    acc = 0.0
+                    for k in range(ksize):
+                        w = weights[j, k]
+                        if w != 0.0:
+                            acc += src[y, start + k, c] * w
+                    if acc < 0.0:
+                        acc = 0.0
+                    elif acc > 255.0:
+                        acc = 255.0
+                    out[y, j, c] = int(acc + 0.5)
+
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def _resample_cols_jit(src, starts, weights, out):
+        """(H, W, C) float32 를 세로 방향으로 리샘플해 반올림/클리핑 - out (출력 H, W, C) uint8"""
+        ksize = weights.shape[1]
+        for i in prange(starts.shape[0]):
+            start = starts[i]
+            for x in range(src.shape[1]):
+                for c in range(src.shape[2]):
+                    acc = 0.0
+                    for k in range(ksize):
+                        w = weights[i, k]
+                        if w != 0.0:
+                            acc += src[start + k, x, c] * w
+                    if acc < 0.0:
+                        acc = 0.0
+                    elif acc > 255.0:
+                        acc = 255.0
+                    out[i, x, c] = int(acc + 0.5)
+
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+    logger.info("✓ Numba 모듈 로드 성공")
+except Exception as e:
+    logger.warning(f"Numba 모듈이 없습니다: {e}")
+    NUMBA_AVAILABLE = False
+
+# 펜 스무딩 가우시안 가중치 (모듈 로드 시 1회 계산)
+_WEIGHTS_3 = (0.25, 0.5, 0.25)
+_WEIGHTS_5 = (0.1, 0.2, 0.4, 0.2, 0.1)
+
+@lru_cache(maxsize=16)
+def _gen_weights(n):
+    """n점 스무딩 가중치 - 중심 0.5, 나머지 점들이 0.5를 균등 분배"""
+    if n == 3:
+        return _WEIGHTS_3
+    if n == 5:
+        return _WEIGHTS_5
+    center_idx = n // 2
+    side_weight = 0.5 / (n - 1)
+    return tuple(0.5 if j == center_idx else side_weight for j in range(n))
+
+# 두 점 주석의 좌표 키 (타입 → 시작 x, 시작 y, 끝 x, 끝 y)
+_SHAPE_KEYS = {
+    'arrow': ('start_x', 'start_y', 'end_x', 'end_y'),
+    'line': ('start_x', 'start_y', 'end_x', 'end_y'),
+    'oval': ('x1', 'y1', 'x2', 'y2'),
+    'rect': ('x1', 'y1', 'x2', 'y2'),
+}
+
+def _text_bbox(annotation):
+    """텍스트 주석의 추정 영역 (width, height) - 텍스트/폰트 크기가 같으면 캐시 사용
+    
+    annotation['_bbox'] = (text, font_size, width, height) 형태로 저장되며
+    텍스트나 폰트 크기가 바뀌면 자동으로 다시 계산된다.
+    """
+    text = annotation.get('text', '')
+    font_size = annotation.get('font_size', 14)
+    cached = annotation.get('_bbox')
+    if cached and cached[0] == text and cached[1] == font_size:
+        return cached[2], cached[3]
+    
+    # anchor='nw' 기준 텍스트 영역 (최소 60x25 보장)
+    text_width = max(len(text) * font_size * 0.7, 60)
+    text_height = max(font_size * 1.5, 25)
+    annotation['_bbox'] = (text, font_size, text_width, text_height)
+    return text_width, text_height
+
+def _scale_points(points, scale_x, scale_y):
+    """(x, y) 점 목록 일괄 스케일링 - 긴 획은 NumPy 브로드캐스트 곱 한 번으로 처리"""
+    if NUMBA_AVAILABLE and len(points) >= 32:
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        scaled = np.empty_like(pts)
+        _scale_points_jit(pts, scale_x, scale_y, scaled)
+        return list(map(tuple, scaled.tolist()))
+    if NUMPY_AVAILABLE and len(points) >= 32:
+        scaled = np.asarray(points, dtype=np.float64) * (scale_x, scale_y)
+        return list(map(tuple, scaled.tolist()))
+    return [(x * scale_x, y * scale_y) for x, y in points]
+
+@lru_cache(maxsize=256)
+def _font_for(name, size, bold):
+    """텍스트 주석용 Tk 폰트 튜플 - (이름, 크기, 볼드) 조합별로 한 번만 생성"""
+    return (name, size, 'bold' if bold else 'normal')
+
+# 🔥 폰트별 문자 폭 표 (1pt 기준) - 폰트 이름 -> {문자: 폭}
+_pdf_char_widths = {}
+
+# 🔥 'Korean' 이름으로 등록된 TTF 경로 - 같은 경로면 다시 파싱하지 않음
+_registered_pdf_font_path = None
+
+def _register_korean_pdf_font(font_path):
+    """한글 TTF 를 'Korean' 으로 한 번만 등록 (페이지마다 TTFont 로 폰트 파일을 다시 읽지 않게)
+    
+    경로가 바뀌어 다시 등록하면 이름별 폭 캐시도 비움. 실패 시 예외는 호출 측에서 처리
+    """
+    global _registered_pdf_font_path
+    if _registered_pdf_font_path == font_path and 'Korean' in pdfmetrics.getRegisteredFontNames():
+        return 'Korean'
+    pdfmetrics.registerFont(TTFont('Korean', font_path))
+    # 볼드/이탤릭 요청도 같은 글꼴로 매핑 (변형 폰트 추가 등록 없이)
+    pdfmetrics.registerFontFamily('Korean', normal='Korean', bold='Korean', italic='Korean', boldItalic='Korean')
+    if _registered_pdf_font_path is not None:
+        _pdf_char_widths.pop('Korean', None)
+        _pdf_text_units.cache_clear()
+        _pdf_text_tokens.cache_clear()
+        _adaptive_text_layout.cache_clear()
+    _registered_pdf_font_path = font_path
+    logger.info("✓ PDF 한글 폰트 등록 성공")
+    return 'Korean'
+
+@lru_cache(maxsize=4096)
+def _pdf_text_units(text, font_name):
+    """1pt 기준 문자열 폭 - 글리프 폭의 합이므로 문자 폭 표에서 더하고, 처음 보는 문자만 reportlab 으로 측정"""
+    table = _pdf_char_widths.get(font_name)
+    if table is None:
+        table = _pdf_char_widths[font_name] = {}
+    total = 0.0
+    for ch in text:
+        width = table.get(ch)
+        if width is None:
+            width = table[ch] = pdfmetrics.stringWidth(ch, font_name, 1)
+        total += width
+    return total
+
+def _pdf_string_width(text, font_name, font_size):
+    """reportlab 문자열 폭 (pt) - 폭은 크기에 비례하므로 1pt 폭을 (문자열, 폰트) 별로 캐시해 폰트 크기 탐색 간에도 재사용"""
+    return _pdf_text_units(text, font_name) * font_size
+
+@lru_cache(maxsize=256)
+def _pdf_text_tokens(text, font_name):
+    """줄바꿈용 토큰 - 문단별 (단어 튜플, 단어별 1pt 폭 array('d')), 빈 문단은 빈 튜플
+    
+    폰트 크기 탐색에서 같은 텍스트를 여러 크기로 줄바꿈하므로 분리/측정은 (텍스트, 폰트) 별로 한 번만.
+    폭은 박싱된 float 튜플 대신 연속 버퍼로 보관 - 긴 문단 경로가 복사 없이 NumPy 배열로 읽음 (캐시 공유 값이므로 수정 금지)
+    """
+    tokens = []
+    for paragraph in text.split('\n'):
+        words = tuple(paragraph.split())
+        units = array('d')
+        units.extend(_pdf_text_units(word, font_name) for word in words)
+        tokens.append((words, units))
+    return tuple(tokens)
+
+# 🔥 이 단어 수 이상인 문단은 누적 합 + searchsorted 로 줄바꿈 (짧은 문단은 배열 생성 비용이 더 큼)
+_VECTOR_WRAP_MIN_WORDS = 64
+
+def _greedy_line_starts(word_widths, space_width, max_width):
+    """탐욕적 줄바꿈의 줄 시작 단어 인덱스 - 단어마다가 아니라 줄마다 한 번 searchsorted
+    
+    i~j-1 번째 단어 줄 폭 = prefix[j] - prefix[i] - 공백 (prefix 는 단어 폭 + 공백의 누적 합).
+    모든 단어가 한 줄 폭 이하일 때만 사용 (넘는 단어의 하이픈 처리는 호출 측 단어별 경로에서).
+    Numba 가 있으면 단어 단위 스캔을 JIT 커널로 (인터프리터 디스패치 없이 한 번에)
+    """
+    if NUMBA_AVAILABLE:
+        widths = np.asarray(word_widths, dtype=np.float64)
+        out = np.empty(len(widths), dtype=np.int64)
+        count = _wrap_breaks_jit(widths, float(space_width), float(max_width), out)
+        return out[:count].tolist()
+    prefix = np.zeros(len(word_widths) + 1)
+    np.cumsum(np.asarray(word_widths, dtype=np.float64) + space_width, out=prefix[1:])
+    count = len(word_widths)
+    starts = []
+    start = 0
+    while start < count:
+        starts.append(start)
+        end = int(np.searchsorted(prefix, prefix[start] + space_width + max_width, side='right')) - 1
+        start = max(end, start + 1)
+    return starts
+
+def _wrap_pdf_text(text, max_width, font_name, font_size, max_lines=None):
+    """PDF용 텍스트 줄바꿈 - 캔버스/생성기 상태를 쓰지 않는 순수 계산 (폰트 크기 탐색 캐시에서도 사용)
+    
+    max_lines: 주면 줄 수가 이를 넘는 순간 중단 (넘쳤는지만 알면 되는 폰트 크기 탐색용 - 결과는 잘린 목록)
+    """
+    try:
+        lines = []
+        # 🔥 공백 폭은 호출당 한 번만 (정규식 없이 str.split 만 쓰므로 미리 컴파일할 패턴은 없음)
+        space_width = _pdf_string_width(" ", font_name, font_size)
+        
+        # 🔥 문단/단어 분리와 단어별 1pt 폭은 텍스트당 한 번만 - 폰트 크기 후보마다 크기만 곱함
+        for words, word_units in _pdf_text_tokens(text, font_name):
+            if not words:
+                lines.append("")
+                continue
+            
+            # 🔥 긴 문단: 단어 폭 배열의 누적 합으로 줄 경계를 한 번에 탐색
+            if NUMPY_AVAILABLE and len(words) >= _VECTOR_WRAP_MIN_WORDS:
+                word_widths = np.frombuffer(word_units, dtype=np.float64) * font_size
+                if word_widths.max() <= max_width:
+                    starts = _greedy_line_starts(word_widths, space_width, max_width)
+                    for start, end in zip(starts, starts[1:] + [len(words)]):
+                        lines.append(" ".join(words[start:end]))
+                    if max_lines is not None and len(lines) > max_lines:
+                        return lines
+                    continue
+            
+            current_line = ""
+            current_width = 0.0
+            
+            for word, units in zip(words, word_units):
+                try:
+                    # 🔥 줄 폭 = 현재 줄 폭 + 공백 + 단어 폭 (글리프 폭 합이므로 단어별 폭으로 누적)
+                    word_width = units * font_size
+                    if current_line:
+                        text_width = current_width + space_width + word_width
+                    else:
+                        text_width = word_width
+                    if text_width <= max_width:
+                        # 들어갈 때만 줄 문자열을 이어 붙임
+                        current_line = current_line + " " + word if current_line else word
+                        current_width = text_width
+                    else:
+                        if current_line:
+                            lines.append(current_line)
+                            if max_lines is not None and len(lines) > max_lines:
+                                return lines
+                        current_line = word
+                        current_width = word_width
+                        
+                        if word_width > max_width:
+                            while current_line and _pdf_string_width(current_line, font_name, font_size) > max_width:
+                                if len(current_line) > 1:
+                                    lines.append(current_line[:-1] + "-")
+                                    current_line = current_line[-1:]
+                                else:
+                                    break
+                            current_width = _pdf_string_width(current_line, font_name, font_size)
+                except:
+                    test_line = current_line + " " + word if current_line else word
+                    if len(test_line) <= 50:
+                        current_line = test_line
+                    else:
+                        if current_line:
+                            lines.append(current_line)
+                        current_line = word
+            
+            if current_line:
+                lines.append(current_line)
+            if max_lines is not None and len(lines) > max_lines:
+                return lines
+        
+        return lines
+        
+    except Exception as e:
+        logger.debug(f"텍스트 줄바꿈 오류: {e}")
+        return [text[i:i+50] for i in range(0, len(text), 50)]
+
+@lru_cache(maxsize=256)
+def _hex_to_rgb(color_hex):
+    """'#RRGGBB' (또는 'RRGGBB') → 0~1 범위 (r, g, b) - 색상 문자열별로 한 번만 파싱 (잘못된 값은 ValueError)"""
+    if color_hex.startswith('#'):
+        color_hex = color_hex[1:]
+    return (int(color_hex[0:2], 16) / 255.0,
+            int(color_hex[2:4], 16) / 255.0,
+            int(color_hex[4:6], 16) / 255.0)
+
+@lru_cache(maxsize=128)
+def _opacity_lut(opacity):
+    """알파 채널 투명도 곱셈용 256 항목 LUT - Image.point 에 넘기면 C 에서 한 번에 적용"""
+    return [int(p * opacity) for p in range(256)]
+
+def _flat_scaled_coords(points, scale_x, scale_y):
+    """(x, y) 점 목록을 스케일링한 평탄 좌표 [x0, y0, x1, y1, ...] - create_line 에 그대로 전달"""
+    if NUMBA_AVAILABLE and len(points) >= 32:
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        scaled = np.empty_like(pts)
+        _scale_points_jit(pts, scale_x, scale_y, scaled)
+        return scaled.ravel().tolist()
+    if NUMPY_AVAILABLE and len(points) >= 32:
+        scaled = np.asarray(points, dtype=np.float64).reshape(-1, 2) * (scale_x, scale_y)
+        return scaled.ravel().tolist()
+    return [c for x, y in points for c in (x * scale_x, y * scale_y)]
+
+def _pdf_points(points, base_x, base_y, scale_x, scale_y, image_height):
+    """이미지 좌표 점 목록 → PDF 좌표 [(x, y), ...] (Y축 뒤집기) - 긴 획은 JIT/NumPy 로 한 번에 변환"""
+    if NUMBA_AVAILABLE and len(points) >= 32:
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        out = np.empty_like(pts)
+        _pdf_points_jit(pts, base_x, base_y, scale_x, scale_y, image_height, out)
+        return out.tolist()
+    if NUMPY_AVAILABLE and len(points) >= 32:
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        out = np.empty_like(pts)
+        out[:, 0] = base_x + pts[:, 0] * scale_x
+        out[:, 1] = base_y + (image_height - pts[:, 1]) * scale_y
+        return out.tolist()
+    return [(base_x + x * scale_x, base_y + (image_height - y) * scale_y) for x, y in points]
+
+def _pen_points_array(annotation):
+    """펜 점 목록의 (N, 2) NumPy 배열 - 점 목록 객체가 바뀔 때만 다시 변환 (저장 시 제외되는 캐시)"""
+    points = annotation.get('points', [])
+    cached = annotation.get('_points_np')
+    if cached and cached[0] is points:
+        return cached[1]
+    
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    annotation['_points_np'] = (points, pts)
+    return pts
+
+def _pen_coords(annotation, scale_x, scale_y):
+    """펜 주석의 화면 평탄 좌표 - 긴 획은 주석에 캐시된 NumPy 배열에서 바로 스케일링"""
+    points = annotation.get('points', [])
+    if NUMPY_AVAILABLE and len(points) >= 32:
+        return _flat_scaled_coords(_pen_points_array(annotation), scale_x, scale_y)
+    return _flat_scaled_coords(points, scale_x, scale_y)
+
+def _pen_bbox(annotation):
+    """펜 주석의 이미지 좌표 영역 (min_x, min_y, max_x, max_y) - 점 목록이 바뀔 때만 다시 계산, 점이 없으면 None
+    
+    id() 는 해제된 목록의 것이 재사용되므로 캐시에 목록 자체를 두고 동일 객체인지 확인한다.
+    """
+    points = annotation.get('points', [])
+    if not points:
+        return None
+    cached = annotation.get('_pts_bbox')
+    if cached and cached[0] is points and cached[1] == len(points):
+        return cached[2]
+    
+    if NUMPY_AVAILABLE and len(points) >= 32:
+        pts = _pen_points_array(annotation)
+        (min_x, min_y), (max_x, max_y) = pts.min(axis=0).tolist(), pts.max(axis=0).tolist()
+    else:
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        min_x, min_y, max_x, max_y = min(xs), min(ys), max(xs), max(ys)
+    annotation['_pts_bbox'] = (points, len(points), (min_x, min_y, max_x, max_y))
+    return min_x, min_y, max_x, max_y
+
+def _item_scale(item, canvas_width, canvas_height):
+    """항목의 캔버스↔이미지 배율 (sx, sy, isx, isy) - 캔버스/이미지 크기가 같으면 캐시 사용
+    
+    sx, sy: 이미지 → 캔버스, isx, isy: 캔버스 → 이미지
+    """
+    image_size = item['image'].size
+    cached = item.get('_scale')
+    if cached and cached[0] == (canvas_width, canvas_height, image_size):
+        return cached[1]
+    
+    img_w, img_h = image_size
+    scales = (canvas_width / img_w, canvas_height / img_h,
+              img_w / canvas_width, img_h / canvas_height)
+    item['_scale'] = ((canvas_width, canvas_height, image_size), scales)
+    return scales
+
+def _annotations_changed(item):
+    """주석 좌표/크기/텍스트를 제자리에서 바꾼 뒤 호출 - 주석 목록 기준 캐시(선택 컬럼, hover 인덱스) 무효화
+    
+    목록 교체(실행 취소/삭제)나 추가/전체 삭제는 목록 객체와 길이로 감지되므로 따로 호출하지 않아도 된다.
+    """
+    item['_ann_version'] = item.get('_ann_version', 0) + 1
+
+def _display_resize(image, size, resample=None):
+    """화면 표시용 리사이즈 (기본 LANCZOS) - 크게 줄일 때는 먼저 정수 배 박스 축소(reduce)로 입력을 줄임
+    
+    reducing_gap=3.0: 목표 크기의 3배 이상이 남도록만 reduce 하므로 화질은 LANCZOS 단독과 구분되지 않는다.
+    연속 줌처럼 곧 다시 그려질 중간 프레임은 resample=BILINEAR 로 호출한다.
+    """
+    if resample is None:
+        resample = Image.Resampling.LANCZOS
+    return image.resize(size, resample, reducing_gap=3.0)
+
+@lru_cache(maxsize=32)
+def _lanczos_coeffs(in_size, out_size, in_extent=None):
+    """Pillow 와 같은 Lanczos-3 가중치 - (출력 위치별 시작 인덱스, 정규화된 가중치 행), 크기 쌍별 한 번만 계산
+    
+    in_extent: 샘플링할 입력 구간 길이 (기본 in_size). reduce 뒤에는 원본 크기 / 배수 인 소수 구간이다.
+    """
+    scale = (in_extent or in_size) / out_size
+    filterscale = max(scale, 1.0)
+    support = 3.0 * filterscale
+    ksize = int(math.ceil(support)) * 2 + 1
+    centers = (np.arange(out_size, dtype=np.float64) + 0.5) * scale
+    starts = np.maximum((centers - support + 0.5).astype(np.int64), 0)
+    stops = np.minimum((centers + support + 0.5).astype(np.int64), in_size)
+    taps = starts[:, None] + np.arange(ksize)[None, :]
+    x = (taps - centers[:, None] + 0.5) / filterscale
+    weights = np.where(np.abs(x) < 3.0, np.sinc(x) * np.sinc(x / 3.0), 0.0)
+    weights[taps >= stops[:, None]] = 0.0
+    weights /= weights.sum(axis=1, keepdims=True)
+    return starts, np.ascontiguousarray(weights, dtype=np.float32)
+
+_numba_resize_lock = threading.Lock()
+
+def _lanczos_resize(image, size, reducing_gap=None):
+    """LANCZOS 축소 - RGB/L 은 Numba 병렬 분리형 커널(가로→세로, 가중치는 크기 쌍별 캐시), 그 외엔 Pillow
+    
+    reducing_gap: Pillow resize 와 같은 의미로, 먼저 정수 배 박스 축소(reduce)를 거친다.
+    Pillow-SIMD 가 설치돼 있으면 SIMD 리샘플링이 더 빠르므로 Pillow 를 그대로 쓴다.
+    """
+    if not NUMBA_AVAILABLE or PILLOW_SIMD or image.mode not in ('RGB', 'L'):
+        return image.resize(size, Image.Resampling.LANCZOS, reducing_gap=reducing_gap)
+    
+    out_w, out_h = size
+    extent_w, extent_h = image.width, image.height
+    if reducing_gap:
+        factor_x = int(image.width / out_w / reducing_gap) or 1
+        factor_y = int(image.height / out_h / reducing_gap) or 1
+        if factor_x > 1 or factor_y > 1:
+            # 🔥 Pillow 처럼 축소된 이미지의 올림 크기가 아니라 원본 구간(원본 크기 / 배수)을 샘플링
+            extent_w, extent_h = image.width / factor_x, image.height / factor_y
+            image = image.reduce((factor_x, factor_y))
+    
+    src = np.asarray(image)
+    if src.ndim == 2:
+        src = src[:, :, None]
+    col_starts, col_weights = _lanczos_coeffs(image.width, out_w, extent_w)
+    row_starts, row_weights = _lanczos_coeffs(image.height, out_h, extent_h)
+    
+    rows = np.empty((src.shape[0], out_w, src.shape[2]), dtype=np.float32)
+    out = np.empty((out_h, out_w, src.shape[2]), dtype=np.uint8)
+    with _numba_resize_lock:  # 기본 workqueue 스레딩 레이어는 병렬 커널 동시 호출을 지원하지 않음
+        _resample_rows_jit(src, col_starts, col_weights, rows)
+        _resample_cols_jit(rows, row_starts, row_weights, out)
+    return Image.fromarray(out[:, :, 0] if image.mode == 'L' else out)
+
+def _item_has_transparency(item):
+    """항목 원본 이미지에 실제로 투명한 픽셀이 있는지 - 이미지 객체가 바뀔 때만 다시 검사"""
+    image = item['image']
+    cached = item.get('_has_alpha')
+    if cached and cached[0] is image:
+        return cached[1]
+    
+    has_alpha = image.mode == 'RGBA' and image.getchannel('A').getextrema()[0] < 255
+    item['_has_alpha'] = (image, has_alpha)
+    return has_alpha
+
+def _composite_on_checker(checker_bg, image):
+    """투명 이미지를 체커보드 위에 얹은 불투명 RGB 이미지
+    
+    배경이 완전히 불투명하므로 출력 알파 계산이 필요 없어, alpha_composite 대신
+    알파 마스크 paste 로 합성한다. checker_bg 는 캐시 공유 이미지라 변환한 복사본에 붙인다.
+    """
+    final_image = checker_bg.convert('RGB')
+    final_image.paste(image, (0, 0), image)
+    return final_image
+
+def _outlined_image(image, outline_width):
+    """흰색 테두리(outline_width 두께)를 두른 RGBA 이미지 생성
+    
+    테두리 띠를 한 번에 채우기 위해 흰색 바탕에 안쪽만 투명하게 비운 뒤
+    원본을 중앙에 붙인다 (겹겹이 사각형을 그리는 것과 같은 결과).
+    """
+    new_size = (image.width + outline_width * 2, image.height + outline_width * 2)
+    outlined_image = Image.new('RGBA', new_size, (255, 255, 255, 255))
+    outlined_image.paste((0, 0, 0, 0), (outline_width, outline_width,
+                                        new_size[0] - outline_width, new_size[1] - outline_width))
+    
+    # 원본 이미지를 중앙에 붙이기 (RGBA 마스크 사용)
+    outlined_image.paste(image, (outline_width, outline_width), image if image.mode == 'RGBA' else None)
+    return outlined_image
+
+# 🔥 hover 격자 셀 크기 (화면 px)
+_HOVER_CELL = 64
+
+def _build_hit_index(annotations, scale_x, scale_y):
+    """드래그 가능한 주석(텍스트/이미지)의 화면 영역 인덱스
+    
+    bboxes: 마진을 포함한 hover/드래그 영역 (텍스트 15, 이미지 5), grid: 셀 → bboxes 인덱스,
+    rects: 마진 없는 실제 영역 (NumPy 가 있으면 (N, 4) 배열), annotations: 같은 순서의 주석.
+    텍스트 크기는 _text_bbox 캐시를 쓰므로 배율이 바뀌면 인덱스만 다시 만들면 된다.
+    """
+    bboxes = []
+    rects = []
+    refs = []
+    grid = {}
+    for annotation in annotations:
+        ann_type = annotation.get('type')
+        if ann_type == 'text':
+            # 텍스트 영역 (anchor='nw' 기준, 크기는 화면 px)
+            x1, y1 = annotation['x'] * scale_x, annotation['y'] * scale_y
+            text_width, text_height = _text_bbox(annotation)
+            x2, y2 = x1 + text_width, y1 + text_height
+            margin = 15
+        elif ann_type == 'image':
+            x1, y1 = annotation['x'] * scale_x, annotation['y'] * scale_y
+            x2, y2 = x1 + annotation['width'] * scale_x, y1 + annotation['height'] * scale_y
+            margin = 5
+        else:
+            continue
+        
+        box = (x1 - margin, y1 - margin, x2 + margin, y2 + margin)
+        
+        # 영역이 걸치는 모든 셀에 등록 → 조회는 마우스가 있는 셀 하나만 확인
+        box_index = len(bboxes)
+        bboxes.append(box)
+        rects.append((x1, y1, x2, y2))
+        refs.append(annotation)
+        for cx in range(int(box[0] // _HOVER_CELL), int(box[2] // _HOVER_CELL) + 1):
+            for cy in range(int(box[1] // _HOVER_CELL), int(box[3] // _HOVER_CELL) + 1):
+                grid.setdefault((cx, cy), []).append(box_index)
+    
+    if NUMPY_AVAILABLE:
+        rects = np.array(rects, dtype=np.float64).reshape(-1, 4)
+    return {'bboxes': bboxes, 'grid': grid, 'rects': rects, 'annotations': refs}
+
+def _hover_hit(index, x, y):
+    """(x, y) 가 드래그 가능한 주석의 hover 영역 안인지 - 마우스가 있는 격자 셀의 후보만 검사"""
+    bboxes = index['bboxes']
+    for box_index in index['grid'].get((x // _HOVER_CELL, y // _HOVER_CELL), ()):
+        x1, y1, x2, y2 = bboxes[box_index]
+        if x1 <= x <= x2 and y1 <= y <= y2:
+            return True
+    return False
+
+def _annotation_at(index, x, y):
+    """(x, y) 위의 첫 번째 텍스트/이미지 주석 (마진 없는 실제 영역, 주석 순서 기준) - 없으면 None"""
+    refs = index['annotations']
+    if not refs:
+        return None
+    
+    rects = index['rects']
+    if NUMPY_AVAILABLE:
+        # 모든 영역을 한 번에 비교하고 주석 순서상 첫 번째 적중 반환
+        hits = (x >= rects[:, 0]) & (x <= rects[:, 2]) & (y >= rects[:, 1]) & (y <= rects[:, 3])
+        return refs[int(np.argmax(hits))] if hits.any() else None
+    
+    for (x1, y1, x2, y2), annotation in zip(rects, refs):
+        if x1 <= x <= x2 and y1 <= y <= y2:
+            return annotation
+    return None
+
+def _set_cursor(canvas, cursor):
+    """캔버스 커서 변경 - 직전 값과 같으면 Tk configure 호출 생략"""
+    if getattr(canvas, '_last_cursor', None) != cursor:
+        canvas.configure(cursor=cursor)
+        canvas._last_cursor = cursor
+
+def _track_canvas_size(canvas):
+    """<Configure> 때마다 캔버스 크기를 canvas._cw / canvas._ch 에 기록 (크기 조회 시 레이아웃 강제 갱신 방지)"""
+    def on_configure(event):
+        canvas._cw, canvas._ch = event.width, event.height
+    canvas.bind('<Configure>', on_configure, add='+')
+
+def _canvas_size(canvas):
+    """캔버스 크기 (너비, 높이) - <Configure> 로 기록된 값 우선, 기록이 없을 때만 update_idletasks 후 조회"""
+    size = getattr(canvas, '_cw', None), getattr(canvas, '_ch', None)
+    if size[0] and size[1]:
+        return size
+    canvas.update_idletasks()
+    return canvas.winfo_width(), canvas.winfo_height()
+
+def _live_canvases(canvases):
+    """등록된 캔버스 중 Tk 위젯이 아직 살아 있는 것만 목록으로 - 파괴된 캔버스는 집합에서 제거"""
+    live = []
+    for canvas in list(canvases):
+        try:
+            alive = canvas.winfo_exists()
+        except tk.TclError:
+            alive = False
+        if alive:
+            live.append(canvas)
+        else:
+            canvases.discard(canvas)
+    return live
+
+# tk::imestatus 지원 여부 (None: 아직 확인 전) - 미지원 Tk 빌드에서 매번 Tcl 오류를 내지 않도록
+_IME_STATUS_SUPPORTED = None
+
+def _enable_ime_status(text_widget):
+    """텍스트 위젯 IME 조합창 활성화 - 첫 시도가 실패하면 이후에는 호출하지 않음"""
+    global _IME_STATUS_SUPPORTED
+    if _IME_STATUS_SUPPORTED is False:
+        return
+    try:
+        text_widget.tk.call('tk::imestatus', text_widget, 'on')
+        _IME_STATUS_SUPPORTED = True
+    except tk.TclError:
+        _IME_STATUS_SUPPORTED = False
+
+def _parse_geometry(geometry):
+    """Tk 'WxH+X+Y' 문자열을 (x, y, w, h) 로 - winfo_x/y/width/height 네 번 대신 winfo_geometry 한 번"""
+    size, _, pos = geometry.partition('+')
+    width, height = (int(v) for v in size.split('x'))
+    x, _, y = pos.partition('+')
+    return int(x), int(y), width, height
+
+def _wait_dialog_closed(window, idle_sleep=0.005):
+    """모달 창이 닫힐 때까지 메인 스레드에서 직접 이벤트 처리 (중첩 mainloop 없이)
+    
+    wait_window 는 창이 사라질 때까지 Tcl 의 tkwait 명령 하나에서 반환하지 않아, 그동안 파이썬 시그널
+    처리(Ctrl+C 등)가 다음 파이썬 콜백까지 미뤄진다. 여기서는 이벤트를 하나씩 처리하고 매번 파이썬으로
+    돌아와 창 존재 여부를 직접 확인한다 (after 콜백은 두 방식 모두 처리됨). 처리할 이벤트가 없을 때만 잠깐 쉰다.
+    """
+    do_one_event = window.tk.dooneevent
+    while True:
+        try:
+            if not window.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        if not do_one_event(_tkinter.DONT_WAIT):
+            time.sleep(idle_sleep)
+
+def _remember_canvas_items(annotation, canvas, *item_ids):
+    """주석이 그려진 캔버스 항목 ID와 그 시점의 위치 기록 (이동 시 항목 재사용용)"""
+    annotation['_canvas_ids'] = (str(canvas), item_ids, annotation.get('x'), annotation.get('y'))
+
+def _annotation_pil(annotation):
+    """이미지 주석의 디코딩된 PIL 이미지 - base64 디코딩은 image_data 당 한 번만
+    
+    annotation['_pil'] = (image_data, PIL 이미지) 로 캐시되며, 반환된 이미지는
+    여러 그리기에서 공유되므로 호출 측에서 직접 수정하지 않는다.
+    """
+    image_data = annotation['image_data']
+    cached = annotation.get('_pil')
+    if cached and cached[0] is image_data:
+        return cached[1]
+    
+    image = Image.open(io.BytesIO(base64.b64decode(image_data)))
+    image.load()
+    annotation['_pil'] = (image_data, image)
+    return image
+
+def _annotation_image_digest(annotation):
+    """이미지 주석 image_data 의 내용 다이제스트 - 같은 견본을 쓰는 주석끼리 같은 값 (image_data 가 바뀔 때만 다시 계산)"""
+    image_data = annotation['image_data']
+    cached = annotation.get('_digest')
+    if cached and cached[0] is image_data:
+        return cached[1]
+    
+    digest = hashlib.blake2b(image_data.encode('ascii'), digest_size=16).digest()
+    annotation['_digest'] = (image_data, digest)
+    return digest
+
+def _draw_pen_form(canvas, annotation, points, rgb, line_width, readability, origin_x, origin_y, scale_x, scale_y):
+    """펜 주석을 Form XObject 로 그림 - 이미지 좌표계 경로를 문서당 한 번만 정의하고 같은 펜은 참조만
+    
+    origin_x/origin_y 는 이미지 좌상단의 PDF 좌표, y 축은 scale(-scale_y) 로 뒤집는다.
+    선 두께는 폼 단위(pt / 배율)로 넣어 출력 두께를 유지하고, 배율/색/두께가 다르면 다른 폼이 된다.
+    """
+    cached = annotation.get('_points_digest')
+    if not cached or cached[0] is not points or cached[1] != len(points):
+        digest = hashlib.blake2b(repr(points).encode('ascii'), digest_size=12).hexdigest()
+        cached = annotation['_points_digest'] = (points, len(points), digest)
+    width_units = line_width / scale_x
+    outline_units = (line_width + 2) / scale_x if readability else 0
+    style = hashlib.blake2b(repr((rgb, width_units, outline_units)).encode('ascii'), digest_size=6).hexdigest()
+    form_name = f"pen_{cached[2]}_{style}"
+    
+    if not canvas.hasForm(form_name):
+        xs = [point[0] for point in points]
+        ys = [point[1] for point in points]
+        pad = max(width_units, outline_units) + 1
+        canvas.beginForm(form_name, min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad)
+        segments = [(points[i][0], points[i][1], points[i + 1][0], points[i + 1][1]) for i in range(len(points) - 1)]
+        # 가독성 모드: 흰색 아웃라인 먼저
+        if readability:
+            canvas.setStrokeColorRGB(1, 1, 1)
+            canvas.setLineWidth(outline_units)
+            for segment in segments:
+                canvas.line(*segment)
+        canvas.setStrokeColorRGB(*rgb)
+        canvas.setLineWidth(width_units)
+        for segment in segments:
+            canvas.line(*segment)
+        canvas.endForm()
+    
+    canvas.saveState()
+    canvas.translate(origin_x, origin_y)
+    canvas.scale(scale_x, -scale_y)
+    canvas.doForm(form_name)
+    canvas.restoreState()
+
+# PDF 이미지 인코딩용 스레드별 BytesIO (페이지/주석마다 새로 만들지 않고 비워서 재사용)
+_pdf_buffers = threading.local()
+
+def _pdf_image_buffer():
+    """비운 상태의 스레드별 재사용 BytesIO - drawImage 는 호출 안에서 버퍼를 다 읽으므로 바로 다시 써도 안전"""
+    buf = getattr(_pdf_buffers, 'buf', None)
+    if buf is None:
+        buf = _pdf_buffers.buf = io.BytesIO()
+    buf.seek(0)
+    buf.truncate(0)
+    return buf
+
+# 🔥 PDF 용으로 변형/인코딩된 주석 이미지 캐시 - (다이제스트, 변형 파라미터...) -> PNG 바이트
+# 내보내기 작업이 끝날 때 (finally) 비운다
+_ANN_IMAGE_CACHE_MAX = 128
+_ann_image_cache = OrderedDict()
+
+def _cached_annotation_png(key, build):
+    """PDF 에 넣을 주석 이미지 PNG 바이트 - 캐시에 없을 때만 build() 가 만든 이미지를 인코딩
+    
+    PDF 안에서 다시 압축되므로 compress_level=1 로 빠르게 무손실 저장한다.
+    """
+    encoded = _ann_image_cache.get(key)
+    if encoded is not None:
+        _ann_image_cache.move_to_end(key)
+        return encoded
+    
+    img_buffer = _pdf_image_buffer()
+    build().save(img_buffer, format='PNG', optimize=False, compress_level=1)
+    encoded = img_buffer.getvalue()
+    _ann_image_cache[key] = encoded
+    if len(_ann_image_cache) > _ANN_IMAGE_CACHE_MAX:
+        _ann_image_cache.popitem(last=False)
+    return encoded
+
+def _orient_steps(image, rotation, flip_horizontal, flip_vertical, flip_first, fillcolor=None):
+    """반전/회전을 한 단계씩 적용 (flip_first: 반전 후 회전, 아니면 회전 후 반전) - _folded_transpose 판별용"""
+    if not flip_first and rotation != 0:
+        image = image.rotate(-rotation, expand=True, fillcolor=fillcolor)
+    if flip_horizontal:
+        image = image.transpose(Image.FLIP_LEFT_RIGHT)
+    if flip_vertical:
+        image = image.transpose(Image.FLIP_TOP_BOTTOM)
+    if flip_first and rotation != 0:
+        image = image.rotate(-rotation, expand=True, fillcolor=fillcolor)
+    return image
+
+@lru_cache(maxsize=64)
+def _folded_transpose(rotation, flip_horizontal, flip_vertical, flip_first):
+    """90° 배수 회전 + 반전 조합과 같은 단일 transpose 연산 (항등이면 None) - 3x2 표본 이미지로 판별"""
+    probe = Image.frombytes('L', (3, 2), bytes(range(6)))
+    expected = _orient_steps(probe, rotation, flip_horizontal, flip_vertical, flip_first)
+    for op in (Image.FLIP_LEFT_RIGHT, Image.FLIP_TOP_BOTTOM, Image.ROTATE_90, Image.ROTATE_180,
+               Image.ROTATE_270, Image.TRANSPOSE, Image.TRANSVERSE):
+        candidate = probe.transpose(op)
+        if candidate.size == expected.size and candidate.tobytes() == expected.tobytes():
+            return op
+    return None
+
+def _oriented_image(image, rotation, flip_horizontal=False, flip_vertical=False, flip_first=True, fillcolor=None):
+    """반전 + rotate(-rotation, expand=True) 조합을 중간 이미지 없이 한 번의 변환으로 처리
+    
+    90° 배수는 단일 transpose, 그 외 각도는 반전을 회전 행렬에 합친 AFFINE 변환 한 번
+    (rotate 기본값과 같은 NEAREST 샘플링). 변형이 없으면 입력 이미지를 그대로 돌려준다.
+    """
+    rotation = rotation % 360
+    if rotation % 90 == 0:
+        op = _folded_transpose(rotation, bool(flip_horizontal), bool(flip_vertical), flip_first)
+        return image if op is None else image.transpose(op)
+    
+    # Image.rotate 와 같은 역변환 행렬 (출력 좌표 → 입력 좌표, 중심 기준 + expand 보정)
+    angle = math.radians(rotation)
+    cos_a, sin_a = round(math.cos(angle), 15), round(math.sin(angle), 15)
+    a, b, d, e = cos_a, sin_a, -sin_a, cos_a
+    w, h = image.size
+    cx, cy = w / 2, h / 2
+    c = -a * cx - b * cy + cx
+    f = -d * cx - e * cy + cy
+    corners = ((0, 0), (w, 0), (w, h), (0, h))
+    xs = [a * x + b * y + c for x, y in corners]
+    ys = [d * x + e * y + f for x, y in corners]
+    nw = math.ceil(max(xs)) - math.floor(min(xs))
+    nh = math.ceil(max(ys)) - math.floor(min(ys))
+    tx, ty = -(nw - w) / 2.0, -(nh - h) / 2.0
+    c, f = a * tx + b * ty + c, d * tx + e * ty + f
+    
+    # 반전을 행렬에 합성 (입력 좌표계 반전 = 회전 전, 출력 좌표계 반전 = 회전 후)
+    if flip_first:
+        if flip_horizontal:
+            a, b, c = -a, -b, w - c
+        if flip_vertical:
+            d, e, f = -d, -e, h - f
+    else:
+        if flip_horizontal:
+            c, f = c + a * nw, f + d * nw
+            a, d = -a, -d
+        if flip_vertical:
+            c, f = c + b * nh, f + e * nh
+            b, e = -b, -e
+    
+    return image.transform((nw, nh), Image.Transform.AFFINE, (a, b, c, d, e, f),
+                           Image.Resampling.NEAREST, fillcolor=fillcolor)
+
 # GitHub 업데이트 확인을 위한 모듈
 try:
     import urllib.request
@@ -3883,70 +4744,70 @@ def setup_logging():
 
 # 🔥 [중복 제거됨] 두 번째 시스템 정보 출력 블록 - 상단으로 통합됨
 
+# 화살표 날개 각도 상수 (cos/sin 호출 대신 회전 공식에 사용)
+_ARROW_SHARP_COS, _ARROW_SHARP_SIN = math.cos(math.pi / 8), math.sin(math.pi / 8)    # 22.5도
+_ARROW_NORMAL_COS, _ARROW_NORMAL_SIN = math.cos(math.pi / 6), math.sin(math.pi / 6)  # 30도
+
+def _arrow_head_shape(dx, dy, width):
+    """화살표 머리 (끝점 기준 돌출 오프셋 x/y, Tk arrowshape) - 삼각함수 없이 계산"""
+    arrow_length = math.hypot(dx, dy)
+    
+    # 🔥 동적 화살표 크기 계산
+    # 선 두께에 비례하여 화살표 크기 조정
+    base_arrow_size = max(8, width * 2.5)  # 최소 8픽셀, 선 두께의 2.5배
+    
+    # 화살표 길이에 따라 크기 제한 (화살표 길이의 30%까지만)
+    arrow_size = min(base_arrow_size, arrow_length * 0.3)
+    
+    # 🔥 최소 크기 보장 (너무 작으면 삼각형이 안 보임)
+    arrow_size = max(arrow_size, 6)
+    
+    # 화살표가 너무 작은 경우 각도를 더 날카롭게
+    if arrow_size < 12:
+        cos_o, sin_o = _ARROW_SHARP_COS, _ARROW_SHARP_SIN
+    else:
+        cos_o, sin_o = _ARROW_NORMAL_COS, _ARROW_NORMAL_SIN
+    
+    # 방향 단위 벡터 = (cos(angle), sin(angle))
+    ux, uy = dx / arrow_length, dy / arrow_length
+    
+    # 앞으로 돌출된 끝점
+    extend_distance = arrow_size * 0.15
+    
+    # Tk arrowshape (d1, d2, d3): 끝점 → 날개까지 선 방향 거리, 날개의 선 바깥쪽 가장자리로부터 거리
+    # d1 == d2 이면 기저부가 평평한 삼각형 (기존 polygon 과 같은 모양)
+    wing_distance = extend_distance + arrow_size * cos_o
+    wing_spread = max(arrow_size * sin_o - width / 2, 0)
+    return extend_distance * ux, extend_distance * uy, (wing_distance, wing_distance, wing_spread)
+
 # 🔥 개선된 화살표 그리기 함수
-def create_improved_arrow(canvas, x1, y1, x2, y2, color, width, tags='annotation'):
-    """개선된 화살표 그리기 - 선 두께와 길이에 따라 적절한 삼각형 생성"""
+def create_improved_arrow(canvas, x1, y1, x2, y2, color, width, tags='annotation', annotation=None):
+    """개선된 화살표 그리기 - 선 두께와 길이에 따라 적절한 삼각형 생성
+    
+    annotation 이 주어지면 머리 모양을 annotation['_head'] 에 캐시하여
+    방향/길이/두께가 같은 다음 그리기에서 재계산을 생략한다.
+    머리 삼각형은 Tk 의 arrow='last' 로 그려 선과 함께 한 번의 create_line 으로 끝난다.
+    """
     try:
-        # 화살표 길이 계산
-        arrow_length = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-        
-        # 🔥 동적 화살표 크기 계산
-        # 선 두께에 비례하여 화살표 크기 조정
-        base_arrow_size = max(8, width * 2.5)  # 최소 8픽셀, 선 두께의 2.5배
-        
-        # 화살표 길이에 따라 크기 제한
-        if arrow_length > 0:
-            max_arrow_size = arrow_length * 0.3  # 화살표 길이의 30%까지만
-            arrow_size = min(base_arrow_size, max_arrow_size)
-        else:
-            arrow_size = base_arrow_size
-            
-        # 🔥 최소 크기 보장 (너무 작으면 삼각형이 안 보임)
-        arrow_size = max(arrow_size, 6)
-        
-        # 화살표가 너무 작은 경우 각도를 더 날카롭게
-        if arrow_size < 12:
-            angle_offset = math.pi / 8  # 22.5도 (더 날카로운 화살표)
-        else:
-            angle_offset = math.pi / 6   # 30도 (일반적인 화살표)
-        
-        # 화살표 방향 계산
-        if arrow_length > 0:
-            angle = math.atan2(y2 - y1, x2 - x1)
-            
-            # 🔥 삼각형이 라인보다 앞으로 돌출되도록 계산
-            # 삼각형의 기저부 위치 계산 (라인은 여기까지만)
-            base_distance = arrow_size * 0.7  # 삼각형 기저부까지의 거리
-            base_x = x2 - base_distance * math.cos(angle)
-            base_y = y2 - base_distance * math.sin(angle)
-            
-            # 화살표 라인을 삼각형 기저부까지만 그리기
-            canvas.create_line(x1, y1, base_x, base_y, fill=color, width=width, tags=tags)
-            
-            # 🔥 삼각형 끝점을 더 앞으로 돌출시키기
-            extend_distance = arrow_size * 0.15  # 추가 돌출 거리
-            tip_x = x2 + extend_distance * math.cos(angle)
-            tip_y = y2 + extend_distance * math.sin(angle)
-            
-            # 화살표 날개 좌표 계산 (원래 끝점 기준)
-            wing1_x = x2 - arrow_size * math.cos(angle - angle_offset)
-            wing1_y = y2 - arrow_size * math.sin(angle - angle_offset)
-            
-            wing2_x = x2 - arrow_size * math.cos(angle + angle_offset)
-            wing2_y = y2 - arrow_size * math.sin(angle + angle_offset)
-            
-            # 🔥 뾰족하고 돌출된 삼각형 그리기
-            canvas.create_polygon(
-                tip_x, tip_y,      # 더 앞으로 돌출된 끝점
-                wing1_x, wing1_y,  # 왼쪽 날개
-                wing2_x, wing2_y,  # 오른쪽 날개
-                fill=color, 
-                outline=color,
-                width=1,
+        dx, dy = x2 - x1, y2 - y1
+        if dx or dy:
+            key = (dx, dy, width)
+            cached = annotation.get('_head') if annotation is not None else None
+            if cached and cached[0] == key:
+                head = cached[1]
+            else:
+                head = _arrow_head_shape(dx, dy, width)
+                if annotation is not None:
+                    annotation['_head'] = (key, head)
+            tip_dx, tip_dy, arrowshape = head
+            
+            # 🔥 라인 + 뾰족하고 돌출된 삼각형 머리를 한 번에 그리기
+            canvas.create_line(
+                x1, y1, x2 + tip_dx, y2 + tip_dy,
+                fill=color, width=width,
+                arrow='last', arrowshape=arrowshape,
                 tags=tags
             )
-            
-            logger.debug(f"화살표 생성: 길이={arrow_length:.1f}, 크기={arrow_size:.1f}, 두께={width}")
         
     except Exception as e:
         logger.error(f"개선된 화살표 그리기 오류: {e}")
@@ -4175,9 +5036,7 @@ class OptimizedFontManager:
         font_name = 'Helvetica'
         try:
             if self.korean_font_path and os.path.exists(self.korean_font_path):
-                pdfmetrics.registerFont(TTFont('Korean', self.korean_font_path))
-                font_name = 'Korean'
-                logger.info("✓ PDF 한글 폰트 등록 성공")
+                font_name = _register_korean_pdf_font(self.korean_font_path)
         except Exception as e:
             logger.warning(f"PDF 한글 폰트 등록 실패: {e}")
         
@@ -4201,13 +5060,14 @@ class AsyncTaskManager:
                     if task:
                         result = task['func'](*task['args'], **task['kwargs'])
                         if task['callback']:
-                            self.root.after(0, lambda: task['callback'](result))
+                            # 콜백은 메인 스레드에서 (값을 바로 묶어 다음 작업이 덮어쓰지 않게)
+                            self.root.after(0, task['callback'], result)
                 except queue.Empty:
                     continue
                 except Exception as e:
                     logger.error(f"비동기 작업 오류: {e}")
                     if task.get('error_callback'):
-                        self.root.after(0, lambda: task['error_callback'](e))
+                        self.root.after(0, task['error_callback'], e)
         
         threading.Thread(target=worker, daemon=True).start()
     
@@ -4645,35 +5505,35 @@ class HighQualityPDFGenerator:
             if not item.get('annotations'):
                 return
             
+            image_height = item['image'].height
             scale_x = img_width / item['image'].width
-            scale_y = img_height / item['image'].height
+            scale_y = img_height / image_height
+            # 🔥 선 두께 스케일 팩터는 페이지 단위로 한 번만 계산 (원본 크기에 가깝게 기존 스케일의 70%)
+            scale_factor = min(scale_x, scale_y) * 0.7
+            # 🔥 직전 주석과 색/두께가 같으면 캔버스 상태를 다시 쓰지 않음 (텍스트/이미지 주석은 상태를 바꾸므로 무효화)
+            current_style = None
             
             for annotation in item['annotations']:
                 try:
                     ann_type = annotation['type']
-                    color_hex = annotation.get('color', '#ff0000')
-                    
-                    if color_hex.startswith('#'):
-                        color_hex = color_hex[1:]
-                    r = int(color_hex[0:2], 16) / 255.0
-                    g = int(color_hex[2:4], 16) / 255.0
-                    b = int(color_hex[4:6], 16) / 255.0
-                    
-                    canvas.setStrokeColorRGB(r, g, b)
-                    canvas.setFillColorRGB(r, g, b)
+                    r, g, b = _hex_to_rgb(annotation.get('color', '#ff0000'))
                     
                     # 🔥 선 두께 스케일링 조정 - 원본에 더 가깝게
                     base_width = annotation.get('width', 2)
-                    # 스케일 팩터를 줄여서 원본 크기에 더 가깝게 유지
-                    scale_factor = min(scale_x, scale_y) * 0.7  # 기존 스케일의 70%로 조정
                     line_width = max(1.0, base_width * scale_factor)  # 최소 두께 증가
-                    canvas.setLineWidth(line_width)
+                    
+                    style = (r, g, b, line_width)
+                    if style != current_style:
+                        canvas.setStrokeColorRGB(r, g, b)
+                        canvas.setFillColorRGB(r, g, b)
+                        canvas.setLineWidth(line_width)
+                        current_style = style
                     
                     if ann_type == 'arrow':
                         x1 = img_x + annotation['start_x'] * scale_x
-                        y1 = img_y + (item['image'].height - annotation['start_y']) * scale_y
+                        y1 = img_y + (image_height - annotation['start_y']) * scale_y
                         x2 = img_x + annotation['end_x'] * scale_x
-                        y2 = img_y + (item['image'].height - annotation['end_y']) * scale_y
+                        y2 = img_y + (image_height - annotation['end_y']) * scale_y
                         
                         # 가독성 모드: 흰색 아웃라인
                         if self.pdf_readability_mode:
@@ -4751,9 +5611,9 @@ class HighQualityPDFGenerator:
                     elif ann_type == 'line':
                         # 라인 그리기 (화살표 머리 없는 단순한 선)
                         x1 = img_x + annotation['start_x'] * scale_x
-                        y1 = img_y + (item['image'].height - annotation['start_y']) * scale_y
+                        y1 = img_y + (image_height - annotation['start_y']) * scale_y
                         x2 = img_x + annotation['end_x'] * scale_x
-                        y2 = img_y + (item['image'].height - annotation['end_y']) * scale_y
+                        y2 = img_y + (image_height - annotation['end_y']) * scale_y
                         
                         # 가독성 모드: 흰색 아웃라인
                         if self.pdf_readability_mode:
@@ -4768,16 +5628,20 @@ class HighQualityPDFGenerator:
                     
                     elif ann_type == 'pen':
                         points = annotation.get('points', [])
-                        if len(points) > 1:
+                        if len(points) > 1 and abs(scale_x - scale_y) <= scale_x * 0.01:
+                            # 🔥 가로/세로 배율이 같으면 펜 경로를 Form XObject 로 한 번만 정의하고 이후엔 참조만
+                            _draw_pen_form(canvas, annotation, points, (r, g, b), line_width, self.pdf_readability_mode,
+                                           img_x, img_y + image_height * scale_y, scale_x, scale_y)
+                        elif len(points) > 1:
                             # 가독성 모드: 흰색 아웃라인
                             if self.pdf_readability_mode:
                                 canvas.setStrokeColorRGB(1, 1, 1)  # 흰색
                                 canvas.setLineWidth(line_width + 2)
                                 for i in range(len(points) - 1):
                                     x1 = img_x + points[i][0] * scale_x
-                                    y1 = img_y + (item['image'].height - points[i][1]) * scale_y
+                                    y1 = img_y + (image_height - points[i][1]) * scale_y
                                     x2 = img_x + points[i+1][0] * scale_x
-                                    y2 = img_y + (item['image'].height - points[i+1][1]) * scale_y
+                                    y2 = img_y + (image_height - points[i+1][1]) * scale_y
                                     canvas.line(x1, y1, x2, y2)
                                 # 원래 색상으로 다시 설정
                                 canvas.setStrokeColorRGB(r, g, b)
@@ -4786,16 +5650,16 @@ class HighQualityPDFGenerator:
                             # 원래 색상으로 그리기
                             for i in range(len(points) - 1):
                                 x1 = img_x + points[i][0] * scale_x
-                                y1 = img_y + (item['image'].height - points[i][1]) * scale_y
+                                y1 = img_y + (image_height - points[i][1]) * scale_y
                                 x2 = img_x + points[i+1][0] * scale_x
-                                y2 = img_y + (item['image'].height - points[i+1][1]) * scale_y
+                                y2 = img_y + (image_height - points[i+1][1]) * scale_y
                                 canvas.line(x1, y1, x2, y2)
                     
                     elif ann_type == 'oval':
                         x1 = img_x + annotation['x1'] * scale_x
-                        y1 = img_y + (item['image'].height - annotation['y1']) * scale_y
+                        y1 = img_y + (image_height - annotation['y1']) * scale_y
                         x2 = img_x + annotation['x2'] * scale_x
-                        y2 = img_y + (item['image'].height - annotation['y2']) * scale_y
+                        y2 = img_y + (image_height - annotation['y2']) * scale_y
                         
                         center_x = (x1 + x2) / 2
                         center_y = (y1 + y2) / 2
@@ -4819,9 +5683,9 @@ class HighQualityPDFGenerator:
                     
                     elif ann_type == 'rect':
                         x1 = img_x + annotation['x1'] * scale_x
-                        y1 = img_y + (item['image'].height - annotation['y1']) * scale_y
+                        y1 = img_y + (image_height - annotation['y1']) * scale_y
                         x2 = img_x + annotation['x2'] * scale_x
-                        y2 = img_y + (item['image'].height - annotation['y2']) * scale_y
+                        y2 = img_y + (image_height - annotation['y2']) * scale_y
                         
                         # 가독성 모드: 흰색 아웃라인
                         if self.pdf_readability_mode:
@@ -4839,17 +5703,18 @@ class HighQualityPDFGenerator:
                                    stroke=1, fill=0)
                     
                     elif ann_type == 'text':
+                        current_style = None
                         # 🔥 텍스트 주석 좌표와 크기 정확히 맞추기
                         x = img_x + annotation['x'] * scale_x
                         # PDF 좌표계에서 y축은 하단부터 시작하므로 올바른 계산
-                        y = img_y + (item['image'].height - annotation['y']) * scale_y
+                        y = img_y + (image_height - annotation['y']) * scale_y
                         text = annotation.get('text', '')
                         
                         # 🔥 PDF에서 텍스트 크기를 이미지 스케일에 맞춰 조정
                         base_font_size = annotation.get('font_size', 12)
                         # 이미지 스케일링에 맞춰 텍스트 크기도 조정 (약간 확대)
-                        scale_factor = min(scale_x, scale_y)  # 작은 스케일 사용하여 비율 유지
-                        pdf_font_size = max(10, int(base_font_size * scale_factor * 1.15))  # 15% 확대, 최소 10px 보장
+                        text_scale = min(scale_x, scale_y)  # 작은 스케일 사용하여 비율 유지 (선 두께용 scale_factor 는 그대로 둠)
+                        pdf_font_size = max(10, int(base_font_size * text_scale * 1.15))  # 15% 확대, 최소 10px 보장
                         
                         # 🔥 볼드 텍스트 지원 추가
                         is_bold = annotation.get('bold', False)
@@ -4887,16 +5752,16 @@ class HighQualityPDFGenerator:
                             canvas.drawString(x, y - pdf_font_size, text)
                     
                     elif ann_type == 'image':
+                        current_style = None
                         try:
                             # 이미지 주석 좌표 계산 (PDF 좌표계 고려)
                             x = img_x + annotation['x'] * scale_x
-                            y = img_y + (item['image'].height - annotation['y']) * scale_y
+                            y = img_y + (image_height - annotation['y']) * scale_y
                             width = annotation['width'] * scale_x
                             height = annotation['height'] * scale_y
                             
-                            # base64 이미지 디코딩
-                            image_data = base64.b64decode(annotation['image_data'])
-                            img = Image.open(io.BytesIO(image_data))
+                            # base64 이미지 디코딩 (주석별 캐시 - 공유 이미지이므로 직접 수정하지 않음)
+                            img = _annotation_pil(annotation)
                             
                             # 🔥 고해상도 처리를 위한 DPI 스케일링 계산
                             # PDF는 300 DPI가 표준이므로 고품질을 위해 2-3배 크기로 처리
@@ -4915,85 +5780,77 @@ class HighQualityPDFGenerator:
                                     high_res_height = min_size
                                     high_res_width = int(min_size * aspect_ratio)
                             
-                            # 변형 적용 (고해상도로 처리하기 전에)
-                            if annotation.get('flip_horizontal', False):
-                                img = img.transpose(Image.FLIP_LEFT_RIGHT)
-                            if annotation.get('flip_vertical', False):
-                                img = img.transpose(Image.FLIP_TOP_BOTTOM)
-                            
+                            flip_horizontal = annotation.get('flip_horizontal', False)
+                            flip_vertical = annotation.get('flip_vertical', False)
                             rotation = annotation.get('rotation', 0)
-                            if rotation != 0:
-                                img = img.rotate(-rotation, expand=True)
-                            
-                            # 🔥 고품질 리샘플링으로 크기 조정
-                            img = img.resize((int(high_res_width), int(high_res_height)), Image.Resampling.LANCZOS)
-                            
-                            # 투명도 처리
                             opacity = annotation.get('opacity', 100) / 100.0
-                            if opacity < 1.0 and img.mode == 'RGBA':
-                                alpha = img.split()[-1]
-                                alpha = alpha.point(lambda p: p * opacity)
-                                img.putalpha(alpha)
-                            
-                            # 아웃라인 처리 (고해상도에 맞춰 스케일링)
+                            outline_width = 0
                             if annotation.get('outline', False):
-                                outline_width = int(annotation.get('outline_width', 3) * quality_multiplier)
-                                outline_width = max(2, outline_width)  # 최소 두께 보장
-                                new_size = (img.width + outline_width * 2, 
-                                           img.height + outline_width * 2)
-                                outlined_image = Image.new('RGBA', new_size, (0, 0, 0, 0))
+                                # 아웃라인 두께 (고해상도에 맞춰 스케일링, 최소 두께 보장)
+                                outline_width = max(2, int(annotation.get('outline_width', 3) * quality_multiplier))
+                            
+                            def build_pdf_image(img=img):
+                                """변형/투명도/아웃라인을 적용해 흰 배경에 합성한 RGB 이미지"""
+                                # 변형 적용 (고해상도로 처리하기 전에 - 반전 + 회전을 한 번의 변환으로)
+                                img = _oriented_image(img, rotation, flip_horizontal, flip_vertical)
                                 
-                                # 🔥 더 부드러운 아웃라인 그리기 (안티앨리어싱 효과)
-                                for dx in range(-outline_width, outline_width + 1):
-                                    for dy in range(-outline_width, outline_width + 1):
-                                        distance = math.sqrt(dx*dx + dy*dy)
-                                        if distance <= outline_width:
-                                            # 거리에 따른 알파값 조정으로 부드러운 아웃라인
-                                            alpha_factor = 1.0 - (distance / outline_width) * 0.3
-                                            alpha_factor = max(0.7, min(1.0, alpha_factor))
-                                            outline_color = (255, 255, 255, int(255 * alpha_factor))
-                                            outlined_image.paste(outline_color, 
-                                                               (outline_width + dx, outline_width + dy),
-                                                               img)
+                                # 🔥 고품질 리샘플링으로 크기 조정
+                                img = img.resize((int(high_res_width), int(high_res_height)), Image.Resampling.LANCZOS)
                                 
-                                # 원본 이미지 중앙에 붙이기
-                                outlined_image.paste(img, (outline_width, outline_width), img if img.mode == 'RGBA' else None)
-                                img = outlined_image
-                                # 좌표 조정은 실제 출력 크기 기준으로
-                                x -= (outline_width * width / high_res_width)
-                                y -= (outline_width * height / high_res_height)
-                            
-                            # 🔥 고품질 임시 파일로 이미지 저장 후 PDF에 그리기
-                            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                                # RGB 모드로 변환 (PDF 호환성)
+                                # 투명도 처리
+                                if opacity < 1.0 and img.mode == 'RGBA':
+                                    alpha = img.split()[-1]
+                                    alpha = alpha.point(_opacity_lut(opacity))
+                                    img.putalpha(alpha)
+                                
+                                # 아웃라인 처리
+                                if outline_width:
+                                    new_size = (img.width + outline_width * 2, 
+                                               img.height + outline_width * 2)
+                                    outlined_image = Image.new('RGBA', new_size, (0, 0, 0, 0))
+                                    
+                                    # 🔥 더 부드러운 아웃라인 그리기 (안티앨리어싱 효과)
+                                    for dx in range(-outline_width, outline_width + 1):
+                                        for dy in range(-outline_width, outline_width + 1):
+                                            distance = math.sqrt(dx*dx + dy*dy)
+                                            if distance <= outline_width:
+                                                # 거리에 따른 알파값 조정으로 부드러운 아웃라인
+                                                alpha_factor = 1.0 - (distance / outline_width) * 0.3
+                                                alpha_factor = max(0.7, min(1.0, alpha_factor))
+                                                outline_color = (255, 255, 255, int(255 * alpha_factor))
+                                                outlined_image.paste(outline_color, 
+                                                                   (outline_width + dx, outline_width + dy),
+                                                                   img)
+                                    
+                                    # 원본 이미지 중앙에 붙이기
+                                    outlined_image.paste(img, (outline_width, outline_width), img if img.mode == 'RGBA' else None)
+                                    img = outlined_image
+                                
+                                # RGB 모드로 변환 (PDF 호환성) - 투명한 배경을 흰색으로 알파 블렌딩
                                 if img.mode == 'RGBA':
-                                    # 투명한 배경을 흰색으로 변환 (고품질 알파 블렌딩)
                                     rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                                    if opacity < 1.0:
-                                        # 투명도가 있는 경우 고품질 알파 블렌딩
-                                        rgb_img.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                                    else:
-                                        rgb_img.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+                                    rgb_img.paste(img, mask=img.split()[-1])
                                     img = rgb_img
                                 elif img.mode != 'RGB':
                                     img = img.convert('RGB')
-                                
-                                # 🔥 최고 품질로 저장 (압축 없음, 최적화 없음)
-                                img.save(tmp_file.name, format='PNG', 
-                                        optimize=False, compress_level=0, 
-                                        pnginfo=None)  # 메타데이터 제거로 용량 최적화
-                                
-                                # PDF 좌표계에 맞춰 y 위치 조정
-                                pdf_y = y - height
-                                
-                                # 🔥 고해상도 이미지를 원하는 크기로 출력 (품질 유지)
-                                canvas.drawImage(tmp_file.name, x, pdf_y, width, height, 
-                                               preserveAspectRatio=True, anchor='sw')
-                                
-                                try:
-                                    os.unlink(tmp_file.name)
-                                except:
-                                    pass
+                                return img
+                            
+                            # 🔥 같은 견본/변형은 한 번만 인코딩 (임시 파일 없이 메모리에서 PDF 로)
+                            cache_key = (_annotation_image_digest(annotation), flip_horizontal, flip_vertical, rotation,
+                                         int(high_res_width), int(high_res_height), opacity, outline_width)
+                            encoded = _cached_annotation_png(cache_key, build_pdf_image)
+                            
+                            if outline_width:
+                                # 좌표 조정은 실제 출력 크기 기준으로
+                                x -= (outline_width * width / high_res_width)
+                                y -= (outline_width * height / high_res_height)
+                            
+                            # PDF 좌표계에 맞춰 y 위치 조정
+                            pdf_y = y - height
+                            
+                            # 🔥 고해상도 이미지를 원하는 크기로 출력 (품질 유지)
+                            canvas.drawImage(ImageReader(io.BytesIO(encoded)), x, pdf_y, width, height, 
+                                           preserveAspectRatio=True, anchor='sw')
                         
                         except Exception as e:
                             logger.debug(f"PDF 이미지 주석 그리기 오류: {e}")
@@ -5008,7 +5865,7 @@ class HighQualityPDFGenerator:
     def _fallback_pdf_page(self, canvas, item, index, page_width, page_height):
         """폴백 PDF 페이지 생성 - 하단 여백 축소"""
         try:
-            combined_image = self.create_high_quality_combined_image(item)
+            combined_image = _take_combined_image(self, item)
             
             margin = 50
             max_width = page_width - (margin * 2)
@@ -5031,7 +5888,7 @@ class HighQualityPDFGenerator:
                 combined_image = combined_image.resize((int(new_width), int(new_height)), 
                                                      Image.Resampling.LANCZOS)
             
-            img_buffer = io.BytesIO()
+            img_buffer = _pdf_image_buffer()
             combined_image.save(img_buffer, format='PNG', optimize=False)
             img_buffer.seek(0)
             
@@ -5144,61 +6001,15 @@ class HighQualityPDFGenerator:
         except Exception as e:
             logger.error(f"PDF 텍스트 추가 오류: {e}")
     
-    def _wrap_text_for_pdf(self, text, max_width, font_name, font_size, canvas):
-        """PDF용 텍스트 줄바꿈"""
+    def _wrap_text_for_pdf(self, text, max_width, font_name, font_size, canvas, max_lines=None):
+        """PDF용 텍스트 줄바꿈 (캔버스 인자는 호환용 - _wrap_pdf_text 참고)"""
+        return _wrap_pdf_text(text, max_width, font_name, font_size, max_lines)
+
+    def create_high_quality_combined_image_transparent(self, canvas, item, index, page_width, page_height):
+        """투명도를 지원하는 합성 이미지 생성"""
         try:
-            lines = []
-            paragraphs = text.split('\n')
-            
-            for paragraph in paragraphs:
-                if not paragraph.strip():
-                    lines.append("")
-                    continue
-                
-                words = paragraph.split()
-                current_line = ""
-                
-                for word in words:
-                    test_line = current_line + " " + word if current_line else word
-                    
-                    try:
-                        text_width = canvas.stringWidth(test_line, font_name, font_size)
-                        if text_width <= max_width:
-                            current_line = test_line
-                        else:
-                            if current_line:
-                                lines.append(current_line)
-                            current_line = word
-                            
-                            if canvas.stringWidth(current_line, font_name, font_size) > max_width:
-                                while current_line and canvas.stringWidth(current_line, font_name, font_size) > max_width:
-                                    if len(current_line) > 1:
-                                        lines.append(current_line[:-1] + "-")
-                                        current_line = current_line[-1:]
-                                    else:
-                                        break
-                    except:
-                        if len(test_line) <= 50:
-                            current_line = test_line
-                        else:
-                            if current_line:
-                                lines.append(current_line)
-                            current_line = word
-                
-                if current_line:
-                    lines.append(current_line)
-            
-            return lines
-            
-        except Exception as e:
-            logger.debug(f"텍스트 줄바꿈 오류: {e}")
-            return [text[i:i+50] for i in range(0, len(text), 50)]
-
-    def create_high_quality_combined_image_transparent(self, canvas, item, index, page_width, page_height):
-        """투명도를 지원하는 합성 이미지 생성"""
-        try:
-            # 투명도를 완벽히 지원하는 합성 이미지 생성
-            combined_image = self.create_high_quality_combined_image_with_transparency(item)
+            # 투명도를 완벽히 지원하는 합성 이미지 생성
+            combined_image = self.create_high_quality_combined_image_with_transparency(item)
             
             # PDF에 추가
             margin = 50
@@ -5220,7 +6031,7 @@ class HighQualityPDFGenerator:
                 new_width = max_height * img_ratio
             
             # 투명도를 유지한 채로 PNG 저장
-            img_buffer = io.BytesIO()
+            img_buffer = _pdf_image_buffer()
             if combined_image.mode == 'RGBA':
                 combined_image.save(img_buffer, format='PNG', optimize=False)
             else:
@@ -5318,7 +6129,7 @@ class HighQualityPDFGenerator:
                 # 🔥 중요: 기존 알파 채널에 투명도 곱하기 (흰색 배경과 합성 안함!)
                 r, g, b, a = img.split()
                 # 알파 채널에 투명도 곱하기
-                new_alpha = a.point(lambda p: int(p * opacity))
+                new_alpha = a.point(_opacity_lut(opacity))
                 img = Image.merge('RGBA', (r, g, b, new_alpha))
                 
                 logger.info(f"✅ 투명도 {opacity*100:.1f}% 적용 완료 (RGBA 모드 유지)")
@@ -6475,6 +7286,20 @@ class SmartCanvasViewer:
         
         # 팬 기능 비활성화
         
+        # 드래그 중 예약된 주석 다시 그리기 (after_idle ID)
+        self._redraw_after_id = None
+        
+        # 예약된 hover 검사 (after_idle ID) 와 마지막 마우스 좌표
+        self._hover_after_id = None
+        self._hover_pos = (0, 0)
+        
+        # hover/더블클릭 화면 영역 인덱스 (주석 목록, (길이, 변경 버전, 배율), 인덱스)
+        self._hit_index_cache = None
+        
+        # 연속 줌 중에는 빠른 리샘플링, 멈추면 고품질로 다시 그리기 (after ID / 중간 프레임 여부)
+        self._zoom_settle_id = None
+        self._zoom_fast = False
+        
         # 캔버스 크기 계산
         self.setup_canvas_size()
         self.create_viewer()
@@ -6644,10 +7469,12 @@ class SmartCanvasViewer:
         # 이벤트 바인딩
         self.bind_events()
         
-        # 활성 캔버스 목록에 추가
+        # 활성 캔버스 목록에 추가 (파괴된 캔버스는 자동으로 빠지는 약한 참조 집합)
+        # 위젯은 파괴됐지만 파이썬 객체가 남아 있는 캔버스는 등록할 때 함께 정리
         if not hasattr(self.app, 'active_canvases'):
-            self.app.active_canvases = []
-        self.app.active_canvases.append(self.canvas)
+            self.app.active_canvases = weakref.WeakSet()
+        _live_canvases(self.app.active_canvases)
+        self.app.active_canvases.add(self.canvas)
         
     def load_and_display_image(self):
         """이미지 로드 및 표시 - 원본 해상도 유지"""
@@ -6661,7 +7488,7 @@ class SmartCanvasViewer:
             self.photo = self.app.image_cache[cache_key]
             logger.debug(f"이미지 캐시 히트: {cache_key}")
         else:
-            display_image = self.item['image'].copy()
+            display_image = self.item['image']
             
             # 🔥 display_ratio가 1.0인 경우 원본 크기 유지, 아닌 경우만 리사이즈
             if abs(self.display_ratio - 1.0) < 0.001:  # 거의 1.0인 경우 (부동소수점 오차 고려)
@@ -6670,14 +7497,17 @@ class SmartCanvasViewer:
                 # 리사이즈 없이 그대로 사용
             else:
                 # 캔버스 크기에 맞게 리사이즈
-                display_image = display_image.resize((self.canvas_width, self.canvas_height), 
-                                                    Image.Resampling.LANCZOS)
+                display_image = _display_resize(display_image, (self.canvas_width, self.canvas_height))
                 logger.info(f"이미지 리사이즈: {orig_width}x{orig_height} → {self.canvas_width}x{self.canvas_height} (비율: {self.display_ratio:.3f})")
             
+            # 불투명한 RGBA 는 체커보드 합성 없이 RGB 로 표시
+            if display_image.mode == 'RGBA' and not _item_has_transparency(self.item):
+                display_image = display_image.convert('RGB')
+            
             # RGBA 이미지 처리
             if display_image.mode == 'RGBA':
                 checker_bg = self.app.create_checker_background(display_image.width, display_image.height)
-                final_image = Image.alpha_composite(checker_bg, display_image)
+                final_image = _composite_on_checker(checker_bg, display_image)
                 self.photo = ImageTk.PhotoImage(final_image)
             else:
                 self.photo = ImageTk.PhotoImage(display_image)
@@ -6713,6 +7543,9 @@ class SmartCanvasViewer:
         
         # 스크롤 이벤트 (페이지 스크롤용)
         self.canvas.bind('<MouseWheel>', self.on_mousewheel)
+        
+        # 캔버스 크기 기록 (새로고침 시 update_idletasks 없이 크기 조회)
+        _track_canvas_size(self.canvas)
     
     def bind_smart_canvas_events(self):
         """스케일링을 지원하는 캔버스 이벤트 바인딩"""
@@ -6729,6 +7562,7 @@ class SmartCanvasViewer:
         self.canvas.bind('<ButtonRelease-1>', self.on_canvas_release)
         self.canvas.bind('<Double-Button-1>', self.on_canvas_double_click)
         self.canvas.bind('<Motion>', self.on_mouse_motion)  # 🔥 마우스 움직임 이벤트 추가
+        self.canvas.bind('<Enter>', self.invalidate_hit_index)  # 외부 편집(대화상자 등) 후 인덱스 재생성
         
         # 드로잉 상태 변수
         self.is_drawing = False
@@ -6738,6 +7572,7 @@ class SmartCanvasViewer:
         self.current_y = 0
         self.temp_objects = []
         self.pen_points = []
+        self.pen_flat = []  # 미리보기용 평탄 좌표 [x0, y0, x1, y1, ...]
         
         logger.debug(f"SmartCanvas 이벤트 바인딩 완료: {self.canvas}")
     
@@ -6751,18 +7586,20 @@ class SmartCanvasViewer:
                 
             # 🔥 선택 도구인 경우 선택 처리
             if self.app.current_tool == 'select':
+                # 주석 목록과 이미지→캔버스 배율은 루프 밖에서 한 번만 조회
+                annotations = self.item.get('annotations', [])
+                scale_x, scale_y, _, _ = _item_scale(self.item, self.canvas_width, self.canvas_height)
+                
                 # 텍스트 주석 드래그 체크 먼저
-                for annotation in self.item.get('annotations', []):
+                for annotation in annotations:
                     if annotation['type'] == 'text':
                         # 캔버스 좌표로 변환
-                        text_x = annotation['x'] * (self.canvas_width / self.item['image'].width)
-                        text_y = annotation['y'] * (self.canvas_height / self.item['image'].height)
+                        text_x = annotation['x'] * scale_x
+                        text_y = annotation['y'] * scale_y
                         text = annotation.get('text', '')
-                        font_size = annotation.get('font_size', 14)
                         
                         # 텍스트 영역 계산 (anchor='nw' 기준으로 수정)
-                        text_width = max(len(text) * font_size * 0.7, 60)
-                        text_height = max(font_size * 1.5, 25)
+                        text_width, text_height = _text_bbox(annotation)
                         margin = 15
                         # nw 앵커이므로 text_x, text_y가 왼쪽 상단 모서리
                         click_x1 = text_x - margin
@@ -6780,18 +7617,19 @@ class SmartCanvasViewer:
                             self.app.original_text_y = annotation['y']
                             # 🔥 드래그 상태 활성화 (중요!)
                             self.is_drawing = True
-                            logger.debug(f"✅ SmartCanvas 텍스트 주석 드래그 시작: '{text}' at ({event.x}, {event.y})")
-                            logger.debug(f"   텍스트 영역: ({click_x1:.1f}, {click_y1:.1f}) - ({click_x2:.1f}, {click_y2:.1f})")
+                            if DEBUG:
+                                logger.debug(f"✅ SmartCanvas 텍스트 주석 드래그 시작: '{text}' at ({event.x}, {event.y})")
+                                logger.debug(f"   텍스트 영역: ({click_x1:.1f}, {click_y1:.1f}) - ({click_x2:.1f}, {click_y2:.1f})")
                             return
                 
                 # 이미지 주석 드래그 체크
-                for annotation in self.item.get('annotations', []):
+                for annotation in annotations:
                     if annotation['type'] == 'image':
                         # 캔버스 좌표로 변환
-                        image_x = annotation['x'] * (self.canvas_width / self.item['image'].width)
-                        image_y = annotation['y'] * (self.canvas_height / self.item['image'].height)
-                        image_width = annotation['width'] * (self.canvas_width / self.item['image'].width)
-                        image_height = annotation['height'] * (self.canvas_height / self.item['image'].height)
+                        image_x = annotation['x'] * scale_x
+                        image_y = annotation['y'] * scale_y
+                        image_width = annotation['width'] * scale_x
+                        image_height = annotation['height'] * scale_y
                         
                         # 클릭 영역을 약간 확장
                         margin = 5
@@ -6810,8 +7648,8 @@ class SmartCanvasViewer:
                             self.app.original_image_y = annotation['y']
                             # 🔥 드래그 상태 활성화 (중요!)
                             self.is_drawing = True
-                            logger.debug(f"✅ SmartCanvas 이미지 주석 드래그 시작 at ({event.x}, {event.y})")
-                            print(f"🖼️ SmartCanvas 이미지 주석 드래그 시작 - 위치: ({annotation['x']}, {annotation['y']})")
+                            if DEBUG:
+                                logger.debug(f"✅ SmartCanvas 이미지 주석 드래그 시작 at ({event.x}, {event.y})")
                             return
                 
                 # 텍스트 드래그가 아닌 경우 영역 선택 모드
@@ -6830,8 +7668,10 @@ class SmartCanvasViewer:
             # 펜 도구의 경우 점 수집 시작
             if self.app.current_tool == 'pen':
                 self.pen_points = [(event.x, event.y)]
+                self.pen_flat = [event.x, event.y]
             
-            logger.debug(f"SmartCanvas 클릭: ({event.x}, {event.y}), 도구: {self.app.current_tool}")
+            if DEBUG:
+                logger.debug(f"SmartCanvas 클릭: ({event.x}, {event.y}), 도구: {self.app.current_tool}")
             
         except Exception as e:
             logger.debug(f"SmartCanvas 클릭 오류: {e}")
@@ -6879,16 +7719,17 @@ class SmartCanvasViewer:
                     dy = event.y - self.app.drag_start_y
                     
                     # 이미지 좌표계로 변환
-                    scale_x = self.item['image'].width / self.canvas_width
-                    scale_y = self.item['image'].height / self.canvas_height
+                    _, _, scale_x, scale_y = _item_scale(self.item, self.canvas_width, self.canvas_height)
                     
                     # 새 위치 계산 (이미지 좌표계)
                     self.app.dragging_text['x'] = self.app.original_text_x + (dx * scale_x)
                     self.app.dragging_text['y'] = self.app.original_text_y + (dy * scale_y)
+                    _annotations_changed(self.item)
                     
-                    # 화면 갱신
-                    self.redraw_annotations()
-                    logger.debug(f"🔄 SmartCanvas 텍스트 드래그 중: dx={dx}, dy={dy}, 새 위치=({self.app.dragging_text['x']:.1f}, {self.app.dragging_text['y']:.1f})")
+                    # 화면 갱신 (유휴 시점에 병합 처리)
+                    self.schedule_redraw_annotations()
+                    if DEBUG:
+                        logger.debug(f"🔄 SmartCanvas 텍스트 드래그 중: dx={dx}, dy={dy}, 새 위치=({self.app.dragging_text['x']:.1f}, {self.app.dragging_text['y']:.1f})")
                     return
                 
                 # 이미지 주석 드래그 처리
@@ -6898,17 +7739,17 @@ class SmartCanvasViewer:
                     dy = event.y - self.app.drag_start_y
                     
                     # 이미지 좌표계로 변환
-                    scale_x = self.item['image'].width / self.canvas_width
-                    scale_y = self.item['image'].height / self.canvas_height
+                    _, _, scale_x, scale_y = _item_scale(self.item, self.canvas_width, self.canvas_height)
                     
                     # 새 위치 계산 (이미지 좌표계)
                     self.app.dragging_image['x'] = self.app.original_image_x + (dx * scale_x)
                     self.app.dragging_image['y'] = self.app.original_image_y + (dy * scale_y)
+                    _annotations_changed(self.item)
                     
-                    # 화면 갱신
-                    self.redraw_annotations()
-                    logger.debug(f"🔄 SmartCanvas 이미지 드래그 중: dx={dx}, dy={dy}, 새 위치=({self.app.dragging_image['x']:.1f}, {self.app.dragging_image['y']:.1f})")
-                    print(f"🖼️ SmartCanvas 이미지 드래그 중: dx={dx}, dy={dy}, 새 위치: ({self.app.dragging_image['x']:.1f}, {self.app.dragging_image['y']:.1f})")
+                    # 화면 갱신 (유휴 시점에 병합 처리)
+                    self.schedule_redraw_annotations()
+                    if DEBUG:
+                        logger.debug(f"🔄 SmartCanvas 이미지 드래그 중: dx={dx}, dy={dy}, 새 위치=({self.app.dragging_image['x']:.1f}, {self.app.dragging_image['y']:.1f})")
                     return
                 
                 # 영역 선택 사각형 그리기
@@ -6920,7 +7761,8 @@ class SmartCanvasViewer:
                         start_x, start_y, event.x, event.y,
                         outline='blue', width=2, dash=(5, 5), tags='selection_rect'
                     )
-                    logger.debug(f"선택 영역 업데이트: ({start_x}, {start_y}) -> ({event.x}, {event.y})")
+                    if DEBUG:
+                        logger.debug(f"선택 영역 업데이트: ({start_x}, {start_y}) -> ({event.x}, {event.y})")
                 return
                 
             self.current_x = event.x
@@ -6934,9 +7776,11 @@ class SmartCanvasViewer:
             if self.app.current_tool == 'pen':
                 # 펜 도구: 점 추가 및 실시간 라인 그리기
                 self.pen_points.append((event.x, event.y))
+                self.pen_flat += (event.x, event.y)
                 if len(self.pen_points) >= 2:
+                    # 🔥 누적해 둔 평탄 좌표를 그대로 전달 (매 이동마다 점 튜플 목록을 다시 펼치지 않음)
                     temp_obj = self.canvas.create_line(
-                        self.pen_points, 
+                        self.pen_flat, 
                         fill=self.app.annotation_color,
                         width=self.app.line_width,
                         smooth=True,
@@ -7054,7 +7898,6 @@ class SmartCanvasViewer:
                         self.app.dragging_image['y'] != self.app.original_image_y):
                         self.app.undo_manager.save_state(self.item['id'], self.item['annotations'])
                         logger.debug("✅ SmartCanvas 이미지 주석 이동 완료 - 상태 저장됨")
-                        print(f"🖼️ SmartCanvas 이미지 주석 이동 완료 - 최종 위치: ({self.app.dragging_image['x']:.1f}, {self.app.dragging_image['y']:.1f})")
                         self.app.update_status_message("🖼️ 이미지 주석이 이동되었습니다", 2000)
                     else:
                         logger.debug("📍 SmartCanvas 이미지 위치 변경 없음")
@@ -7083,7 +7926,8 @@ class SmartCanvasViewer:
                             # 선택된 주석들 하이라이트
                             self.highlight_selected_annotations()
                             self.app.update_status_message(f"{len(selected_indices)}개 주석이 선택되었습니다")
-                            logger.debug(f"주석 선택 완료: {len(selected_indices)}개")
+                            if DEBUG:
+                                logger.debug(f"주석 선택 완료: {len(selected_indices)}개")
                         else:
                             self.app.update_status_message("선택 영역에 주석이 없습니다")
                             logger.debug("선택 영역에 주석 없음")
@@ -7114,37 +7958,21 @@ class SmartCanvasViewer:
         """더블클릭으로 주석 편집 또는 텍스트 주석 추가"""
         try:
             if self.app.current_tool == 'select':
-                # 선택 도구인 경우 주석 편집 시도
-                for annotation in self.item.get('annotations', []):
+                # 선택 도구인 경우 주석 편집 시도 (캐시된 화면 영역 인덱스로 일괄 검사)
+                annotation = _annotation_at(self.get_hit_index(), event.x, event.y)
+                if annotation is not None:
                     if annotation['type'] == 'image':
-                        # 이미지 주석 더블클릭 체크
-                        image_x = annotation['x'] * (self.canvas_width / self.item['image'].width)
-                        image_y = annotation['y'] * (self.canvas_height / self.item['image'].height)
-                        image_width = annotation['width'] * (self.canvas_width / self.item['image'].width)
-                        image_height = annotation['height'] * (self.canvas_height / self.item['image'].height)
-                        
-                        if (image_x <= event.x <= image_x + image_width and
-                            image_y <= event.y <= image_y + image_height):
-                            self.app.edit_annotation_image(annotation)
-                            return
+                        # 이미지 주석 편집
+                        self.app.edit_annotation_image(annotation)
+                        return
                     
-                    elif annotation['type'] == 'text':
-                        # 텍스트 주석 더블클릭 체크
-                        text_x = annotation['x'] * (self.canvas_width / self.item['image'].width)
-                        text_y = annotation['y'] * (self.canvas_height / self.item['image'].height)
-                        text = annotation.get('text', '')
-                        font_size = annotation.get('font_size', 14)
-                        
-                        text_width = max(len(text) * font_size * 0.7, 60)
-                        text_height = max(font_size * 1.5, 25)
-                        
-                        if (text_x <= event.x <= text_x + text_width and
-                            text_y <= event.y <= text_y + text_height):
-                            new_text = self.app.show_custom_text_dialog()
-                            if new_text is not None:
-                                annotation['text'] = new_text
-                                self.app.refresh_current_item()
-                            return
+                    # 텍스트 주석 편집
+                    new_text = self.app.show_custom_text_dialog()
+                    if new_text is not None:
+                        annotation['text'] = new_text
+                        _annotations_changed(self.item)
+                        self.app.refresh_current_item()
+                    return
                 
                 logger.debug("선택 도구 - 빈 공간 더블클릭, 편집할 주석 없음")
                 return
@@ -7172,10 +8000,11 @@ class SmartCanvasViewer:
             scale_x = orig_width / display_width
             scale_y = orig_height / display_height
             
+            annotation = None
             if self.app.current_tool == 'pen':
                 if len(self.pen_points) >= 2:
                     # 펜 포인트들을 원본 좌표로 변환
-                    orig_points = [(x * scale_x, y * scale_y) for x, y in self.pen_points]
+                    orig_points = _scale_points(self.pen_points, scale_x, scale_y)
                     
                     annotation = {
                         'type': 'pen',
@@ -7214,8 +8043,16 @@ class SmartCanvasViewer:
                     self.item['annotations'].append(annotation)
                     logger.debug(f"SmartCanvas {self.app.current_tool} 주석 추가")
             
-            # 주석 다시 그리기
-            self.redraw_annotations()
+            # 🔥 새 주석만 그리기 (기존 주석은 캔버스에 그대로 남아 있음)
+            if annotation is not None:
+                draw_sx, draw_sy, _, _ = _item_scale(self.item, self.canvas_width, self.canvas_height)
+                font_name = self.app.font_manager.ui_font[0] if hasattr(self.app, 'font_manager') else '맑은 고딕'
+                self._draw_zoomed_annotation(self.canvas, annotation, draw_sx, draw_sy, font_name,
+                                             getattr(self.canvas, 'annotation_image_cache', {}))
+                
+                # 레이어 순서 유지 (전체 그리기와 동일하게 이미지 주석은 최상단)
+                self.canvas.tag_raise('image_annotation')
+                self.canvas.tag_lower('background')
             
             # Undo 상태 저장
             self.app.undo_manager.save_state(self.item['id'], self.item['annotations'])
@@ -7283,6 +8120,24 @@ class SmartCanvasViewer:
         except Exception as e:
             logger.debug(f"SmartCanvas 주석 재그리기 오류: {e}")
     
+    def schedule_redraw_annotations(self):
+        """주석 다시 그리기 예약 - 연속 드래그 이벤트를 유휴 시점의 한 번으로 병합"""
+        if self._redraw_after_id is None:
+            self._redraw_after_id = self.canvas.after_idle(self._do_scheduled_redraw)
+    
+    def _do_scheduled_redraw(self):
+        """예약된 주석 다시 그리기 실행 (최신 위치 기준)"""
+        self._redraw_after_id = None
+        if not self.canvas.winfo_exists():
+            return
+        
+        # 드래그 중인 주석만 이동 (항목이 없으면 전체 다시 그리기)
+        dragged = self.app.dragging_text or getattr(self.app, 'dragging_image', None)
+        scale_x, scale_y, _, _ = _item_scale(self.item, self.canvas_width, self.canvas_height)
+        if dragged and self.app.move_annotation_items(self.canvas, dragged, scale_x, scale_y):
+            return
+        self.redraw_annotations()
+    
     def on_zoom_var_change(self, value):
         """줌 변수 변경 감지 (trace 콜백)"""
         try:
@@ -7429,8 +8284,15 @@ class SmartCanvasViewer:
             # 실제 캔버스 위젯 크기 변경
             logger.debug("캔버스 위젯 크기 변경 시도...")
             self.canvas.configure(width=new_width, height=new_height)
+            self.canvas._cw = self.canvas._ch = None  # 다음 <Configure> 전까지 기록된 크기 무효
             logger.debug("✓ 캔버스 위젯 크기 변경 완료")
             
+            # 🔥 직전 줌이 아직 정착 전이면 연속 줌 - 이번 프레임은 BILINEAR, 멈춘 뒤 LANCZOS 로 한 번 더
+            if self._zoom_settle_id is not None:
+                self.canvas.after_cancel(self._zoom_settle_id)
+                self._zoom_fast = True
+            self._zoom_settle_id = self.canvas.after(150, self._settle_zoom)
+            
             # 이미지 다시 그리기
             logger.debug("이미지 리드로우 시작...")
             self.redraw_with_zoom()
@@ -7442,6 +8304,13 @@ class SmartCanvasViewer:
             logger.error(f"❌ 줌 업데이트 오류: {e}")
             import traceback
             logger.error(f"스택 트레이스: {traceback.format_exc()}")
+    
+    def _settle_zoom(self):
+        """줌이 멈춘 뒤 호출 - 중간 프레임을 빠른 리샘플링으로 그렸다면 고품질로 다시 그리기"""
+        self._zoom_settle_id = None
+        if self._zoom_fast:
+            self._zoom_fast = False
+            self.redraw_with_zoom()
         
     def redraw_with_zoom(self):
         """새로운 크기로 이미지 및 주석 다시 그리기"""
@@ -7461,15 +8330,18 @@ class SmartCanvasViewer:
             if display_width > 0 and display_height > 0:
                 # 이미지 리사이즈
                 logger.debug("이미지 리사이즈 시작...")
-                display_image = self.item['image'].copy()
-                display_image = display_image.resize((display_width, display_height), 
-                                                   Image.Resampling.LANCZOS)
+                resample = Image.Resampling.BILINEAR if self._zoom_fast else None
+                display_image = _display_resize(self.item['image'], (display_width, display_height), resample)
                 logger.debug(f"✓ 이미지 리사이즈 완료: {display_width}x{display_height}")
                 
+                # 불투명한 RGBA 는 체커보드 합성 없이 RGB 로 표시
+                if display_image.mode == 'RGBA' and not _item_has_transparency(self.item):
+                    display_image = display_image.convert('RGB')
+                
                 # RGBA 이미지 처리
                 if display_image.mode == 'RGBA':
                     checker_bg = self.app.create_checker_background(display_width, display_height)
-                    final_image = Image.alpha_composite(checker_bg, display_image)
+                    final_image = _composite_on_checker(checker_bg, display_image)
                     self.photo = ImageTk.PhotoImage(final_image)
                     logger.debug("✓ RGBA 이미지 처리 완료")
                 else:
@@ -7520,197 +8392,115 @@ class SmartCanvasViewer:
             
             logger.debug(f"주석 스케일링: 원본({orig_width}x{orig_height}) -> 표시({canvas_width}x{canvas_height}), 스케일({scale_x:.2f}, {scale_y:.2f})")
             
+            # 이미지 주석 PhotoImage 캐시 - 이번 그리기에서 사용된 항목만 유지
+            prev_photo_cache = getattr(canvas, 'annotation_image_cache', {})
+            canvas.annotation_image_cache = {}
+            
+            # 텍스트 폰트 이름 (주석마다 조회하지 않도록 루프 밖에서 한 번)
+            font_name = self.app.font_manager.ui_font[0] if hasattr(self.app, 'font_manager') else '맑은 고딕'
+            
             for annotation in item['annotations']:
-                try:
-                    ann_type = annotation['type']
-                    if ann_type == 'arrow':
-                        x1 = annotation['start_x'] * scale_x
-                        y1 = annotation['start_y'] * scale_y
-                        x2 = annotation['end_x'] * scale_x
-                        y2 = annotation['end_y'] * scale_y
-                        color = annotation['color']
-                        width = max(1, int(annotation['width'] * min(scale_x, scale_y)))  # 선 굵기도 스케일링
-                        # 🔥 개선된 화살표 그리기 사용
-                        create_improved_arrow(canvas, x1, y1, x2, y2, color, width, 'annotation')
-                    elif ann_type == 'line':
-                        x1 = annotation['start_x'] * scale_x
-                        y1 = annotation['start_y'] * scale_y
-                        x2 = annotation['end_x'] * scale_x
-                        y2 = annotation['end_y'] * scale_y
-                        color = annotation['color']
-                        width = max(1, int(annotation['width'] * min(scale_x, scale_y)))  # 선 굵기도 스케일링
-                        canvas.create_line(x1, y1, x2, y2, fill=color, width=width, tags='annotation')
-                    elif ann_type == 'pen':
-                        points = annotation.get('points', [])
-                        if points:
-                            scaled_points = [(x * scale_x, y * scale_y) for x, y in points]
-                            color = annotation['color']
-                            width = max(1, int(annotation['width'] * min(scale_x, scale_y)))  # 선 굵기도 스케일링
-                            canvas.create_line(scaled_points, fill=color, width=width, tags='annotation', smooth=True)
-                    elif ann_type in ['oval', 'rect']:
-                        x1 = annotation['x1'] * scale_x
-                        y1 = annotation['y1'] * scale_y
-                        x2 = annotation['x2'] * scale_x
-                        y2 = annotation['y2'] * scale_y
-                        color = annotation['color']
-                        width = max(1, int(annotation['width'] * min(scale_x, scale_y)))  # 선 굵기도 스케일링
-                        if ann_type == 'oval':
-                            canvas.create_oval(x1, y1, x2, y2, outline=color, width=width, tags='annotation')
-                        else:
-                            canvas.create_rectangle(x1, y1, x2, y2, outline=color, width=width, tags='annotation')
-                    
-                    elif ann_type == 'text':
-                        x = annotation['x'] * scale_x
-                        y = annotation['y'] * scale_y
-                        text = annotation.get('text', '')
-                        font_size = max(8, int(annotation.get('font_size', 14) * min(scale_x, scale_y)))  # 폰트 크기도 스케일링
-                        color = annotation['color']
-                        bold = annotation.get('bold', False)  # 볼드 정보
-                        
-                        try:
-                            # 🔥 안정적인 한글 폰트 사용 - 볼드 지원
-                            font_name = self.app.font_manager.ui_font[0] if hasattr(self.app, 'font_manager') else '맑은 고딕'
-                            font_weight = "bold" if bold else "normal"
-                            font_tuple = (font_name, font_size, font_weight)
-                            canvas.create_text(x, y, text=text, font=font_tuple, fill=color, tags='annotation', anchor='nw')
-                        except Exception as e:
-                            # 폴백: 기본 폰트 사용
-                            try:
-                                font_tuple = (font_name, font_size)
-                                canvas.create_text(x, y, text=text, font=font_tuple, fill=color, tags='annotation', anchor='nw')
-                            except:
-                                canvas.create_text(x, y, text=text, fill=color, tags='annotation', anchor='nw')
-                    
-                    elif ann_type == 'image':
-                        x = annotation['x'] * scale_x
-                        y = annotation['y'] * scale_y
-                        width = annotation['width'] * scale_x
-                        height = annotation['height'] * scale_y
-                        
-                        try:
-                            # base64 이미지 디코딩
-                            image_data = base64.b64decode(annotation['image_data'])
-                            image = Image.open(io.BytesIO(image_data))
-                            
-                            # 반전 처리
-                            if annotation.get('flip_horizontal', False):
-                                image = image.transpose(Image.FLIP_LEFT_RIGHT)
-                            if annotation.get('flip_vertical', False):
-                                image = image.transpose(Image.FLIP_TOP_BOTTOM)
-                            
-                            # 회전 처리 (크기 유지 개선)
-                            rotation = annotation.get('rotation', 0)
-                            if rotation != 0:
-                                try:
-                                    # 이미지를 RGBA 모드로 변환하여 투명도 지원
-                                    if image.mode != 'RGBA':
-                                        image = image.convert('RGBA')
-                                    
-                                    # 원본 크기 저장
-                                    original_size = image.size
-                                    
-                                    # 투명 배경으로 회전 (expand=True로 잘림 방지)
-                                    rotated_image = image.rotate(-rotation, expand=True, fillcolor=(0, 0, 0, 0))
-                                    
-                                    # 회전 후 크기와 원본 크기 비율 계산
-                                    scale_factor = min(
-                                        original_size[0] / rotated_image.size[0],
-                                        original_size[1] / rotated_image.size[1]
-                                    )
-                                    
-                                    # 회전된 이미지를 원본 크기에 맞게 조정
-                                    if scale_factor < 1.0:
-                                        # 회전으로 인해 크기가 커진 경우, 원본 크기에 맞게 스케일 다운
-                                        temp_size = (
-                                            int(rotated_image.size[0] * scale_factor),
-                                            int(rotated_image.size[1] * scale_factor)
-                                        )
-                                        scaled_image = rotated_image.resize(temp_size, Image.Resampling.LANCZOS)
-                                        
-                                        # 원본 크기 캔버스에 중앙 배치
-                                        image = Image.new('RGBA', original_size, (0, 0, 0, 0))
-                                        paste_x = (original_size[0] - scaled_image.size[0]) // 2
-                                        paste_y = (original_size[1] - scaled_image.size[1]) // 2
-                                        image.paste(scaled_image, (paste_x, paste_y), scaled_image)
-                                    else:
-                                        # 회전 후에도 원본 크기보다 작은 경우, 중앙에 배치
-                                        image = Image.new('RGBA', original_size, (0, 0, 0, 0))
-                                        paste_x = (original_size[0] - rotated_image.size[0]) // 2
-                                        paste_y = (original_size[1] - rotated_image.size[1]) // 2
-                                        image.paste(rotated_image, (paste_x, paste_y), rotated_image)
-                                    
-                                    logger.debug(f"이미지 회전 완료 (크기 유지): {rotation}도, 원본={original_size}, 최종={image.size}")
-                                    
-                                except Exception as e:
-                                    logger.error(f"이미지 회전 오류: {e}")
-                                    # 폴백: 기본 회전
-                                image = image.rotate(-rotation, expand=True)
-                            
-                            # 크기 조정 (이제 회전 후에도 원본 비율 유지됨)
-                            display_image = image.resize((int(width), int(height)), Image.Resampling.LANCZOS)
-                            
-                            # 투명도 처리
-                            opacity = annotation.get('opacity', 100) / 100.0
-                            if opacity < 1.0:
-                                # RGBA 모드로 변환
-                                if display_image.mode != 'RGBA':
-                                    display_image = display_image.convert('RGBA')
-                                # 투명도 적용
-                                alpha = display_image.split()[-1]
-                                alpha = alpha.point(lambda p: p * opacity)
-                                display_image.putalpha(alpha)
-                            
-                            # 🔥 아웃라인 처리 (ImageDraw로 완전한 테두리)
-                            if annotation.get('outline', False):
-                                from PIL import ImageDraw
-                                
-                                # 아웃라인을 위한 이미지 확장
-                                outline_width = annotation.get('outline_width', 3)
-                                new_size = (display_image.width + outline_width * 2, 
-                                           display_image.height + outline_width * 2)
-                                outlined_image = Image.new('RGBA', new_size, (0, 0, 0, 0))
-                                
-                                # 🔥 ImageDraw로 확실한 흰색 아웃라인 그리기 (투명도 100% 안전)
-                                draw = ImageDraw.Draw(outlined_image)
-                                for i in range(outline_width):
-                                    # 바깥쪽부터 안쪽까지 여러 겹의 흰색 테두리
-                                    draw.rectangle([
-                                        i, i, 
-                                        outlined_image.width - 1 - i, 
-                                        outlined_image.height - 1 - i
-                                    ], outline=(255, 255, 255, 255), width=1)
-                                
-                                # 원본 이미지를 중앙에 붙이기 (RGBA 마스크 사용)
-                                outlined_image.paste(display_image, (outline_width, outline_width), display_image if display_image.mode == 'RGBA' else None)
-                                
-                                display_image = outlined_image
-                                x -= outline_width
-                                y -= outline_width
-                            
-                            # tkinter용 이미지로 변환
-                            photo = ImageTk.PhotoImage(display_image)
-                            
-                            # 캔버스에 그리기
-                            image_id = canvas.create_image(x, y, image=photo, anchor='nw', tags='annotation image_annotation')
-                            
-                            # 이미지 참조 유지 (가비지 컬렉션 방지)
-                            if not hasattr(canvas, 'annotation_images'):
-                                canvas.annotation_images = {}
-                            canvas.annotation_images[image_id] = photo
-                            
-                            # 이미지 주석을 최상단으로 올리기
-                            canvas.tag_raise(image_id)
-                            
-                        except Exception as e:
-                            logger.debug(f"이미지 주석 스케일링 그리기 오류: {e}")
-                except Exception as e:
-                    logger.debug(f"개별 주석 스케일링 오류: {e}")
+                self._draw_zoomed_annotation(canvas, annotation, scale_x, scale_y, font_name, prev_photo_cache)
             
             logger.debug(f"스케일링된 주석 그리기 완료: {len(item['annotations'])}개")
             
         except Exception as e:
             logger.debug(f"주석 스케일링 그리기 전체 오류: {e}")
     
+    def _draw_zoomed_annotation(self, canvas, annotation, scale_x, scale_y, font_name, prev_photo_cache):
+        """주석 하나를 현재 스케일로 그리기 (전체 그리기와 새 주석 추가에서 공용)"""
+        try:
+            ann_type = annotation['type']
+            if ann_type == 'arrow':
+                x1 = annotation['start_x'] * scale_x
+                y1 = annotation['start_y'] * scale_y
+                x2 = annotation['end_x'] * scale_x
+                y2 = annotation['end_y'] * scale_y
+                color = annotation['color']
+                width = max(1, int(annotation['width'] * min(scale_x, scale_y)))  # 선 굵기도 스케일링
+                # 🔥 개선된 화살표 그리기 사용
+                create_improved_arrow(canvas, x1, y1, x2, y2, color, width, 'annotation', annotation)
+            elif ann_type == 'line':
+                x1 = annotation['start_x'] * scale_x
+                y1 = annotation['start_y'] * scale_y
+                x2 = annotation['end_x'] * scale_x
+                y2 = annotation['end_y'] * scale_y
+                color = annotation['color']
+                width = max(1, int(annotation['width'] * min(scale_x, scale_y)))  # 선 굵기도 스케일링
+                canvas.create_line(x1, y1, x2, y2, fill=color, width=width, tags='annotation')
+            elif ann_type == 'pen':
+                points = annotation.get('points', [])
+                if points:
+                    scaled_points = _pen_coords(annotation, scale_x, scale_y)
+                    color = annotation['color']
+                    width = max(1, int(annotation['width'] * min(scale_x, scale_y)))  # 선 굵기도 스케일링
+                    canvas.create_line(scaled_points, fill=color, width=width, tags='annotation', smooth=True)
+            elif ann_type in ['oval', 'rect']:
+                x1 = annotation['x1'] * scale_x
+                y1 = annotation['y1'] * scale_y
+                x2 = annotation['x2'] * scale_x
+                y2 = annotation['y2'] * scale_y
+                color = annotation['color']
+                width = max(1, int(annotation['width'] * min(scale_x, scale_y)))  # 선 굵기도 스케일링
+                if ann_type == 'oval':
+                    canvas.create_oval(x1, y1, x2, y2, outline=color, width=width, tags='annotation')
+                else:
+                    canvas.create_rectangle(x1, y1, x2, y2, outline=color, width=width, tags='annotation')
+            
+            elif ann_type == 'text':
+                x = annotation['x'] * scale_x
+                y = annotation['y'] * scale_y
+                text = annotation.get('text', '')
+                font_size = max(8, int(annotation.get('font_size', 14) * min(scale_x, scale_y)))  # 폰트 크기도 스케일링
+                color = annotation['color']
+                bold = annotation.get('bold', False)  # 볼드 정보
+                
+                try:
+                    # 🔥 안정적인 한글 폰트 사용 - 볼드 지원
+                    font_tuple = _font_for(font_name, font_size, bold)
+                    text_id = canvas.create_text(x, y, text=text, font=font_tuple, fill=color, tags='annotation', anchor='nw')
+                except Exception as e:
+                    # 폴백: 기본 폰트 사용
+                    try:
+                        font_tuple = (font_name, font_size)
+                        text_id = canvas.create_text(x, y, text=text, font=font_tuple, fill=color, tags='annotation', anchor='nw')
+                    except:
+                        text_id = canvas.create_text(x, y, text=text, fill=color, tags='annotation', anchor='nw')
+                _remember_canvas_items(annotation, canvas, text_id)
+            
+            elif ann_type == 'image':
+                x = annotation['x'] * scale_x
+                y = annotation['y'] * scale_y
+                width = annotation['width'] * scale_x
+                height = annotation['height'] * scale_y
+                
+                try:
+                    # 🔥 변환된 PhotoImage 캐시 사용 (표시 조건이 같으면 디코딩/회전/리사이즈 생략)
+                    photo = self.app.get_annotation_photo(canvas, annotation, width, height, prev_photo_cache)
+                    
+                    # 아웃라인 두께만큼 위치 보정
+                    if annotation.get('outline', False):
+                        outline_width = annotation.get('outline_width', 3)
+                        x -= outline_width
+                        y -= outline_width
+                    
+                    # 캔버스에 그리기
+                    image_id = canvas.create_image(x, y, image=photo, anchor='nw', tags='annotation image_annotation')
+                    
+                    # 이미지 참조 유지 (가비지 컬렉션 방지)
+                    if not hasattr(canvas, 'annotation_images'):
+                        canvas.annotation_images = {}
+                    canvas.annotation_images[image_id] = photo
+                    _remember_canvas_items(annotation, canvas, image_id)
+                    
+                    # 이미지 주석을 최상단으로 올리기
+                    canvas.tag_raise(image_id)
+                    
+                except Exception as e:
+                    logger.debug(f"이미지 주석 스케일링 그리기 오류: {e}")
+        except Exception as e:
+            logger.debug(f"개별 주석 스케일링 오류: {e}")
+    
 
             
     def get_annotations_in_selection(self, x1, y1, x2, y2):
@@ -7723,17 +8513,15 @@ class SmartCanvasViewer:
             min_y, max_y = min(y1, y2), max(y1, y2)
             
             # 실제 이미지 좌표로 변환
-            scale_x = self.item['image'].width / self.canvas_width
-            scale_y = self.item['image'].height / self.canvas_height
+            _, _, scale_x, scale_y = _item_scale(self.item, self.canvas_width, self.canvas_height)
             
             real_min_x = min_x * scale_x
             real_max_x = max_x * scale_x
             real_min_y = min_y * scale_y
             real_max_y = max_y * scale_y
             
-            for i, annotation in enumerate(self.item.get('annotations', [])):
-                if self.app.annotation_in_rect(annotation, real_min_x, real_min_y, real_max_x, real_max_y):
-                    selected_indices.append(i)
+            selected_indices = self.app.annotations_in_rect(
+                self.item, real_min_x, real_min_y, real_max_x, real_max_y)
             
             return selected_indices
             
@@ -7749,8 +8537,7 @@ class SmartCanvasViewer:
             if not self.app.selected_annotations:
                 return
                 
-            scale_x = self.canvas_width / self.item['image'].width
-            scale_y = self.canvas_height / self.item['image'].height
+            scale_x, scale_y, _, _ = _item_scale(self.item, self.canvas_width, self.canvas_height)
             
             # 선택된 각 주석에 대해 하이라이트 그리기
             for annotation in self.app.selected_annotations:
@@ -7795,11 +8582,8 @@ class SmartCanvasViewer:
                     elif ann_type == 'text':
                         x = annotation['x'] * scale_x
                         y = annotation['y'] * scale_y
-                        text = annotation.get('text', '')
-                        font_size = annotation.get('font_size', 14)
                         # 텍스트 주변에 하이라이트 박스 (anchor='nw' 기준)
-                        text_width = max(len(text) * font_size * 0.7, 60)
-                        text_height = max(font_size * 1.5, 25)
+                        text_width, text_height = _text_bbox(annotation)
                         self.canvas.create_rectangle(
                             x - 5, y - 5, x + text_width + 5, y + text_height + 5,
                             outline='lime', width=3, dash=(3, 3), tags='highlight'
@@ -7808,12 +8592,11 @@ class SmartCanvasViewer:
                         # 펜 경로의 바운딩 박스 계산
                         points = annotation.get('points', [])
                         if points:
-                            xs = [p[0] * scale_x for p in points]
-                            ys = [p[1] * scale_y for p in points]
+                            min_x, min_y, max_x, max_y = _pen_bbox(annotation)
                             margin = 10
                             self.canvas.create_rectangle(
-                                min(xs) - margin, min(ys) - margin,
-                                max(xs) + margin, max(ys) + margin,
+                                min_x * scale_x - margin, min_y * scale_y - margin,
+                                max_x * scale_x + margin, max_y * scale_y + margin,
                                 outline='lime', width=3, dash=(3, 3), tags='highlight'
                             )
                     elif ann_type == 'image':
@@ -7832,8 +8615,33 @@ class SmartCanvasViewer:
         except Exception as e:
             logger.debug(f"하이라이트 처리 오류: {e}")
 
+    def invalidate_hit_index(self, event=None):
+        """hover/더블클릭 인덱스 무효화 - 다음 조회 때 재생성"""
+        self._hit_index_cache = None
+
+    def get_hit_index(self):
+        """드래그 가능한 주석의 화면 영역 인덱스 - 주석 목록/변경 버전/배율이 같으면 재사용"""
+        annotations = self.item.get('annotations', [])
+        scale_x, scale_y, _, _ = _item_scale(self.item, self.canvas_width, self.canvas_height)
+        stamp = (len(annotations), self.item.get('_ann_version', 0), scale_x, scale_y)
+        cached = self._hit_index_cache
+        if cached and cached[0] is annotations and cached[1] == stamp:
+            return cached[2]
+        
+        index = _build_hit_index(annotations, scale_x, scale_y)
+        self._hit_index_cache = (annotations, stamp, index)
+        return index
+
     def on_mouse_motion(self, event):
-        """마우스 움직임 처리 - 텍스트 주석 hover 효과"""
+        """마우스 움직임 - 최신 좌표만 저장하고 hover 검사는 유휴 시점에 한 번만 실행"""
+        self._hover_pos = (event.x, event.y)
+        if self._hover_after_id is None:
+            self._hover_after_id = self.canvas.after_idle(self._do_hover)
+
+    def _do_hover(self):
+        """마우스 움직임 처리 - 텍스트 주석 hover 효과 (마지막 좌표 기준)"""
+        self._hover_after_id = None
+        event_x, event_y = self._hover_pos
         try:
             # 도구별 기본 커서 설정
             cursor_map = {
@@ -7846,61 +8654,19 @@ class SmartCanvasViewer:
                 'text': 'crosshair'         # 텍스트: 십자 커서
             }
             
-            default_cursor = cursor_map.get(self.app.current_tool, 'crosshair')
+            tool = self.app.current_tool
+            default_cursor = cursor_map.get(tool, 'crosshair')
             
             # 선택 도구일 때만 주석 hover 효과 적용
-            if self.app.current_tool == 'select':
-                # 드래그 가능한 주석 위에 마우스가 있는지 확인
-                over_draggable = False
-                for annotation in self.item.get('annotations', []):
-                    if annotation['type'] == 'text':
-                        text_x = annotation['x'] * (self.canvas_width / self.item['image'].width)
-                        text_y = annotation['y'] * (self.canvas_height / self.item['image'].height)
-                        text = annotation.get('text', '')
-                        font_size = annotation.get('font_size', 14)
-                        
-                        # 확장된 클릭 영역 계산 (anchor='nw' 기준)
-                        text_width = max(len(text) * font_size * 0.7, 60)
-                        text_height = max(font_size * 1.5, 25)
-                        margin = 15
-                        # nw 앵커이므로 text_x, text_y가 왼쪽 상단 모서리
-                        click_x1 = text_x - margin
-                        click_y1 = text_y - margin
-                        click_x2 = text_x + text_width + margin
-                        click_y2 = text_y + text_height + margin
-                        
-                        if (click_x1 <= event.x <= click_x2 and
-                            click_y1 <= event.y <= click_y2):
-                            over_draggable = True
-                            break
-                    
-                    elif annotation['type'] == 'image':
-                        # 이미지 주석 호버 감지
-                        image_x = annotation['x'] * (self.canvas_width / self.item['image'].width)
-                        image_y = annotation['y'] * (self.canvas_height / self.item['image'].height)
-                        image_width = annotation['width'] * (self.canvas_width / self.item['image'].width)
-                        image_height = annotation['height'] * (self.canvas_height / self.item['image'].height)
-                        
-                        # 클릭 영역을 약간 확장
-                        margin = 5
-                        click_x1 = image_x - margin
-                        click_y1 = image_y - margin
-                        click_x2 = image_x + image_width + margin
-                        click_y2 = image_y + image_height + margin
-                        
-                        if (click_x1 <= event.x <= click_x2 and
-                            click_y1 <= event.y <= click_y2):
-                            over_draggable = True
-                            break
+            if tool == 'select':
+                # 드래그 가능한 주석 위에 마우스가 있는지 확인 (격자 셀 후보만 검사)
+                over_draggable = _hover_hit(self.get_hit_index(), event_x, event_y)
                 
                 # 드래그 가능한 주석 위에 있으면 손가락 커서, 아니면 기본 커서
-                if over_draggable:
-                    self.canvas.configure(cursor='hand2')
-                else:
-                    self.canvas.configure(cursor=default_cursor)
+                _set_cursor(self.canvas, 'hand2' if over_draggable else default_cursor)
             else:
                 # 다른 도구들은 해당 도구의 커서 사용
-                self.canvas.configure(cursor=default_cursor)
+                _set_cursor(self.canvas, default_cursor)
                     
         except Exception as e:
             pass  # hover 효과는 오류가 나도 계속 동작해야 함
@@ -7965,6 +8731,13 @@ class FeedbackCanvasTool:
                 'relief': 'solid', 'bd': 1,
                 'activebackground': '#e0f7fa',
                 'activeforeground': '#17a2b8'
+            },
+            # 편집 다이얼로그 하단 확정/취소 버튼 (색상은 버튼별 지정, 폰트는 한 번 만든 객체 공유)
+            'dialog_action': {
+                'font': font.Font(root=root, family='Arial', size=10, weight='bold'),
+                'relief': 'flat',
+                'height': 2,
+                'cursor': 'hand2'
             }
         }
         
@@ -8008,13 +8781,22 @@ class FeedbackCanvasTool:
         self.original_image_x = None
         self.original_image_y = None
         
+        # 실시간 미리보기 중 여부 (True면 이미지 주석을 빠른 BILINEAR로 리샘플링)
+        self._interactive = False
+        
+        # 체커보드 배경 캐시 ((너비, 높이, 칸 크기) → Image, 최근 사용 순)
+        self._checker_cache = OrderedDict()
+        
+        # 캔버스 배경 PhotoImage 캐시 ((id(원본), 너비, 높이) → (원본, PhotoImage), 최근 사용 순)
+        self._display_cache = OrderedDict()
+        
         # 선택 영역 관련
         self.selection_rect = None
         self.selection_start = None
         self.drag_start = None
         
-        # 활성 캔버스 목록
-        self.active_canvases = []
+        # 활성 캔버스 목록 (SmartCanvasViewer 가 생성 시 등록)
+        self.active_canvases = weakref.WeakSet()
         
         # 네비게이션 바
         self.navigation_bar = None
@@ -8055,6 +8837,9 @@ class FeedbackCanvasTool:
         self.image_cache = weakref.WeakValueDictionary()
         self.max_cache_size = 12
         self._ui_update_scheduled = False
+        self._item_refresh_scheduled = False
+        self._screen_wh = None  # 화면 크기 (다이얼로그 배치용, 처음 조회 시 저장)
+        self._image_edit_dialog = None  # 재사용하는 이미지 주석 편집 다이얼로그 (처음 편집 시 생성)
         self._last_memory_check = time.time()
         
         # 파일 처리 관련
@@ -8546,6 +9331,8 @@ class FeedbackCanvasTool:
             
             current_item = self.feedback_items[self.current_index]
             logger.debug(f"현재 항목 새로고침: {current_item['name']}, 이미지 크기: {current_item['image'].size}")
+            # 편집 후 호출되는 경로이므로 주석 목록 기준 캐시를 여기서 한 번에 무효화
+            _annotations_changed(current_item)
             
             # 현재 아이템의 카드 찾기 및 업데이트
             refreshed = False
@@ -8585,6 +9372,19 @@ class FeedbackCanvasTool:
         finally:
             self._ui_update_scheduled = False
 
+    def schedule_current_item_refresh(self):
+        """현재 항목 새로고침 스케줄링 - 유휴 시점 전의 연속 요청은 한 번으로 합침"""
+        if not self._item_refresh_scheduled:
+            self._item_refresh_scheduled = True
+            self.root.after_idle(self._perform_item_refresh)
+
+    def _perform_item_refresh(self):
+        """예약된 현재 항목 새로고침 수행"""
+        try:
+            self.refresh_current_item()
+        finally:
+            self._item_refresh_scheduled = False
+
     def update_canvas_size_and_image(self, canvas, item):
         """캔버스 크기와 이미지 업데이트"""
         try:
@@ -9611,11 +10411,10 @@ class FeedbackCanvasTool:
             
             # 모든 활성 캔버스의 커서 업데이트
             if hasattr(self, 'active_canvases'):
-                for canvas in self.active_canvases:
+                for canvas in _live_canvases(self.active_canvases):
                     try:
-                        if canvas.winfo_exists():
-                            canvas.configure(cursor=cursor)
-                    except:
+                        _set_cursor(canvas, cursor)
+                    except tk.TclError:
                         pass
                         
             # 피드백 카드의 모든 캔버스 커서 업데이트
@@ -9626,7 +10425,7 @@ class FeedbackCanvasTool:
                             for grandchild in child.winfo_children():
                                 if isinstance(grandchild, tk.Canvas):
                                     try:
-                                        grandchild.configure(cursor=cursor)
+                                        _set_cursor(grandchild, cursor)
                                     except:
                                         pass
                                         
@@ -9815,6 +10614,7 @@ class FeedbackCanvasTool:
                         ann['y2'] += add_height
                     if ann['type'] == 'pen' and 'points' in ann:
                         ann['points'] = [(x, y + add_height) for x, y in ann['points']]
+            _annotations_changed(current_item)
             
             # 이미지 교체
             current_item['image'] = new_image
@@ -10180,7 +10980,8 @@ class FeedbackCanvasTool:
                 'outline_width': 3,  # 아웃라인 두께
                 'rotation': 0,  # 회전 각도
                 'flip_horizontal': False,  # 좌우 반전
-                'flip_vertical': False  # 상하 반전
+                'flip_vertical': False,  # 상하 반전
+                '_pil': (image_b64, image.copy())  # 디코딩된 이미지 캐시 (저장 시 제외)
             }
             
             # 실행 취소를 위한 상태 저장
@@ -10471,7 +11272,7 @@ class FeedbackCanvasTool:
                     pass
             
             # 활성 캔버스 목록 초기화
-            self.active_canvases = []
+            self.active_canvases = weakref.WeakSet()
             
             # 🔥 피드백 카드들을 순차적으로 생성
             logger.info(f"UI 새로고침 시작: {len(self.feedback_items)}개 항목")
@@ -10658,10 +11459,10 @@ class FeedbackCanvasTool:
             # 태그 기반 일관된 폰트 적용
             text_widget.tag_configure('all', font=(stable_font, unified_font_size))
             text_widget.tag_add('all', '1.0', 'end')
-            # IME 조합창 설정
-            text_widget.tk.call('tk::imestatus', text_widget, 'on')
         except:
             pass
+        # IME 조합창 설정
+        _enable_ime_status(text_widget)
         text_scrollbar = tk.Scrollbar(text_container, orient=tk.VERTICAL, 
                                      command=text_widget.yview, width=24)
         text_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -10924,7 +11725,8 @@ class FeedbackCanvasTool:
                         'name': item['name'],
                         'image': image_b64,
                         'feedback_text': item['feedback_text'],
-                        'annotations': item.get('annotations', []),
+                        'annotations': [{k: v for k, v in ann.items() if not k.startswith('_')}
+                                        for ann in item.get('annotations', [])],
                         'timestamp': item['timestamp'],
                         'source_type': item.get('source_type', '알 수 없음')
                     })
@@ -11427,6 +12229,24 @@ class FeedbackCanvasTool:
                         self.create_pdf_title_page(c, A4[0], A4[1], korean_font)
                     
                     total_items = len(self.feedback_items)
+                    
+                    # 🔥 앞쪽 페이지 레이아웃을 미리 계산하고 배경 이미지 리샘플링/인코딩 (합성 페이지는 주석 합성)을 병렬로 시작
+                    # (캔버스 그리기는 순서대로 이 스레드에서만 - 인코딩 결과만 기다려 받음)
+                    lookahead = _PAGE_PREFETCH_MAX
+                    page_plans = []
+                    
+                    def plan_pages(upto):
+                        while len(page_plans) < min(upto, total_items):
+                            ahead = self.feedback_items[len(page_plans)]
+                            page_size = self.create_adaptive_pdf_page(ahead)
+                            layout = getattr(self, 'adaptive_layout', {})
+                            job = _adaptive_page_image_job(ahead, layout, self.pdf_generator.pdf_readability_mode)
+                            if job is not None:
+                                _prefetch_page_image(*job)
+                            else:
+                                _prefetch_combined_image(self.pdf_generator, ahead)
+                            page_plans.append((page_size, layout))
+                    
                     for index, item in enumerate(self.feedback_items):
                         progress.update(
                             int(10 + (index / total_items * 80)),
@@ -11435,6 +12255,8 @@ class FeedbackCanvasTool:
                         if progress.canceled:
                             return {'cancelled': True}
                         
+                        plan_pages(index + 1 + lookahead)
+                        
                         # 🔥 첫 번째 페이지인지 확인 (제목 페이지 제외 시 showPage 호출 안함)
                         if index == 0 and skip_title:
                             # 첫 번째 피드백이면서 제목 페이지를 제외하는 경우 showPage 호출 안함
@@ -11442,31 +12264,12 @@ class FeedbackCanvasTool:
                         else:
                             c.showPage()
                         
-                        # 🔥 이미지 크기에 맞는 페이지 크기 설정
-                        page_width, page_height = self.create_adaptive_pdf_page(item)
+                        # 🔥 이미지 크기에 맞는 페이지 크기 설정 (미리 계산한 레이아웃을 이 페이지 것으로 되돌림)
+                        (page_width, page_height), self.adaptive_layout = page_plans[index]
                         c.setPageSize((page_width, page_height))
                         
-                        # 🔥 이미지 크기에 맞춤 PDF에서도 투명도 지원 페이지 생성
-                        try:
-                            # 투명도가 있는 이미지 주석 확인
-                            all_annotations = item.get('annotations', [])
-                            image_annotations = [ann for ann in all_annotations if ann.get('type') == 'image']
-                            
-                            # 투명도가 있는 이미지 주석 확인
-                            has_transparent_images = any(
-                                ann.get('opacity', 100) < 100 
-                                for ann in image_annotations
-                            )
-                            
-                            logger.info(f"적응형 PDF - 주석 분석: 전체 {len(all_annotations)}개, 이미지 {len(image_annotations)}개, 투명도 있음: {has_transparent_images}")
-                            
-                            # 🔥 적응형 모드 전용 페이지 생성
-                            logger.info("적응형 PDF - 최적화된 레이아웃 사용")
-                            self.pdf_generator._adaptive_pdf_page(c, item, index, page_width, page_height)
-                                
-                        except Exception as e:
-                            logger.warning(f"적응형 PDF 생성 실패: {e}")
-                            self.pdf_generator._adaptive_pdf_page(c, item, index, page_width, page_height)
+                        # 🔥 적응형 모드 전용 페이지 생성 (이미지/투명도 주석 분석은 페이지 함수가 한 번만 수행)
+                        self.pdf_generator._adaptive_pdf_page(c, item, index, page_width, page_height)
                     
                     progress.update(95, "PDF 파일 저장 중...")
                     c.save()
@@ -11476,6 +12279,11 @@ class FeedbackCanvasTool:
                 except Exception as e:
                     logger.error(f"적응형 PDF 생성 작업 오류: {e}")
                     return {'error': str(e)}
+                finally:
+                    _discard_page_prefetch()
+                    # 인코딩된 페이지 JPEG 는 이번 내보내기에서만 재사용 (프로세스 내내 쥐고 있지 않음)
+                    _encoded_image_cache.clear()
+                    _ann_image_cache.clear()
             
             def on_pdf_complete(result):
                 progress.close()
@@ -11609,6 +12417,9 @@ class FeedbackCanvasTool:
                 except Exception as e:
                     logger.error(f"PDF 생성 작업 오류: {e}")
                     return {'error': str(e)}
+                finally:
+                    # 주석 이미지 PNG 는 이번 내보내기에서만 재사용
+                    _ann_image_cache.clear()
             
             def on_pdf_complete(result):
                 progress.close()
@@ -11716,15 +12527,21 @@ class FeedbackCanvasTool:
         words = text.split()
         lines = []
         current_line = ""
+        current_width = 0.0
+        space_width = _pdf_string_width(" ", font_name, font_size)
         
         for word in words:
-            test_line = current_line + " " + word if current_line else word
-            if canvas.stringWidth(test_line, font_name, font_size) <= max_width:
-                current_line = test_line
+            # 🔥 줄 전체를 매번 다시 재지 않고 단어 폭을 누적
+            word_width = _pdf_string_width(word, font_name, font_size)
+            test_width = current_width + space_width + word_width if current_line else word_width
+            if test_width <= max_width:
+                current_line = current_line + " " + word if current_line else word
+                current_width = test_width
             else:
                 if current_line:
                     lines.append(current_line)
                 current_line = word
+                current_width = word_width
         
         if current_line:
             lines.append(current_line)
@@ -11777,6 +12594,8 @@ class FeedbackCanvasTool:
             if hasattr(self, 'thread_executor'):
                 self.thread_executor.shutdown()
             
+            _shutdown_page_encode_executor()
+            
             self.undo_manager.clear_all()
             self.clear_selection()
             
@@ -11877,25 +12696,11 @@ class FeedbackCanvasTool:
         
         # 모든 캔버스에서 하이라이트 및 선택 사각형 제거
         try:
-            # 활성 캔버스들에서 제거
+            # 활성 캔버스들에서 제거 (피드백 카드 캔버스는 모두 여기에 등록됨)
             if hasattr(self, 'active_canvases'):
-                for canvas in self.active_canvases:
-                    if canvas.winfo_exists():
-                        canvas.delete('highlight')
-                        canvas.delete('selection_rect')
-            
-            # 현재 피드백 카드의 모든 캔버스에서 제거
-            if hasattr(self, 'scrollable_frame') and self.scrollable_frame.winfo_exists():
-                for widget in self.scrollable_frame.winfo_children():
-                    for child in widget.winfo_children():
-                        if isinstance(child, tk.Frame):
-                            for grandchild in child.winfo_children():
-                                if isinstance(grandchild, tk.Canvas):
-                                    try:
-                                        grandchild.delete('highlight')
-                                        grandchild.delete('selection_rect')
-                                    except:
-                                        pass
+                for canvas in _live_canvases(self.active_canvases):
+                    canvas.delete('highlight')
+                    canvas.delete('selection_rect')
         except Exception as e:
             logger.debug(f"선택 해제 오류: {e}")
             pass
@@ -12016,8 +12821,12 @@ class FeedbackCanvasTool:
             'start_y': 0,
             'current_path': [],
             'temp_objects': [],
-            'debug_mode': '--debug' in sys.argv or os.getenv('DEBUG_MODE') == '1',  # 동적 디버그 모드
-            'last_tool': None
+            'debug_mode': DEBUG,  # 동적 디버그 모드
+            'last_tool': None,
+            'drag_redraw_id': None,  # 드래그 중 예약된 다시 그리기 (after_idle)
+            'hover_index': None,  # hover 검사용 (주석 목록, 스탬프, _build_hit_index 인덱스) 캐시
+            'hover_after_id': None,  # 예약된 hover 검사 (after_idle)
+            'hover_pos': (0, 0)  # 마지막 마우스 좌표
         }
         
         def debug_log(message):
@@ -12034,17 +12843,58 @@ class FeedbackCanvasTool:
                 drawing_state['temp_objects'].clear()
                 debug_log("임시 객체 정리 완료")
             except Exception as e:
-                debug_log(f"임시 객체 정리 오류: {e}")
+                if DEBUG:
+                    debug_log(f"임시 객체 정리 오류: {e}")
                 drawing_state['temp_objects'].clear()
 
+        def do_drag_redraw():
+            """예약된 드래그 다시 그리기 - 유휴 시점에 최신 위치로 한 번만"""
+            drawing_state['drag_redraw_id'] = None
+            try:
+                if canvas.winfo_exists():
+                    # 드래그 중인 주석만 이동 (항목이 없으면 전체 다시 그리기)
+                    dragged = self.dragging_text or getattr(self, 'dragging_image', None)
+                    scale_x, scale_y, _, _ = _item_scale(item, canvas_width, canvas_height)
+                    if dragged and self.move_annotation_items(canvas, dragged, scale_x, scale_y):
+                        return
+                    canvas.delete('annotation')
+                    self.draw_annotations(canvas, item, canvas_width, canvas_height)
+            except Exception as e:
+                if DEBUG:
+                    debug_log(f"드래그 다시 그리기 오류: {e}")
+
+        def invalidate_hover_index(event=None):
+            """hover 인덱스 무효화 - 외부 편집(대화상자 등) 후 다음 hover 때 재생성"""
+            drawing_state['hover_index'] = None
+
+        def get_hover_index():
+            """드래그 가능한 주석(텍스트/이미지)의 화면 영역 인덱스 (_build_hit_index) - 주석 목록/변경 버전/배율이 같으면 재사용"""
+            annotations = item['annotations']
+            sx, sy, _, _ = _item_scale(item, canvas_width, canvas_height)
+            stamp = (len(annotations), item.get('_ann_version', 0), sx, sy)
+            cached = drawing_state['hover_index']
+            if cached and cached[0] is annotations and cached[1] == stamp:
+                return cached[2]
+            
+            index = _build_hit_index(annotations, sx, sy)
+            drawing_state['hover_index'] = (annotations, stamp, index)
+            return index
+
+        def schedule_drag_redraw():
+            """드래그 다시 그리기 예약 - 연속 모션 이벤트를 한 번의 그리기로 병합"""
+            if drawing_state['drag_redraw_id'] is None:
+                drawing_state['drag_redraw_id'] = canvas.after_idle(do_drag_redraw)
+
         def smooth_pen_path(path_points):
             """향상된 펜 경로 손떨림 방지 처리"""
             if not self.pen_smoothing_enabled.get() or len(path_points) < 3:
-                debug_log(f"🎯 스무딩 비활성화 또는 점 부족 - 활성화: {self.pen_smoothing_enabled.get()}, 점 개수: {len(path_points)}")
+                if DEBUG:
+                    debug_log(f"🎯 스무딩 비활성화 또는 점 부족 - 활성화: {self.pen_smoothing_enabled.get()}, 점 개수: {len(path_points)}")
                 return path_points
             
             strength = self.pen_smoothing_strength.get()
-            debug_log(f"🎯 최종 스무딩 처리 시작 - 강도: {strength}, 점 개수: {len(path_points)}")
+            if DEBUG:
+                debug_log(f"🎯 최종 스무딩 처리 시작 - 강도: {strength}, 점 개수: {len(path_points)}")
             smoothed = [path_points[0]]
             
             # 다단계 스무딩 적용
@@ -12122,27 +12972,17 @@ class FeedbackCanvasTool:
             if strength >= 9:
                 ultra_smoothed = [current_points[0]]
                 
+                # 주변 점 범위 (강도에 따라 조정)
+                radius = 2 if strength == 10 else 1
+                
                 # 다점 가중 평균으로 궁극의 부드러움 구현
                 for i in range(1, len(current_points) - 1):
-                    # 주변 점들 수집 (강도에 따라 범위 조정)
-                    radius = 2 if strength == 10 else 1
-                    points_range = []
-                    for j in range(max(0, i-radius), min(len(current_points), i+radius+1)):
-                        points_range.append(current_points[j])
+                    # 주변 점들 수집
+                    points_range = current_points[max(0, i-radius):i+radius+1]
                     
                     if len(points_range) >= 3:
-                        # 가우시안 가중치 적용
-                        if len(points_range) == 5:  # 5점
-                            weights = [0.1, 0.2, 0.4, 0.2, 0.1]
-                        elif len(points_range) == 3:  # 3점
-                            weights = [0.25, 0.5, 0.25]
-                        else:  # 기타
-                            center_idx = len(points_range) // 2
-                            weights = [0.1] * len(points_range)
-                            weights[center_idx] = 0.5
-                            for j in range(len(weights)):
-                                if j != center_idx:
-                                    weights[j] = 0.5 / (len(weights) - 1)
+                        # 가우시안 가중치 적용 (사전 계산된 테이블)
+                        weights = _gen_weights(len(points_range))
                         
                         ultra_x = sum(p[0] * w for p, w in zip(points_range, weights))
                         ultra_y = sum(p[1] * w for p, w in zip(points_range, weights))
@@ -12156,7 +12996,8 @@ class FeedbackCanvasTool:
                     ultra_smoothed.append(current_points[-1])
                 current_points = ultra_smoothed
             
-            debug_log(f"🎯 스무딩 처리 완료 - 최종 점 개수: {len(current_points)}")
+            if DEBUG:
+                debug_log(f"🎯 스무딩 처리 완료 - 최종 점 개수: {len(current_points)}")
             return current_points
 
         def get_annotations_in_selection(x1, y1, x2, y2):
@@ -12169,17 +13010,15 @@ class FeedbackCanvasTool:
                 min_y, max_y = min(y1, y2), max(y1, y2)
                 
                 # 실제 이미지 좌표로 변환
-                scale_x = item['image'].width / canvas_width
-                scale_y = item['image'].height / canvas_height
+                _, _, scale_x, scale_y = _item_scale(item, canvas_width, canvas_height)
                 
                 real_min_x = min_x * scale_x
                 real_max_x = max_x * scale_x
                 real_min_y = min_y * scale_y
                 real_max_y = max_y * scale_y
                 
-                for i, annotation in enumerate(item.get('annotations', [])):
-                    if self.annotation_in_rect(annotation, real_min_x, real_min_y, real_max_x, real_max_y):
-                        selected_indices.append(i)
+                selected_indices = self.annotations_in_rect(
+                    item, real_min_x, real_min_y, real_max_x, real_max_y)
                 
                 return selected_indices
                 
@@ -12189,11 +13028,13 @@ class FeedbackCanvasTool:
 
         def unified_mouse_handler(event):
             """통합 마우스 이벤트 처리기"""
-            debug_log(f"🖱️ 통합 마우스 이벤트: {event.type}, 도구: {self.current_tool}, x={event.x}, y={event.y}")
+            if DEBUG:
+                debug_log(f"🖱️ 통합 마우스 이벤트: {event.type}, 도구: {self.current_tool}, x={event.x}, y={event.y}")
             
             # 현재 항목으로 설정 (항상)
             if self.current_index != index:
-                debug_log(f"현재 항목 변경: {self.current_index} -> {index}")
+                if DEBUG:
+                    debug_log(f"현재 항목 변경: {self.current_index} -> {index}")
                 self.current_index = index
                 self.update_card_borders()  # 카드 테두리 업데이트
                 self.update_status()
@@ -12211,7 +13052,8 @@ class FeedbackCanvasTool:
 
         def handle_button_press(event):
             """마우스 버튼 누름 처리"""
-            debug_log(f"🖱️ 마우스 누름 - 도구: {self.current_tool}")
+            if DEBUG:
+                debug_log(f"🖱️ 마우스 누름 - 도구: {self.current_tool}")
             
             # 선택 도구가 아닌 경우에만 그리기 시작
             if self.current_tool != 'select':
@@ -12226,7 +13068,8 @@ class FeedbackCanvasTool:
                 drawing_state['current_path'] = [(event.x, event.y)]
                 drawing_state['last_tool'] = self.current_tool
                 
-                debug_log(f"그리기 시작 - 도구: {self.current_tool}, 시작점: ({event.x}, {event.y})")
+                if DEBUG:
+                    debug_log(f"그리기 시작 - 도구: {self.current_tool}, 시작점: ({event.x}, {event.y})")
                 
                 # 텍스트 도구는 즉시 처리
                 if self.current_tool == 'text':
@@ -12236,17 +13079,15 @@ class FeedbackCanvasTool:
                 return
             else:
                 # 선택 도구 처리 - 주석 드래그 체크 (텍스트, 이미지 포함)
+                sx, sy, _, _ = _item_scale(item, canvas_width, canvas_height)
                 for annotation in item['annotations']:
                     if annotation['type'] == 'text':
-                        text_x = annotation['x'] * (canvas_width / item['image'].width)
-                        text_y = annotation['y'] * (canvas_height / item['image'].height)
+                        text_x = annotation['x'] * sx
+                        text_y = annotation['y'] * sy
                         text = annotation.get('text', '')
-                        # 원본 폰트 크기 유지 (드래그 감지용)
-                        font_size = annotation.get('font_size', 14)
                         
                         # 텍스트 영역 계산 (anchor='nw' 기준으로 수정)
-                        text_width = max(len(text) * font_size * 0.7, 60)  # 최소 60px 보장, 더 넓게
-                        text_height = max(font_size * 1.5, 25)  # 최소 25px 보장, 더 높게
+                        text_width, text_height = _text_bbox(annotation)
                         
                         # 클릭 영역을 더 크게 하기 위한 마진 추가
                         margin = 15  # 상하좌우 15px 여유 마진
@@ -12264,15 +13105,16 @@ class FeedbackCanvasTool:
                             self.drag_start_y = event.y
                             self.original_text_x = annotation['x']
                             self.original_text_y = annotation['y']
-                            debug_log(f"텍스트 주석 드래그 시작: '{text}' (확장된 클릭 영역)")
+                            if DEBUG:
+                                debug_log(f"텍스트 주석 드래그 시작: '{text}' (확장된 클릭 영역)")
                             return
                     
                     elif annotation['type'] == 'image':
                         # 이미지 주석 드래그 체크
-                        image_x = annotation['x'] * (canvas_width / item['image'].width)
-                        image_y = annotation['y'] * (canvas_height / item['image'].height)
-                        image_width = annotation['width'] * (canvas_width / item['image'].width)
-                        image_height = annotation['height'] * (canvas_height / item['image'].height)
+                        image_x = annotation['x'] * sx
+                        image_y = annotation['y'] * sy
+                        image_width = annotation['width'] * sx
+                        image_height = annotation['height'] * sy
                         
                         # 클릭 영역을 약간 확장
                         margin = 5
@@ -12289,8 +13131,9 @@ class FeedbackCanvasTool:
                             self.drag_start_y = event.y
                             self.original_image_x = annotation['x']
                             self.original_image_y = annotation['y']
-                            debug_log(f"🖼️ 이미지 주석 드래그 시작 - 위치: ({annotation['x']}, {annotation['y']})")
-                            print(f"🖼️ 이미지 주석 드래그 시작 - 위치: ({annotation['x']}, {annotation['y']})")  # 콘솔 출력
+                            if DEBUG:
+                                debug_log(f"🖼️ 이미지 주석 드래그 시작 - 위치: ({annotation['x']}, {annotation['y']})")
+                                print(f"🖼️ 이미지 주석 드래그 시작 - 위치: ({annotation['x']}, {annotation['y']})")  # 콘솔 출력
                             return
                 
                 # 텍스트 드래그가 아닌 경우 영역 선택 모드
@@ -12311,17 +13154,17 @@ class FeedbackCanvasTool:
                     dy = event.y - self.drag_start_y
                     
                     # 이미지 좌표계로 변환
-                    scale_x = item['image'].width / canvas_width
-                    scale_y = item['image'].height / canvas_height
+                    _, _, scale_x, scale_y = _item_scale(item, canvas_width, canvas_height)
                     
                     # 새 위치 계산 (이미지 좌표계)
                     self.dragging_text['x'] = self.original_text_x + (dx * scale_x)
                     self.dragging_text['y'] = self.original_text_y + (dy * scale_y)
+                    _annotations_changed(item)
                     
-                    # 화면 갱신
-                    canvas.delete('annotation')
-                    self.draw_annotations(canvas, item, canvas_width, canvas_height)
-                    debug_log(f"텍스트 드래그 중: dx={dx}, dy={dy}")
+                    # 화면 갱신 (유휴 시점에 병합 처리)
+                    schedule_drag_redraw()
+                    if DEBUG:
+                        debug_log(f"텍스트 드래그 중: dx={dx}, dy={dy}")
                     return
                 
                 # 이미지 주석 드래그 처리
@@ -12331,18 +13174,18 @@ class FeedbackCanvasTool:
                     dy = event.y - self.drag_start_y
                     
                     # 이미지 좌표계로 변환
-                    scale_x = item['image'].width / canvas_width
-                    scale_y = item['image'].height / canvas_height
+                    _, _, scale_x, scale_y = _item_scale(item, canvas_width, canvas_height)
                     
                     # 새 위치 계산 (이미지 좌표계)
                     self.dragging_image['x'] = self.original_image_x + (dx * scale_x)
                     self.dragging_image['y'] = self.original_image_y + (dy * scale_y)
+                    _annotations_changed(item)
                     
-                    # 화면 갱신
-                    canvas.delete('annotation')
-                    self.draw_annotations(canvas, item, canvas_width, canvas_height)
-                    debug_log(f"🖼️ 이미지 드래그 중: dx={dx}, dy={dy}, 새 위치: ({self.dragging_image['x']:.1f}, {self.dragging_image['y']:.1f})")
-                    print(f"🖼️ 이미지 드래그 중: dx={dx}, dy={dy}, 새 위치: ({self.dragging_image['x']:.1f}, {self.dragging_image['y']:.1f})")  # 콘솔 출력
+                    # 화면 갱신 (유휴 시점에 병합 처리)
+                    schedule_drag_redraw()
+                    if DEBUG:
+                        debug_log(f"🖼️ 이미지 드래그 중: dx={dx}, dy={dy}, 새 위치: ({self.dragging_image['x']:.1f}, {self.dragging_image['y']:.1f})")
+                        print(f"🖼️ 이미지 드래그 중: dx={dx}, dy={dy}, 새 위치: ({self.dragging_image['x']:.1f}, {self.dragging_image['y']:.1f})")  # 콘솔 출력
                     return
             
                 if not drawing_state['is_drawing']:
@@ -12391,25 +13234,30 @@ class FeedbackCanvasTool:
                             display_path.append(current_path[0])  # 첫 점은 그대로
                             
                             strength = self.pen_smoothing_strength.get()
-                            debug_log(f"🎨 실시간 스무딩 적용 - 강도: {strength}")
+                            if DEBUG:
+                                debug_log(f"🎨 실시간 스무딩 적용 - 강도: {strength}")
                             
                             # 1-10 범위에 맞춘 실시간 스무딩 팩터 결정
                             if strength >= 9:
                                 # 극도로 부드러움 (9-10)
                                 smooth_factor = 0.4
-                                debug_log(f"🎨 극도로 부드러움 모드 (팩터: {smooth_factor})")
+                                if DEBUG:
+                                    debug_log(f"🎨 극도로 부드러움 모드 (팩터: {smooth_factor})")
                             elif strength >= 7:
                                 # 매우 부드러움 (7-8)
                                 smooth_factor = 0.3
-                                debug_log(f"🎨 매우 부드러움 모드 (팩터: {smooth_factor})")
+                                if DEBUG:
+                                    debug_log(f"🎨 매우 부드러움 모드 (팩터: {smooth_factor})")
                             elif strength >= 5:
                                 # 적당한 부드러움 (5-6)
                                 smooth_factor = 0.2
-                                debug_log(f"🎨 적당한 부드러움 모드 (팩터: {smooth_factor})")
+                                if DEBUG:
+                                    debug_log(f"🎨 적당한 부드러움 모드 (팩터: {smooth_factor})")
                             else:
                                 # 가벼운 보정 (1-4)
                                 smooth_factor = 0.1
-                                debug_log(f"🎨 가벼운 보정 모드 (팩터: {smooth_factor})")
+                                if DEBUG:
+                                    debug_log(f"🎨 가벼운 보정 모드 (팩터: {smooth_factor})")
                             
                             # 중간 점들에 스무딩 적용
                             for i in range(1, len(current_path) - 1):
@@ -12428,10 +13276,8 @@ class FeedbackCanvasTool:
                         
                         # 실시간 미리보기 선 그리기 (빨간색 가이드 선)
                         if len(display_path) > 1:
-                            # 연결된 선으로 그리기 (더 부드럽게)
-                            points = []
-                            for x, y in display_path:
-                                points.extend([x, y])
+                            # 연결된 선으로 그리기 (더 부드럽게) - 평탄 좌표로 한 번에 펼치기
+                            points = [c for point in display_path for c in point]
                             
                             obj_id = canvas.create_line(
                                 points,
@@ -12530,11 +13376,13 @@ class FeedbackCanvasTool:
                     canvas.tag_raise('drawing_temp', 'background')
             
             except Exception as e:
-                debug_log(f"마우스 이동 오류: {e}")
+                if DEBUG:
+                    debug_log(f"마우스 이동 오류: {e}")
 
         def handle_button_release(event):
             """마우스 버튼 놓음 처리 - 주석 실제 추가"""
-            debug_log(f"🖱️ 마우스 놓음 - 도구: {self.current_tool}, 그리기 중: {drawing_state['is_drawing']}")
+            if DEBUG:
+                debug_log(f"🖱️ 마우스 놓음 - 도구: {self.current_tool}, 그리기 중: {drawing_state['is_drawing']}")
             
             # 텍스트 주석 드래그 종료
             if self.dragging_text:
@@ -12559,7 +13407,8 @@ class FeedbackCanvasTool:
                     self.dragging_image['y'] != self.original_image_y):
                     self.undo_manager.save_state(item['id'], item['annotations'])
                     debug_log("🖼️ 이미지 주석 이동 완료 - 상태 저장됨")
-                    print(f"🖼️ 이미지 주석 이동 완료 - 최종 위치: ({self.dragging_image['x']:.1f}, {self.dragging_image['y']:.1f})")  # 콘솔 출력
+                    if DEBUG:
+                        print(f"🖼️ 이미지 주석 이동 완료 - 최종 위치: ({self.dragging_image['x']:.1f}, {self.dragging_image['y']:.1f})")  # 콘솔 출력
                     self.update_status_message("🖼️ 이미지 주석이 이동되었습니다", 2000)
                 
                 self.dragging_image = None
@@ -12593,7 +13442,8 @@ class FeedbackCanvasTool:
                             # 선택된 주석들 하이라이트
                             self.highlight_selected_annotations(canvas, canvas_width, canvas_height)
                             self.update_status_message(f"{len(selected_indices)}개 주석이 선택되었습니다")
-                            debug_log(f"주석 선택 완료: {len(selected_indices)}개")
+                            if DEBUG:
+                                debug_log(f"주석 선택 완료: {len(selected_indices)}개")
                         else:
                             self.update_status_message("선택 영역에 주석이 없습니다")
                             debug_log("선택 영역에 주석 없음")
@@ -12611,28 +13461,16 @@ class FeedbackCanvasTool:
                 annotation_added = False
                 
                 if self.current_tool == 'pen' and len(drawing_state['current_path']) > 1:
-                    debug_log(f"펜 주석 추가 시작 - 점 개수: {len(drawing_state['current_path'])}")
+                    if DEBUG:
+                        debug_log(f"펜 주석 추가 시작 - 점 개수: {len(drawing_state['current_path'])}")
                     annotation_added = add_pen_annotation_direct(
                         drawing_state['current_path'], item, canvas_width, canvas_height
                     )
                     
-                elif self.current_tool == 'arrow':
-                    debug_log("화살표 주석 추가 시작")
-                    annotation_added = add_arrow_annotation_direct(
-                        drawing_state['start_x'], drawing_state['start_y'],
-                        event.x, event.y, item, canvas_width, canvas_height
-                    )
-                    
-                elif self.current_tool == 'line':
-                    debug_log("라인 주석 추가 시작")
-                    annotation_added = add_line_annotation_direct(
-                        drawing_state['start_x'], drawing_state['start_y'],
-                        event.x, event.y, item, canvas_width, canvas_height
-                    )
-                    
-                elif self.current_tool in ['oval', 'rect']:
-                    debug_log(f"{self.current_tool} 주석 추가 시작")
-                    annotation_added = add_shape_annotation_direct(
+                elif self.current_tool in _SHAPE_KEYS:
+                    if DEBUG:
+                        debug_log(f"{self.current_tool} 주석 추가 시작")
+                    annotation_added = add_two_point_annotation_direct(
                         self.current_tool, drawing_state['start_x'], drawing_state['start_y'],
                         event.x, event.y, item, canvas_width, canvas_height
                     )
@@ -12646,21 +13484,21 @@ class FeedbackCanvasTool:
                     canvas.delete('annotation')
                     self.draw_annotations(canvas, item, canvas_width, canvas_height)
                     canvas.tag_lower('background')
-                    debug_log(f"총 주석 개수: {len(item.get('annotations', []))}")
+                    if DEBUG:
+                        debug_log(f"총 주석 개수: {len(item.get('annotations', []))}")
                     self.update_status_message("주석이 추가되었습니다")
                 else:
                     debug_log("❌ 주석 추가 실패")
                     self.update_status_message("주석 추가 실패")
                 
             except Exception as e:
-                debug_log(f"마우스 놓음 처리 오류: {e}")
+                if DEBUG:
+                    debug_log(f"마우스 놓음 처리 오류: {e}")
                 clear_temp_objects()
 
         def handle_text_annotation_immediate(event):
             """즉시 텍스트 주석 처리 - 커스텀 폰트/색상 지원"""
             try:
-                from tkinter import simpledialog
-                
                 # 🔥 개선된 커스텀 텍스트 입력 대화상자
                 text_input = self.show_custom_text_dialog()
                 
@@ -12684,8 +13522,7 @@ class FeedbackCanvasTool:
                         self.undo_manager.save_state(item['id'], item['annotations'])
                         
                         # 이미지 좌표로 변환
-                        scale_x = item['image'].width / canvas_width
-                        scale_y = item['image'].height / canvas_height
+                        _, _, scale_x, scale_y = _item_scale(item, canvas_width, canvas_height)
                         
                         # 🔥 주석 데이터 생성 (커스텀 폰트/색상 포함)
                         annotation = {
@@ -12717,9 +13554,8 @@ class FeedbackCanvasTool:
                     return False
                 
                 # 이미지 좌표로 변환
-                scale_x = item['image'].width / canvas_width
-                scale_y = item['image'].height / canvas_height
-                scaled_points = [(x * scale_x, y * scale_y) for x, y in path_points]
+                _, _, scale_x, scale_y = _item_scale(item, canvas_width, canvas_height)
+                scaled_points = _scale_points(path_points, scale_x, scale_y)
                 
                 # 주석 데이터 생성
                 annotation = {
@@ -12738,97 +13574,36 @@ class FeedbackCanvasTool:
                 debug_log(f"펜 주석 추가 오류: {e}")
                 return False
 
-        def add_arrow_annotation_direct(start_x, start_y, end_x, end_y, item, canvas_width, canvas_height):
-            """화살표 주석 직접 추가"""
-            try:
-                # 최소 거리 확인
-                if abs(end_x - start_x) < 5 and abs(end_y - start_y) < 5:
-                    return False
-                
-                # 이미지 좌표로 변환
-                scale_x = item['image'].width / canvas_width
-                scale_y = item['image'].height / canvas_height
-                
-                # 주석 데이터 생성
-                annotation = {
-                    'type': 'arrow',
-                    'start_x': start_x * scale_x,
-                    'start_y': start_y * scale_y,
-                    'end_x': end_x * scale_x,
-                    'end_y': end_y * scale_y,
-                    'color': self.annotation_color,
-                    'width': self.line_width
-                }
-                
-                # 주석 추가
-                item['annotations'].append(annotation)
-                debug_log(f"화살표 주석 추가 완료")
-                return True
-                
-            except Exception as e:
-                debug_log(f"화살표 주석 추가 오류: {e}")
-                return False
-
-        def add_line_annotation_direct(start_x, start_y, end_x, end_y, item, canvas_width, canvas_height):
-            """라인 주석 직접 추가"""
-            try:
-                # 최소 거리 확인
-                if abs(end_x - start_x) < 5 and abs(end_y - start_y) < 5:
-                    return False
-                
-                # 이미지 좌표로 변환
-                scale_x = item['image'].width / canvas_width
-                scale_y = item['image'].height / canvas_height
-                
-                # 주석 데이터 생성
-                annotation = {
-                    'type': 'line',
-                    'start_x': start_x * scale_x,
-                    'start_y': start_y * scale_y,
-                    'end_x': end_x * scale_x,
-                    'end_y': end_y * scale_y,
-                    'color': self.annotation_color,
-                    'width': self.line_width
-                }
-                
-                # 주석 추가
-                item['annotations'].append(annotation)
-                debug_log(f"라인 주석 추가 완료")
-                return True
-                
-            except Exception as e:
-                debug_log(f"라인 주석 추가 오류: {e}")
-                return False
-
-        def add_shape_annotation_direct(shape_type, x1, y1, x2, y2, item, canvas_width, canvas_height):
-            """도형 주석 직접 추가"""
+        def add_two_point_annotation_direct(kind, x1, y1, x2, y2, item, canvas_width, canvas_height):
+            """두 점 주석(화살표/라인/원형/사각형) 직접 추가 - 좌표 키는 _SHAPE_KEYS 참조"""
             try:
-                # 최소 크기 확인
-                if abs(x2 - x1) < 5 or abs(y2 - y1) < 5:
+                # 최소 크기 확인 (선은 두 축 모두, 도형은 한 축이라도 5px 미만이면 무시)
+                too_small_x = abs(x2 - x1) < 5
+                too_small_y = abs(y2 - y1) < 5
+                if kind in ('oval', 'rect'):
+                    if too_small_x or too_small_y:
+                        return False
+                elif too_small_x and too_small_y:
                     return False
                 
                 # 이미지 좌표로 변환
-                scale_x = item['image'].width / canvas_width
-                scale_y = item['image'].height / canvas_height
+                _, _, scale_x, scale_y = _item_scale(item, canvas_width, canvas_height)
                 
                 # 주석 데이터 생성
-                annotation = {
-                    'type': shape_type,
-                    'x1': x1 * scale_x,
-                    'y1': y1 * scale_y,
-                    'x2': x2 * scale_x,
-                    'y2': y2 * scale_y,
-                    'color': self.annotation_color,
-                    'width': self.line_width
-                }
+                annotation = {'type': kind}
+                annotation.update(zip(_SHAPE_KEYS[kind],
+                                      (x1 * scale_x, y1 * scale_y, x2 * scale_x, y2 * scale_y)))
+                annotation['color'] = self.annotation_color
+                annotation['width'] = self.line_width
                 
                 # 주석 추가
                 item['annotations'].append(annotation)
-                debug_log(f"{shape_type} 주석 추가 완료")
+                if DEBUG:
+                    debug_log(f"{kind} 주석 추가 완료")
                 return True
                 
             except Exception as e:
-                debug_log(f"{shape_type} 주석 추가 오류: {e}")
+                debug_log(f"{kind} 주석 추가 오류: {e}")
                 return False
 
         def handle_key_press(event):
@@ -12871,6 +13646,7 @@ class FeedbackCanvasTool:
                                         if text_content:
                                             annotation['text'] = text_content
                                     
+                                    _annotations_changed(item)
                                     self.refresh_current_item()
             except Exception as e:
                 debug_log(f"키 입력 오류: {e}")
@@ -12889,7 +13665,15 @@ class FeedbackCanvasTool:
             pass
         
         def handle_mouse_motion(event):
-            """마우스 움직임 처리 - 도구별 커서 및 텍스트 주석 hover 효과"""
+            """마우스 움직임 - 최신 좌표만 저장하고 hover 검사는 유휴 시점에 한 번만 실행"""
+            drawing_state['hover_pos'] = (event.x, event.y)
+            if drawing_state['hover_after_id'] is None:
+                drawing_state['hover_after_id'] = canvas.after_idle(do_hover)
+
+        def do_hover():
+            """마우스 움직임 처리 - 도구별 커서 및 텍스트 주석 hover 효과 (마지막 좌표 기준)"""
+            drawing_state['hover_after_id'] = None
+            event_x, event_y = drawing_state['hover_pos']
             try:
                 # 도구별 기본 커서 설정
                 cursor_map = {
@@ -12905,57 +13689,14 @@ class FeedbackCanvasTool:
                 
                 # 선택 도구일 때만 주석 hover 효과 적용
                 if self.current_tool == 'select':
-                    # 드래그 가능한 주석 위에 마우스가 있는지 확인
-                    over_draggable = False
-                    for annotation in item['annotations']:
-                        if annotation['type'] == 'text':
-                            text_x = annotation['x'] * (canvas_width / item['image'].width)
-                            text_y = annotation['y'] * (canvas_height / item['image'].height)
-                            text = annotation.get('text', '')
-                            font_size = annotation.get('font_size', 14)
-                            
-                            # 확장된 클릭 영역 계산 (anchor='nw' 기준)
-                            text_width = max(len(text) * font_size * 0.7, 60)
-                            text_height = max(font_size * 1.5, 25)
-                            margin = 15
-                            # nw 앵커이므로 text_x, text_y가 왼쪽 상단 모서리
-                            click_x1 = text_x - margin
-                            click_y1 = text_y - margin
-                            click_x2 = text_x + text_width + margin
-                            click_y2 = text_y + text_height + margin
-                            
-                            if (click_x1 <= event.x <= click_x2 and
-                                click_y1 <= event.y <= click_y2):
-                                over_draggable = True
-                                break
-                        
-                        elif annotation['type'] == 'image':
-                            # 이미지 주석 호버 감지
-                            image_x = annotation['x'] * (canvas_width / item['image'].width)
-                            image_y = annotation['y'] * (canvas_height / item['image'].height)
-                            image_width = annotation['width'] * (canvas_width / item['image'].width)
-                            image_height = annotation['height'] * (canvas_height / item['image'].height)
-                            
-                            # 클릭 영역을 약간 확장
-                            margin = 5
-                            click_x1 = image_x - margin
-                            click_y1 = image_y - margin
-                            click_x2 = image_x + image_width + margin
-                            click_y2 = image_y + image_height + margin
-                            
-                            if (click_x1 <= event.x <= click_x2 and
-                                click_y1 <= event.y <= click_y2):
-                                over_draggable = True
-                                break
+                    # 드래그 가능한 주석 위에 마우스가 있는지 확인 (격자 셀 후보만 검사)
+                    over_draggable = _hover_hit(get_hover_index(), event_x, event_y)
                     
                     # 드래그 가능한 주석 위에 있으면 손가락 커서, 아니면 기본 커서
-                    if over_draggable:
-                        canvas.configure(cursor='hand2')
-                    else:
-                        canvas.configure(cursor=default_cursor)
+                    _set_cursor(canvas, 'hand2' if over_draggable else default_cursor)
                 else:
                     # 다른 도구들은 해당 도구의 커서 사용
-                    canvas.configure(cursor=default_cursor)
+                    _set_cursor(canvas, default_cursor)
                         
             except Exception as e:
                 pass  # hover 효과는 오류가 나도 계속 동작해야 함
@@ -12964,61 +13705,45 @@ class FeedbackCanvasTool:
             """더블클릭으로 주석 편집"""
             try:
                 if self.current_tool == 'select':
-                    # 클릭한 위치의 주석 찾기
-                    for annotation in item['annotations']:
-                        if annotation['type'] == 'image':
-                            # 이미지 주석 더블클릭 체크
-                            image_x = annotation['x'] * (canvas_width / item['image'].width)
-                            image_y = annotation['y'] * (canvas_height / item['image'].height)
-                            image_width = annotation['width'] * (canvas_width / item['image'].width)
-                            image_height = annotation['height'] * (canvas_height / item['image'].height)
-                            
-                            if (image_x <= event.x <= image_x + image_width and
-                                image_y <= event.y <= image_y + image_height):
-                                self.edit_annotation_image(annotation)
-                                return
+                    # 클릭한 위치의 주석 찾기 (화면 영역 인덱스 일괄 검사)
+                    annotation = _annotation_at(get_hover_index(), event.x, event.y)
+                    if annotation is None:
+                        return
+                    
+                    if annotation['type'] == 'image':
+                        # 이미지 주석 편집
+                        self.edit_annotation_image(annotation)
+                        return
+                    
+                    # 🔥 텍스트 주석 편집 - 기존 값들을 모두 전달
+                    existing_text = annotation.get('text', '')
+                    existing_font_size = annotation.get('font_size', self.font_size)
+                    existing_color = annotation.get('color', self.annotation_color)
+                    existing_bold = annotation.get('bold', False)
+                    
+                    text_input = self.show_custom_text_dialog(
+                        initial_text=existing_text,
+                        initial_font_size=existing_font_size,
+                        initial_color=existing_color,
+                        initial_bold=existing_bold
+                    )
+                    if text_input:
+                        if isinstance(text_input, dict):
+                            # 새로운 형식: 폰트 설정 포함
+                            text_content = text_input.get('text', '').strip()
+                            if text_content:
+                                annotation['text'] = text_content
+                                annotation['font_size'] = text_input.get('font_size', annotation.get('font_size', self.font_size))
+                                annotation['color'] = text_input.get('color', annotation.get('color', self.annotation_color))
+                                annotation['bold'] = text_input.get('bold', annotation.get('bold', False))
+                        elif isinstance(text_input, str):
+                            # 기존 형식: 문자열만
+                            text_content = text_input.strip()
+                            if text_content:
+                                annotation['text'] = text_content
                         
-                        elif annotation['type'] == 'text':
-                            # 텍스트 주석 더블클릭 체크
-                            text_x = annotation['x'] * (canvas_width / item['image'].width)
-                            text_y = annotation['y'] * (canvas_height / item['image'].height)
-                            text = annotation.get('text', '')
-                            font_size = annotation.get('font_size', 14)
-                            
-                            text_width = max(len(text) * font_size * 0.7, 60)
-                            text_height = max(font_size * 1.5, 25)
-                            
-                            if (text_x <= event.x <= text_x + text_width and
-                                text_y <= event.y <= text_y + text_height):
-                                # 🔥 기존 값들을 모두 전달하여 편집
-                                existing_text = annotation.get('text', '')
-                                existing_font_size = annotation.get('font_size', self.font_size)
-                                existing_color = annotation.get('color', self.annotation_color)
-                                existing_bold = annotation.get('bold', False)
-                                
-                                text_input = self.show_custom_text_dialog(
-                                    initial_text=existing_text,
-                                    initial_font_size=existing_font_size,
-                                    initial_color=existing_color,
-                                    initial_bold=existing_bold
-                                )
-                                if text_input:
-                                    if isinstance(text_input, dict):
-                                        # 새로운 형식: 폰트 설정 포함
-                                        text_content = text_input.get('text', '').strip()
-                                        if text_content:
-                                            annotation['text'] = text_content
-                                            annotation['font_size'] = text_input.get('font_size', annotation.get('font_size', self.font_size))
-                                            annotation['color'] = text_input.get('color', annotation.get('color', self.annotation_color))
-                                            annotation['bold'] = text_input.get('bold', annotation.get('bold', False))
-                                    elif isinstance(text_input, str):
-                                        # 기존 형식: 문자열만
-                                        text_content = text_input.strip()
-                                        if text_content:
-                                            annotation['text'] = text_content
-                                    
-                                    self.refresh_current_item()
-                                return
+                        _annotations_changed(item)
+                        self.refresh_current_item()
             except Exception as e:
                 debug_log(f"더블클릭 처리 오류: {e}")
 
@@ -13028,11 +13753,153 @@ class FeedbackCanvasTool:
         canvas.bind('<ButtonRelease-1>', unified_mouse_handler)
         canvas.bind('<Double-Button-1>', handle_double_click)  # 더블클릭 이벤트 추가
         canvas.bind('<Motion>', handle_mouse_motion)  # 마우스 움직임 이벤트 추가
+        canvas.bind('<Enter>', invalidate_hover_index)  # 외부 편집(대화상자 등) 후 hover 인덱스 재생성
         canvas.bind('<KeyPress>', handle_key_press)
         canvas.configure(takefocus=True)
         
         debug_log(f"통합 이벤트 바인딩 완료 - 캔버스: {canvas}")
 
+    def move_annotation_items(self, canvas, annotation, scale_x, scale_y):
+        """위치만 바뀐 주석(텍스트/이미지)의 캔버스 항목을 다시 만들지 않고 이동
+        
+        이 캔버스에 그려진 항목이 남아 있으면 True, 아니면 False (전체 다시 그리기 필요)
+        """
+        drawn = annotation.get('_canvas_ids')
+        if not drawn or drawn[0] != str(canvas) or drawn[2] is None:
+            return False
+        
+        _, item_ids, drawn_x, drawn_y = drawn
+        if not all(canvas.type(item_id) for item_id in item_ids):
+            return False
+        
+        dx = (annotation['x'] - drawn_x) * scale_x
+        dy = (annotation['y'] - drawn_y) * scale_y
+        for item_id in item_ids:
+            canvas.move(item_id, dx, dy)
+        _remember_canvas_items(annotation, canvas, *item_ids)
+        return True
+
+    def render_annotation_image(self, annotation, width, height):
+        """이미지 주석을 화면 표시용 PIL 이미지로 변환 (디코딩 → 반전 → 회전 → 리사이즈 → 투명도 → 아웃라인)"""
+        # 디코딩된 원본 (주석에 캐시됨, 이후 단계는 모두 새 이미지를 만듦)
+        image = _annotation_pil(annotation)
+        
+        # 실시간 미리보기 중에는 빠른 필터, 확정 시 고품질 필터
+        resample = Image.Resampling.BILINEAR if self._interactive else Image.Resampling.LANCZOS
+        
+        # 반전 처리
+        if annotation.get('flip_horizontal', False):
+            image = image.transpose(Image.FLIP_LEFT_RIGHT)
+        if annotation.get('flip_vertical', False):
+            image = image.transpose(Image.FLIP_TOP_BOTTOM)
+        
+        # 회전 처리 (크기 유지 개선)
+        rotation = annotation.get('rotation', 0)
+        if rotation != 0:
+            try:
+                # 이미지를 RGBA 모드로 변환하여 투명도 지원
+                if image.mode != 'RGBA':
+                    image = image.convert('RGBA')
+                
+                # 원본 크기 저장
+                original_size = image.size
+                
+                # 투명 배경으로 회전 (expand=True로 잘림 방지)
+                rotated_image = image.rotate(-rotation, expand=True, fillcolor=(0, 0, 0, 0))
+                
+                # 회전 후 크기와 원본 크기 비율 계산
+                scale_factor = min(
+                    original_size[0] / rotated_image.size[0],
+                    original_size[1] / rotated_image.size[1]
+                )
+                
+                # 회전된 이미지를 원본 크기에 맞게 조정
+                if scale_factor < 1.0:
+                    # 회전으로 인해 크기가 커진 경우, 원본 크기에 맞게 스케일 다운
+                    temp_size = (
+                        int(rotated_image.size[0] * scale_factor),
+                        int(rotated_image.size[1] * scale_factor)
+                    )
+                    scaled_image = rotated_image.resize(temp_size, resample)
+                    
+                    # 원본 크기 캔버스에 중앙 배치
+                    image = Image.new('RGBA', original_size, (0, 0, 0, 0))
+                    paste_x = (original_size[0] - scaled_image.size[0]) // 2
+                    paste_y = (original_size[1] - scaled_image.size[1]) // 2
+                    image.paste(scaled_image, (paste_x, paste_y), scaled_image)
+                else:
+                    # 회전 후에도 원본 크기보다 작은 경우, 중앙에 배치
+                    image = Image.new('RGBA', original_size, (0, 0, 0, 0))
+                    paste_x = (original_size[0] - rotated_image.size[0]) // 2
+                    paste_y = (original_size[1] - rotated_image.size[1]) // 2
+                    image.paste(rotated_image, (paste_x, paste_y), rotated_image)
+                
+                logger.debug(f"이미지 회전 완료 (크기 유지): {rotation}도, 원본={original_size}, 최종={image.size}")
+                
+            except Exception as e:
+                logger.error(f"이미지 회전 오류: {e}")
+                # 폴백: 기본 회전
+            image = image.rotate(-rotation, expand=True)
+        
+        # 크기 조정 (이제 회전 후에도 원본 비율 유지됨)
+        display_image = image.resize((int(width), int(height)), resample)
+        
+        # 투명도 처리
+        opacity = annotation.get('opacity', 100) / 100.0
+        if opacity < 1.0:
+            # RGBA 모드로 변환
+            if display_image.mode != 'RGBA':
+                display_image = display_image.convert('RGBA')
+            # 투명도 적용 (알파 채널만 꺼내 LUT 로 곱하기)
+            alpha = display_image.getchannel('A')
+            alpha = alpha.point(_opacity_lut(opacity))
+            display_image.putalpha(alpha)
+        
+        # 🔥 아웃라인 처리 (흰색 테두리 띠 일괄 채우기)
+        if annotation.get('outline', False):
+            outline_width = annotation.get('outline_width', 3)
+            display_image = _outlined_image(display_image, outline_width)
+        
+        return display_image
+
+    def get_annotation_photo(self, canvas, annotation, width, height, prev_cache):
+        """이미지 주석 PhotoImage - 표시 조건(서명)이 같으면 이전 그리기 결과 재사용
+        
+        prev_cache 는 직전 그리기의 캐시이며, 이번 그리기에서 쓰인 항목만
+        canvas.annotation_image_cache 로 옮겨져 삭제된 주석의 이미지는 자연히 해제된다.
+        캐시에는 id(annotation) → (표시 조건, PhotoImage) 도 함께 기록되어, 표시 조건이 바뀌어도
+        크기가 같으면 그 주석이 쓰던 PhotoImage 에 픽셀만 다시 붙여 넣는다.
+        """
+        cache_key = (
+            annotation['image_data'],
+            annotation.get('flip_horizontal', False),
+            annotation.get('flip_vertical', False),
+            annotation.get('rotation', 0),
+            annotation.get('opacity', 100),
+            int(width), int(height),
+            annotation.get('outline', False),
+            annotation.get('outline_width', 3),
+            self._interactive
+        )
+        photo = canvas.annotation_image_cache.get(cache_key)
+        if photo is None:
+            photo = prev_cache.get(cache_key)
+        if photo is None:
+            display_image = self.render_annotation_image(annotation, width, height)
+            owned_key, owned = prev_cache.get(id(annotation), (None, None))
+            if (owned is not None and
+                    (owned.width(), owned.height()) == display_image.size and
+                    not any(p is owned for p in canvas.annotation_image_cache.values())):
+                # 🔥 같은 크기면 Tk 이미지를 새로 만들지 않고 제자리 갱신
+                prev_cache.pop(owned_key, None)
+                owned.paste(display_image)
+                photo = owned
+            else:
+                photo = ImageTk.PhotoImage(display_image)
+        canvas.annotation_image_cache[cache_key] = photo
+        canvas.annotation_image_cache[id(annotation)] = (cache_key, photo)
+        return photo
+
     def draw_annotations(self, canvas, item, canvas_width, canvas_height):
         """주석 그리기 - 들여쓰기 완전 수정"""
         if not item.get('annotations'):
@@ -13261,19 +14128,14 @@ class FeedbackCanvasTool:
     def update_canvas_size_and_image(self, canvas, item):
         """캔버스 크기와 이미지 업데이트"""
         try:
-            # 현재 캔버스 크기 가져오기
-            canvas.update_idletasks()
-            canvas_width = canvas.winfo_width()
-            canvas_height = canvas.winfo_height()
+            # 현재 캔버스 크기 가져오기 (<Configure> 로 기록된 값)
+            canvas_width, canvas_height = _canvas_size(canvas)
             
             # 이미지 크기에 맞게 캔버스 크기 조정이 필요한지 확인
             image = item['image']
             
             # 이미지를 캔버스에 맞게 스케일링
             if canvas_width > 0 and canvas_height > 0:
-                # 기존 배경 이미지 삭제
-                canvas.delete('background')
-                
                 # 새 이미지를 캔버스에 표시
                 image_ratio = image.width / image.height
                 canvas_ratio = canvas_width / canvas_height
@@ -13287,55 +14149,130 @@ class FeedbackCanvasTool:
                     display_height = canvas_height
                     display_width = int(canvas_height * image_ratio)
                 
-                # 이미지 리사이즈 및 표시 (투명도 지원 개선)
-                display_image = image.resize((display_width, display_height), Image.Resampling.LANCZOS)
-                
-                # RGBA 이미지 처리 개선
-                if display_image.mode == 'RGBA':
-                    # 체커보드 배경 생성
-                    checker_bg = self.create_checker_background(display_width, display_height)
-                    # 투명 이미지를 체커보드 위에 합성
-                    final_image = Image.alpha_composite(checker_bg, display_image)
-                    canvas_image = ImageTk.PhotoImage(final_image)
+                # 🔥 같은 원본/표시 크기면 이전에 만든 배경 PhotoImage 재사용 (주석만 바뀐 새로고침)
+                display_key = (id(image), display_width, display_height)
+                cached = self._display_cache.get(display_key)
+                if cached is not None and cached[0] is image:
+                    self._display_cache.move_to_end(display_key)
+                    canvas_image = cached[1]
                 else:
-                    canvas_image = ImageTk.PhotoImage(display_image)
+                    # 이미지 리사이즈 및 표시 (투명도 지원 개선)
+                    display_image = _display_resize(image, (display_width, display_height))
+                    
+                    # 불투명한 RGBA 는 체커보드 합성 없이 RGB 로 표시
+                    if display_image.mode == 'RGBA' and not _item_has_transparency(item):
+                        display_image = display_image.convert('RGB')
+                    
+                    # RGBA 이미지 처리 개선
+                    if display_image.mode == 'RGBA':
+                        # 체커보드 배경 생성
+                        checker_bg = self.create_checker_background(display_width, display_height)
+                        # 투명 이미지를 체커보드 위에 합성
+                        final_image = _composite_on_checker(checker_bg, display_image)
+                    else:
+                        final_image = display_image
+                    
+                    # 🔥 이 캔버스가 쓰던 배경과 크기가 같으면 PhotoImage 를 새로 만들지 않고 픽셀만 교체
+                    canvas_image = self._reusable_background_photo(canvas, display_width, display_height)
+                    if canvas_image is not None:
+                        canvas_image.paste(final_image)
+                    else:
+                        canvas_image = ImageTk.PhotoImage(final_image)
+                    
+                    self._display_cache[display_key] = (image, canvas_image)
+                    if len(self._display_cache) > 8:
+                        self._display_cache.popitem(last=False)
                 
-                # 캔버스 중앙에 이미지 배치
+                # 캔버스 중앙에 이미지 배치 (기존 배경 아이템이 있으면 위치/이미지만 갱신)
                 x = (canvas_width - display_width) // 2
                 y = (canvas_height - display_height) // 2
-                canvas.create_image(x, y, anchor='nw', image=canvas_image, tags='background')
+                bg_items = canvas.find_withtag('background')
+                if len(bg_items) == 1:
+                    canvas.coords(bg_items[0], x, y)
+                    canvas.itemconfigure(bg_items[0], image=canvas_image)
+                else:
+                    canvas.delete('background')
+                    canvas.create_image(x, y, anchor='nw', image=canvas_image, tags='background')
                 
                 # 이미지 참조 유지 (가비지 컬렉션 방지)
                 canvas.image = canvas_image
+                # 재사용 대상은 이 메서드가 만든 PhotoImage 만 (canvas.image 는 뷰어가 앱 캐시 사진으로 바꿀 수 있음)
+                canvas._bg_photo = canvas_image
                 
                 logger.debug(f"캔버스 이미지 업데이트 완료: {display_width}x{display_height}")
             
         except Exception as e:
             logger.debug(f"캔버스 이미지 업데이트 오류: {e}")
 
+    def _reusable_background_photo(self, canvas, width, height):
+        """캔버스의 현재 배경 PhotoImage 를 같은 크기로 덮어쓸 수 있으면 반환
+        
+        update_canvas_size_and_image 가 만든 canvas._bg_photo 만 대상으로 한다.
+        다른 캔버스가 같은 PhotoImage 를 표시 중이면 None. 재사용하는 사진은 표시 캐시에서 뺀다.
+        """
+        photo = getattr(canvas, '_bg_photo', None)
+        if photo is None:
+            return None
+        try:
+            if photo.width() != width or photo.height() != height:
+                return None
+        except Exception:
+            return None
+        
+        for other in list(self.active_canvases):
+            if other is not canvas and (getattr(other, '_bg_photo', None) is photo
+                                        or getattr(other, 'image', None) is photo):
+                return None
+        
+        for key, (_, cached_photo) in list(self._display_cache.items()):
+            if cached_photo is photo:
+                del self._display_cache[key]
+        return photo
+
     def create_checker_background(self, width, height, checker_size=16):
-        """투명도 표시용 체커보드 배경 생성"""
+        """투명도 표시용 체커보드 배경 생성
+        
+        같은 크기는 최근 8개까지 캐시된 이미지를 그대로 반환한다 (호출부는 합성 입력으로만 사용).
+        """
+        key = (width, height, checker_size)
+        cached = self._checker_cache.get(key)
+        if cached is not None:
+            self._checker_cache.move_to_end(key)
+            return cached
+        
+        checker_bg = self._build_checker_background(width, height, checker_size)
+        self._checker_cache[key] = checker_bg
+        if len(self._checker_cache) > 8:
+            self._checker_cache.popitem(last=False)
+        return checker_bg
+
+    def _build_checker_background(self, width, height, checker_size):
+        """체커보드 배경 이미지 새로 만들기"""
         try:
-            # RGBA 모드로 체커보드 생성
-            checker_bg = Image.new('RGBA', (width, height), (255, 255, 255, 255))
-            
-            # 체커보드 패턴 그리기
-            for y in range(0, height, checker_size):
-                for x in range(0, width, checker_size):
-                    # 격자 패턴으로 회색과 흰색 번갈아가며
-                    if (x // checker_size + y // checker_size) % 2 == 0:
-                        color = (220, 220, 220, 255)  # 연한 회색
-                    else:
-                        color = (255, 255, 255, 255)  # 흰색
-                    
-                    # 실제 체커 사각형 크기 계산
-                    end_x = min(x + checker_size, width)
-                    end_y = min(y + checker_size, height)
-                    
-                    # 픽셀별로 칠하기 (작은 영역이므로 속도 무관)
-                    for py in range(y, end_y):
-                        for px in range(x, end_x):
-                            checker_bg.putpixel((px, py), color)
+            if NUMPY_AVAILABLE:
+                # 🔥 칸 번호 합의 홀짝으로 전체 패턴을 한 번에 계산 (짝수: 연한 회색, 홀수: 흰색)
+                yy = (np.arange(height) // checker_size)[:, None]
+                xx = (np.arange(width) // checker_size)[None, :]
+                mask = ((yy + xx) & 1).astype(bool)
+                checker = np.empty((height, width, 4), dtype=np.uint8)
+                checker[..., :3] = np.where(mask, 255, 220)[..., None]
+                checker[..., 3] = 255
+                return Image.fromarray(checker, 'RGBA')
+            
+            # 2x2 칸 타일 하나만 칠한 뒤 (왼쪽 위/오른쪽 아래가 연한 회색)
+            period = checker_size * 2
+            tile = Image.new('RGBA', (period, period), (255, 255, 255, 255))
+            tile.paste((220, 220, 220, 255), (0, 0, checker_size, checker_size))
+            tile.paste((220, 220, 220, 255), (checker_size, checker_size, period, period))
+            
+            # 🔥 타일을 가로로 이어 한 줄 띠를 만들고, 그 띠를 세로로 반복 붙이기 (넘치는 부분은 paste 가 잘라냄)
+            band = Image.new('RGBA', (width, period))
+            for x in range(0, width, period):
+                band.paste(tile, (x, 0))
+            
+            checker_bg = Image.new('RGBA', (width, height))
+            for y in range(0, height, period):
+                checker_bg.paste(band, (0, y))
             
             return checker_bg
             
@@ -13351,9 +14288,7 @@ class FeedbackCanvasTool:
                 return
             
             item = self.feedback_items[item_index]
-            canvas.update_idletasks()
-            canvas_width = canvas.winfo_width()
-            canvas_height = canvas.winfo_height()
+            canvas_width, canvas_height = _canvas_size(canvas)
             
             # 기존 주석 삭제
             canvas.delete('annotation')
@@ -13361,9 +14296,8 @@ class FeedbackCanvasTool:
             # 주석 다시 그리기
             self.draw_annotations(canvas, item, canvas_width, canvas_height)
             
-            # 맨 뒤로 보내기
+            # 맨 뒤로 보내기 (화면 반영은 Tk 유휴 처리에 맡김)
             canvas.tag_lower('background')
-            canvas.update_idletasks()
             
             logger.debug(f"캔버스 주석 다시 그리기 완료: {item_index}")
             
@@ -13376,58 +14310,11 @@ class FeedbackCanvasTool:
             if not item or not canvas_width or not canvas_height:
                 return
             
-            scale_x = canvas_width / item['image'].width
-            scale_y = canvas_height / item['image'].height
+            scale_x, scale_y, _, _ = _item_scale(item, canvas_width, canvas_height)
             
             for annotation in item['annotations']:
                 try:
-                    ann_type = annotation['type']
-                    if ann_type == 'arrow':
-                        x1 = annotation['start_x'] * scale_x
-                        y1 = annotation['start_y'] * scale_y
-                        x2 = annotation['end_x'] * scale_x
-                        y2 = annotation['end_y'] * scale_y
-                        color = annotation['color']
-                        width = annotation['width']
-                        # 🔥 개선된 화살표 그리기 사용
-                        create_improved_arrow(canvas, x1, y1, x2, y2, color, width, 'annotation')
-                    elif ann_type == 'line':
-                        x1 = annotation['start_x'] * scale_x
-                        y1 = annotation['start_y'] * scale_y
-                        x2 = annotation['end_x'] * scale_x
-                        y2 = annotation['end_y'] * scale_y
-                        color = annotation['color']
-                        width = annotation['width']
-                        canvas.create_line(x1, y1, x2, y2, fill=color, width=width, tags='annotation')
-                    elif ann_type == 'pen':
-                        points = annotation.get('points', [])
-                        if points:
-                            scaled_points = [(x * scale_x, y * scale_y) for x, y in points]
-                            color = annotation['color']
-                            width = annotation['width']
-                            canvas.create_line(scaled_points, fill=color, width=width, tags='annotation', smooth=True)
-                    elif ann_type in ['oval', 'rect']:
-                        x1 = annotation['x1'] * scale_x
-                        y1 = annotation['y1'] * scale_y
-                        x2 = annotation['x2'] * scale_x
-                        y2 = annotation['y2'] * scale_y
-                        color = annotation['color']
-                        width = annotation['width']
-                        if ann_type == 'oval':
-                            canvas.create_oval(x1, y1, x2, y2, outline=color, width=width, tags='annotation')
-                        else:
-                            canvas.create_rectangle(x1, y1, x2, y2, outline=color, width=width, tags='annotation')
-                    
-                    elif ann_type == 'text':
-                        x = annotation['x'] * scale_x
-                        y = annotation['y'] * scale_y
-                        text = annotation.get('text', '')
-                        # 🔥 스케일링된 폰트 크기 적용 - 메인 캔버스와 완전 동일
-                        base_font_size = annotation.get('font_size', 14)
-                        font_size = max(8, int(base_font_size * min(scale_x, scale_y)))
-                        color = annotation['color']
-                        # 🔥 맑은 고딕으로 통일
-                        canvas.create_text(x, y, text=text, font=('맑은 고딕', font_size), fill=color, tags='annotation', anchor='nw')
+                    self._draw_one_annotation(canvas, annotation, scale_x, scale_y)
                 except Exception as e:
                     logger.debug(f"개별 주석 그리기 오류: {e}")
             
@@ -13436,16 +14323,66 @@ class FeedbackCanvasTool:
         except Exception as e:
             logger.debug(f"주석 그리기 전체 오류: {e}")
 
+    def _draw_one_annotation(self, canvas, annotation, scale_x, scale_y):
+        """주석 하나 그리기 - 전체 다시 그리기와 새 주석 추가 시 공용"""
+        ann_type = annotation['type']
+        if ann_type == 'arrow':
+            x1 = annotation['start_x'] * scale_x
+            y1 = annotation['start_y'] * scale_y
+            x2 = annotation['end_x'] * scale_x
+            y2 = annotation['end_y'] * scale_y
+            color = annotation['color']
+            width = annotation['width']
+            # 🔥 개선된 화살표 그리기 사용
+            create_improved_arrow(canvas, x1, y1, x2, y2, color, width, 'annotation', annotation)
+        elif ann_type == 'line':
+            x1 = annotation['start_x'] * scale_x
+            y1 = annotation['start_y'] * scale_y
+            x2 = annotation['end_x'] * scale_x
+            y2 = annotation['end_y'] * scale_y
+            color = annotation['color']
+            width = annotation['width']
+            canvas.create_line(x1, y1, x2, y2, fill=color, width=width, tags='annotation')
+        elif ann_type == 'pen':
+            points = annotation.get('points', [])
+            if points:
+                scaled_points = _pen_coords(annotation, scale_x, scale_y)
+                color = annotation['color']
+                width = annotation['width']
+                canvas.create_line(scaled_points, fill=color, width=width, tags='annotation', smooth=True)
+        elif ann_type in ['oval', 'rect']:
+            x1 = annotation['x1'] * scale_x
+            y1 = annotation['y1'] * scale_y
+            x2 = annotation['x2'] * scale_x
+            y2 = annotation['y2'] * scale_y
+            color = annotation['color']
+            width = annotation['width']
+            if ann_type == 'oval':
+                canvas.create_oval(x1, y1, x2, y2, outline=color, width=width, tags='annotation')
+            else:
+                canvas.create_rectangle(x1, y1, x2, y2, outline=color, width=width, tags='annotation')
+        
+        elif ann_type == 'text':
+            x = annotation['x'] * scale_x
+            y = annotation['y'] * scale_y
+            text = annotation.get('text', '')
+            # 🔥 스케일링된 폰트 크기 적용 - 메인 캔버스와 완전 동일
+            base_font_size = annotation.get('font_size', 14)
+            font_size = max(8, int(base_font_size * min(scale_x, scale_y)))
+            color = annotation['color']
+            # 🔥 맑은 고딕으로 통일
+            text_id = canvas.create_text(x, y, text=text, font=_font_for('맑은 고딕', font_size, False), fill=color, tags='annotation', anchor='nw')
+            _remember_canvas_items(annotation, canvas, text_id)
+
     def add_pen_annotation(self, path_points, item, canvas_width, canvas_height, canvas):
         """펜 주석 추가"""
         try:
             if len(path_points) < 2:
                 return
             
-            scale_x = item['image'].width / canvas_width
-            scale_y = item['image'].height / canvas_height
+            _, _, scale_x, scale_y = _item_scale(item, canvas_width, canvas_height)
             
-            scaled_points = [(x * scale_x, y * scale_y) for x, y in path_points]
+            scaled_points = _scale_points(path_points, scale_x, scale_y)
             
             annotation = {
                 'type': 'pen',
@@ -13471,8 +14408,7 @@ class FeedbackCanvasTool:
             if abs(end_x - start_x) < 5 and abs(end_y - start_y) < 5:
                 return
             
-            scale_x = item['image'].width / canvas_width
-            scale_y = item['image'].height / canvas_height
+            _, _, scale_x, scale_y = _item_scale(item, canvas_width, canvas_height)
             
             annotation = {
                 'type': 'arrow',
@@ -13501,8 +14437,7 @@ class FeedbackCanvasTool:
             if abs(x2 - x1) < 5 or abs(y2 - y1) < 5:
                 return
             
-            scale_x = item['image'].width / cw
-            scale_y = item['image'].height / ch
+            _, _, scale_x, scale_y = _item_scale(item, cw, ch)
             
             annotation = {
                 'type': shape,
@@ -13545,6 +14480,25 @@ class FeedbackCanvasTool:
                        (min_x <= x2 <= max_x and min_y <= y2 <= max_y)
             elif ann_type == 'pen':
                 points = annotation.get('points', [])
+                if not points:
+                    return False
+                
+                # 🔥 획 영역(캐시)으로 먼저 판정 - 겹치지 않거나 통째로 들어가면 점 검사 생략
+                bx1, by1, bx2, by2 = _pen_bbox(annotation)
+                if bx2 < min_x or bx1 > max_x or by2 < min_y or by1 > max_y:
+                    return False
+                if min_x <= bx1 and bx2 <= max_x and min_y <= by1 and by2 <= max_y:
+                    return True
+                
+                if NUMBA_AVAILABLE and len(points) >= 32:
+                    # 첫 적중에서 멈추는 JIT 루프 (긴 획 드래그 선택용)
+                    return bool(_pen_hits_rect(_pen_points_array(annotation), min_x, min_y, max_x, max_y))
+                if NUMPY_AVAILABLE and len(points) >= 32:
+                    # 모든 점을 한 번에 비교
+                    pts = _pen_points_array(annotation)
+                    xs, ys = pts[:, 0], pts[:, 1]
+                    return bool(((xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y)).any())
+                
                 for x, y in points:
                     if min_x <= x <= max_x and min_y <= y <= max_y:
                         return True
@@ -13556,11 +14510,8 @@ class FeedbackCanvasTool:
                        (min_x <= x2 <= max_x and min_y <= y2 <= max_y)
             elif ann_type == 'text':
                 x, y = annotation['x'], annotation['y']
-                text = annotation.get('text', '')
-                font_size = annotation.get('font_size', 14)
                 # 텍스트 영역 계산 (anchor='nw' 기준, 클릭 영역과 동일하게)
-                text_width = max(len(text) * font_size * 0.7, 60)
-                text_height = max(font_size * 1.5, 25)
+                text_width, text_height = _text_bbox(annotation)
                 margin = 15
                 # nw 앵커 기준으로 확장된 영역에서의 교차 검사
                 return not (x + text_width + margin < min_x or x - margin > max_x or 
@@ -13577,6 +14528,88 @@ class FeedbackCanvasTool:
             logger.debug(f"주석 영역 확인 오류: {e}")
             return False
 
+    def build_annotation_soa(self, item):
+        """항목의 주석 리스트(AoS)를 NumPy 컬럼 배열(SoA)로 변환 - 주석이 바뀌지 않았으면 항목에 캐시된 컬럼 재사용
+        
+        type 코드: 1 = 두 점(arrow/line/oval/rect, (x, y)~(x+w, y+h)),
+                   2 = 사각 영역(text/image), 0 = 개별 검사(pen 등)
+        item['_ann_soa'] = (주석 목록, (길이, 변경 버전), 컬럼) - 목록은 객체 동일성으로 비교
+        """
+        annotations = item.get('annotations', [])
+        stamp = (len(annotations), item.get('_ann_version', 0))
+        cached = item.get('_ann_soa')
+        if cached and cached[0] is annotations and cached[1] == stamp:
+            return cached[2]
+        
+        n = len(annotations)
+        xs = np.zeros(n)
+        ys = np.zeros(n)
+        ws = np.zeros(n)
+        hs = np.zeros(n)
+        kinds = np.zeros(n, dtype='u1')
+        
+        for i, annotation in enumerate(annotations):
+            try:
+                ann_type = annotation.get('type')
+                if ann_type in ('arrow', 'line'):
+                    x1, y1 = annotation['start_x'], annotation['start_y']
+                    x2, y2 = annotation['end_x'], annotation['end_y']
+                    xs[i], ys[i], ws[i], hs[i], kinds[i] = x1, y1, x2 - x1, y2 - y1, 1
+                elif ann_type in ('oval', 'rect'):
+                    x1, y1 = annotation['x1'], annotation['y1']
+                    x2, y2 = annotation['x2'], annotation['y2']
+                    xs[i], ys[i], ws[i], hs[i], kinds[i] = x1, y1, x2 - x1, y2 - y1, 1
+                elif ann_type == 'text':
+                    # annotation_in_rect 와 동일한 텍스트 영역 (여백 15 포함)
+                    text_width, text_height = _text_bbox(annotation)
+                    margin = 15
+                    xs[i], ys[i] = annotation['x'] - margin, annotation['y'] - margin
+                    ws[i], hs[i] = text_width + 2 * margin, text_height + 2 * margin
+                    kinds[i] = 2
+                elif ann_type == 'image':
+                    xs[i], ys[i] = annotation['x'], annotation['y']
+                    ws[i], hs[i] = annotation['width'], annotation['height']
+                    kinds[i] = 2
+            except (KeyError, TypeError, AttributeError):
+                kinds[i] = 0
+        
+        soa = {'x': xs, 'y': ys, 'w': ws, 'h': hs, 'type': kinds}
+        item['_ann_soa'] = (annotations, stamp, soa)
+        return soa
+
+    def annotations_in_rect(self, item, min_x, min_y, max_x, max_y):
+        """항목에서 사각형 영역 안에 있는 주석 인덱스 목록 (NumPy 사용 시 캐시된 컬럼으로 일괄 검사)"""
+        annotations = item.get('annotations', [])
+        if not annotations:
+            return []
+        if not NUMPY_AVAILABLE:
+            return [i for i, annotation in enumerate(annotations)
+                    if self.annotation_in_rect(annotation, min_x, min_y, max_x, max_y)]
+        
+        try:
+            soa = self.build_annotation_soa(item)
+            xs, ys, kinds = soa['x'], soa['y'], soa['type']
+            xe, ye = xs + soa['w'], ys + soa['h']
+            
+            # 두 점 타입: 시작점 또는 끝점이 영역 안
+            start_in = (xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y)
+            end_in = (xe >= min_x) & (xe <= max_x) & (ye >= min_y) & (ye <= max_y)
+            # 사각 영역 타입: 교차 여부
+            overlap = ~((xe < min_x) | (xs > max_x) | (ye < min_y) | (ys > max_y))
+            
+            hits = ((kinds == 1) & (start_in | end_in)) | ((kinds == 2) & overlap)
+            
+            # pen 등 가변 길이 주석은 기존 방식으로 개별 검사
+            for i in np.flatnonzero(kinds == 0):
+                if self.annotation_in_rect(annotations[i], min_x, min_y, max_x, max_y):
+                    hits[i] = True
+            
+            return np.flatnonzero(hits).tolist()
+        except Exception as e:
+            logger.debug(f"주석 일괄 영역 확인 오류: {e}")
+            return [i for i, annotation in enumerate(annotations)
+                    if self.annotation_in_rect(annotation, min_x, min_y, max_x, max_y)]
+
     def highlight_selected_annotations(self, canvas, canvas_width, canvas_height):
         """선택된 주석들을 하이라이트 표시"""
         try:
@@ -13588,8 +14621,7 @@ class FeedbackCanvasTool:
             if not (0 <= self.current_index < len(self.feedback_items)):
                 return
             item = self.feedback_items[self.current_index]
-            scale_x = canvas_width / item['image'].width
-            scale_y = canvas_height / item['image'].height
+            scale_x, scale_y, _, _ = _item_scale(item, canvas_width, canvas_height)
             # 선택된 각 주석에 대해 하이라이트 그리기
             for annotation in self.selected_annotations:
                 try:
@@ -13622,16 +14654,12 @@ class FeedbackCanvasTool:
                     elif ann_type == 'pen':
                         points = annotation.get('points', [])
                         if points:
-                            # 펜 경로의 바운딩 박스 계산
-                            scaled_points = [(x * scale_x, y * scale_y) for x, y in points]
-                            min_x = min(p[0] for p in scaled_points)
-                            max_x = max(p[0] for p in scaled_points)
-                            min_y = min(p[1] for p in scaled_points)
-                            max_y = max(p[1] for p in scaled_points)
+                            # 펜 경로의 바운딩 박스 (이미지 좌표, 캐시) 를 화면 좌표로
+                            min_x, min_y, max_x, max_y = _pen_bbox(annotation)
                             margin = 10
                             canvas.create_rectangle(
-                                min_x - margin, min_y - margin,
-                                max_x + margin, max_y + margin,
+                                min_x * scale_x - margin, min_y * scale_y - margin,
+                                max_x * scale_x + margin, max_y * scale_y + margin,
                                 outline='lime', width=3, dash=(3, 3), tags='highlight'
                             )
                     elif ann_type in ['oval', 'rect']:
@@ -13648,12 +14676,8 @@ class FeedbackCanvasTool:
                     elif ann_type == 'text':
                         x = annotation['x'] * scale_x
                         y = annotation['y'] * scale_y
-                        text = annotation.get('text', '')
-                        # 원본 폰트 크기 유지 (하이라이트용)
-                        font_size = annotation.get('font_size', 14)
                         # 텍스트 크기 추정 (anchor='nw' 기준, 클릭 영역과 동일하게)
-                        text_width = max(len(text) * font_size * 0.7, 60)
-                        text_height = max(font_size * 1.5, 25)
+                        text_width, text_height = _text_bbox(annotation)
                         margin = 15  # 클릭 영역과 동일한 마진
                         canvas.create_rectangle(
                             x - margin, y - margin,
@@ -13694,30 +14718,20 @@ class FeedbackCanvasTool:
             # 실행 취소를 위한 상태 저장
             self.undo_manager.save_state(item['id'], item['annotations'])
             
-            # 선택된 주석들을 annotations 리스트에서 제거
+            # 선택된 주석들을 annotations 리스트에서 제거 (객체 식별자로 비교 - 내용이 같은 다른 주석은 유지)
             original_count = len(item['annotations'])
-            item['annotations'] = [ann for ann in item['annotations'] if ann not in self.selected_annotations]
+            selected_ids = {id(ann) for ann in self.selected_annotations}
+            item['annotations'] = [ann for ann in item['annotations'] if id(ann) not in selected_ids]
             deleted_count = original_count - len(item['annotations'])
             
             # 선택 해제 (선택 사각형 포함)
             self.clear_selection()
             
-            # 모든 캔버스에서 선택 관련 요소 강제 제거
-            try:
-                if hasattr(self, 'scrollable_frame') and self.scrollable_frame.winfo_exists():
-                    for widget in self.scrollable_frame.winfo_children():
-                        for child in widget.winfo_children():
-                            if isinstance(child, tk.Frame):
-                                for grandchild in child.winfo_children():
-                                    if isinstance(grandchild, tk.Canvas):
-                                        try:
-                                            grandchild.delete('highlight')
-                                            grandchild.delete('selection_rect')
-                                            grandchild.delete('drawing_temp')
-                                        except:
-                                            pass
-            except:
-                pass
+            # 모든 캔버스에서 선택 관련 요소 강제 제거 (등록된 활성 캔버스만 순회)
+            for canvas in _live_canvases(self.active_canvases):
+                canvas.delete('highlight')
+                canvas.delete('selection_rect')
+                canvas.delete('drawing_temp')
             
             # 화면 새로고침
             self.refresh_current_item()
@@ -13732,64 +14746,128 @@ class FeedbackCanvasTool:
             self.update_status_message("주석 삭제 중 오류가 발생했습니다")
 
     def edit_annotation_image(self, annotation):
-        """이미지 주석 편집 다이얼로그 (실시간 반영)"""
+        """이미지 주석 편집 다이얼로그 (실시간 반영)
+        
+        다이얼로그는 처음 한 번만 만들고, 닫을 때 숨겨 두었다가 다음 편집 때 값만 채워 다시 보여준다.
+        """
+        editor = self._image_edit_dialog
+        if editor is None or not editor['dialog'].winfo_exists():
+            editor = self._build_image_edit_dialog()
+            self._image_edit_dialog = editor
+        editor['open'](annotation)
+
+    def _build_image_edit_dialog(self):
+        """이미지 주석 편집 다이얼로그 위젯 생성 - {'dialog': Toplevel, 'open': open_dialog(annotation)}"""
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()  # 값을 채운 뒤 open_dialog 에서 표시
         dialog.title("이미지 주석 편집 - 실시간 미리보기")
         
         # 🔥 아이콘 설정
         setup_window_icon(dialog)
         
-        dialog.geometry("420x650")
+        dialog_width, dialog_height = 420, 650
+        dialog.geometry(f"{dialog_width}x{dialog_height}")
         dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # 중앙 정렬
-        dialog.update_idletasks()
-        x = self.root.winfo_x() + (self.root.winfo_width() - dialog.winfo_width()) // 2
-        y = self.root.winfo_y() + (self.root.winfo_height() - dialog.winfo_height()) // 2
-        dialog.geometry(f"+{x}+{y}")
         
         main_frame = tk.Frame(dialog, padx=20, pady=20, bg='white')
         main_frame.pack(fill=tk.BOTH, expand=True)
         
-        # 실시간 업데이트를 위한 변수들 저장
-        original_values = {
-            'width': annotation['width'],
-            'height': annotation['height'],
-            'opacity': annotation.get('opacity', 100),
-            'outline': annotation.get('outline', False),
-            'outline_width': annotation.get('outline_width', 3),
-            'flip_horizontal': annotation.get('flip_horizontal', False),
-            'flip_vertical': annotation.get('flip_vertical', False),
-            'rotation': annotation.get('rotation', 0)
+        # 편집 중인 주석과 열 때의 원래 값 (open_dialog 마다 교체)
+        # loading: open_dialog 가 변수를 채우는 중 - trace 로 인한 비율 보정/반영 예약 무시
+        edit_state = {
+            'annotation': None,
+            'original_values': {},
+            'original_width': 1,
+            'original_height': 1,
+            'original_ratio': 1.0,
+            'loading': False
         }
         
+        # 🔥 입력이 멈추면 고품질(LANCZOS)로 한 번 더 그리기
+        # apply_id: 예약된 실시간 반영 (연속 입력은 마지막 것 하나만 남김)
+        # gen: 예약 세대 번호 (최신 예약만 실행), applied: 마지막으로 반영한 값 (같은 상태 재렌더링 방지)
+        # applied 는 open_dialog 에서 원래 값으로 시작 - 초기 set 으로 들어온 같은 값은 그리지 않음
+        preview_state = {'settle_id': None, 'apply_id': None, 'gen': 0, 'applied': None}
+        
+        def settle_preview_quality():
+            """미리보기 종료 후 고품질로 다시 그리기"""
+            preview_state['settle_id'] = None
+            if self._interactive:
+                self._interactive = False
+                self.schedule_current_item_refresh()
+        
         # 실시간 업데이트 함수
         def apply_realtime_changes():
             """변경사항을 실시간으로 적용"""
+            annotation = edit_state['annotation']
+            if annotation is None:
+                return
             try:
+                values = {
+                    'width': width_var.get(),
+                    'height': height_var.get(),
+                    'opacity': opacity_var.get(),
+                    'outline': outline_var.get(),
+                    'outline_width': outline_width_var.get(),
+                    'flip_horizontal': flip_h_var.get(),
+                    'flip_vertical': flip_v_var.get(),
+                    'rotation': rotation_var.get()
+                }
+                # 🔥 이미 반영한 상태와 같으면 다시 그리지 않음 (체크박스 + Spinbox command + trace 중복 호출)
+                if values == preview_state['applied']:
+                    return
+                preview_state['applied'] = values
+                
                 # 변경사항을 annotation에 즉시 적용
-                annotation['width'] = width_var.get()
-                annotation['height'] = height_var.get()
-                annotation['opacity'] = opacity_var.get()
-                annotation['outline'] = outline_var.get()
-                annotation['outline_width'] = outline_width_var.get()
-                annotation['flip_horizontal'] = flip_h_var.get()
-                annotation['flip_vertical'] = flip_v_var.get()
-                annotation['rotation'] = rotation_var.get()
-                
-                # 현재 화면 즉시 새로고침
-                self.refresh_current_item()
+                annotation.update(values)
+                
+                # 🔥 현재 화면 새로고침 예약 (연속 변경은 유휴 시점에 한 번만, 미리보기 중에는 빠른 리샘플링)
+                self._interactive = True
+                self.schedule_current_item_refresh()
+                
+                if preview_state['settle_id'] is not None:
+                    self.root.after_cancel(preview_state['settle_id'])
+                preview_state['settle_id'] = self.root.after(300, settle_preview_quality)
                 
             except Exception as e:
                 print(f"실시간 업데이트 오류: {e}")
         
+        def schedule_realtime_changes(delay=80):
+            """실시간 반영 예약 - 이전 예약을 취소하고 마지막 변경만 한 번 반영 (디바운스)"""
+            if edit_state['loading']:
+                return
+            if preview_state['apply_id'] is not None:
+                dialog.after_cancel(preview_state['apply_id'])
+            preview_state['gen'] += 1
+            generation = preview_state['gen']
+            preview_state['apply_id'] = dialog.after(delay, lambda: run_scheduled_changes(generation))
+        
+        def run_scheduled_changes(generation):
+            # 이후에 다시 예약/취소되었으면 이 호출은 오래된 것이므로 무시
+            if generation != preview_state['gen']:
+                return
+            preview_state['apply_id'] = None
+            apply_realtime_changes()
+        
+        def cancel_scheduled_changes():
+            """예약된 실시간 반영 취소 - 반영 여부 반환"""
+            preview_state['gen'] += 1
+            if preview_state['apply_id'] is None:
+                return False
+            dialog.after_cancel(preview_state['apply_id'])
+            preview_state['apply_id'] = None
+            return True
+        
         # 원래 값으로 되돌리는 함수
         def restore_original_values():
             """취소 시 원래 값으로 복원"""
+            annotation = edit_state['annotation']
+            original_values = edit_state['original_values']
             for key, value in original_values.items():
                 annotation[key] = value
-            self.refresh_current_item()
+            preview_state['applied'] = dict(original_values)
+            self._interactive = False
+            self.schedule_current_item_refresh()
         
         # 크기 조정
         size_frame = tk.LabelFrame(main_frame, text="크기", bg='white', 
@@ -13800,12 +14878,12 @@ class FeedbackCanvasTool:
         size_inner.pack(padx=10, pady=10)
         
         tk.Label(size_inner, text="너비:", bg='white').grid(row=0, column=0, sticky='e', padx=5)
-        width_var = tk.IntVar(value=annotation['width'])
+        width_var = tk.IntVar()
         width_spin = tk.Spinbox(size_inner, from_=10, to=2000, textvariable=width_var, width=10)
         width_spin.grid(row=0, column=1, padx=5)
         
         tk.Label(size_inner, text="높이:", bg='white').grid(row=1, column=0, sticky='e', padx=5)
-        height_var = tk.IntVar(value=annotation['height'])
+        height_var = tk.IntVar()
         height_spin = tk.Spinbox(size_inner, from_=10, to=2000, textvariable=height_var, width=10)
         height_spin.grid(row=1, column=1, padx=5)
         
@@ -13823,23 +14901,14 @@ class FeedbackCanvasTool:
         button_frame = tk.Frame(quick_size_frame, bg='white')
         button_frame.pack(fill=tk.X, pady=5)
         
-        # 원본 크기 저장 (최초 이미지 크기)
-        original_width = annotation.get('original_width', annotation['width'])
-        original_height = annotation.get('original_height', annotation['height'])
-        annotation['original_width'] = original_width
-        annotation['original_height'] = original_height
-        
-        # 원본 비율 저장
-        original_ratio = original_width / original_height
-        
         def resize_to_percent(percent):
             """지정된 퍼센트로 크기 조정 (실시간 반영)"""
-            new_width = int(original_width * percent / 100)
-            new_height = int(original_height * percent / 100)
+            new_width = int(edit_state['original_width'] * percent / 100)
+            new_height = int(edit_state['original_height'] * percent / 100)
             width_var.set(new_width)
             height_var.set(new_height)
             # 실시간 반영
-            dialog.after(10, apply_realtime_changes)
+            schedule_realtime_changes(10)
         
         # 크기 조정 버튼들
         tk.Button(button_frame, text="25%", command=lambda: resize_to_percent(25),
@@ -13854,18 +14923,22 @@ class FeedbackCanvasTool:
                  bg='lightblue', relief='groove', width=6).pack(side=tk.LEFT, padx=2)
         
         def on_width_change():
+            if edit_state['loading']:
+                return
             if maintain_ratio.get():
-                new_height = int(width_var.get() / original_ratio)
+                new_height = int(width_var.get() / edit_state['original_ratio'])
                 height_var.set(new_height)
             # 실시간 반영
-            dialog.after(100, apply_realtime_changes)
+            schedule_realtime_changes()
         
         def on_height_change():
+            if edit_state['loading']:
+                return
             if maintain_ratio.get():
-                new_width = int(height_var.get() * original_ratio)
+                new_width = int(height_var.get() * edit_state['original_ratio'])
                 width_var.set(new_width)
             # 실시간 반영
-            dialog.after(100, apply_realtime_changes)
+            schedule_realtime_changes()
         
         # 변수 변경 추적으로 실시간 비율 유지 및 반영
         width_var.trace('w', lambda *args: on_width_change())
@@ -13876,14 +14949,14 @@ class FeedbackCanvasTool:
                                      font=self.font_manager.ui_font)
         opacity_frame.pack(fill=tk.X, pady=(0, 15))
         
-        opacity_var = tk.IntVar(value=annotation.get('opacity', 100))
-        opacity_label = tk.Label(opacity_frame, text=f"{opacity_var.get()}%", bg='white')
+        opacity_var = tk.IntVar(value=100)
+        opacity_label = tk.Label(opacity_frame, text="100%", bg='white')
         opacity_label.pack()
         
         def update_opacity_label(value):
             opacity_label.config(text=f"{int(float(value))}%")
             # 실시간 반영
-            dialog.after(50, apply_realtime_changes)
+            schedule_realtime_changes()
         
         opacity_scale = tk.Scale(opacity_frame, from_=0, to=100, orient=tk.HORIZONTAL,
                                 variable=opacity_var, command=update_opacity_label,
@@ -13899,24 +14972,24 @@ class FeedbackCanvasTool:
         outline_inner = tk.Frame(outline_frame, bg='white')
         outline_inner.pack(padx=10, pady=10)
         
-        outline_var = tk.BooleanVar(value=annotation.get('outline', False))
+        outline_var = tk.BooleanVar()
         
         def on_outline_change():
-            dialog.after(50, apply_realtime_changes)
+            schedule_realtime_changes()
         
         def on_outline_width_change():
-            dialog.after(100, apply_realtime_changes)
+            schedule_realtime_changes()
         
         tk.Checkbutton(outline_inner, text="흰색 아웃라인 사용", variable=outline_var,
                        bg='white', command=on_outline_change).pack(anchor='w')
         
         tk.Label(outline_inner, text="두께:", bg='white').pack(side=tk.LEFT, padx=(20, 5))
-        outline_width_var = tk.IntVar(value=annotation.get('outline_width', 3))
+        outline_width_var = tk.IntVar(value=3)
         outline_width_spin = tk.Spinbox(outline_inner, from_=1, to=10, textvariable=outline_width_var,
                                        width=5, command=on_outline_width_change)
         outline_width_spin.pack(side=tk.LEFT)
         
-        # outline_width_var 변경 추적
+        # outline_width_var 변경 추적 (직접 입력용 - Spinbox command 와 같은 예약으로 합쳐짐)
         outline_width_var.trace('w', lambda *args: on_outline_width_change())
         
         # 변형
@@ -13927,14 +15000,14 @@ class FeedbackCanvasTool:
         transform_inner = tk.Frame(transform_frame, bg='white')
         transform_inner.pack(padx=10, pady=10)
         
-        flip_h_var = tk.BooleanVar(value=annotation.get('flip_horizontal', False))
-        flip_v_var = tk.BooleanVar(value=annotation.get('flip_vertical', False))
+        flip_h_var = tk.BooleanVar()
+        flip_v_var = tk.BooleanVar()
         
         def on_flip_change():
-            dialog.after(50, apply_realtime_changes)
+            schedule_realtime_changes()
         
         def on_rotation_change():
-            dialog.after(100, apply_realtime_changes)
+            schedule_realtime_changes()
         
         tk.Checkbutton(transform_inner, text="좌우 반전", variable=flip_h_var,
                        bg='white', command=on_flip_change).pack(anchor='w')
@@ -13946,19 +15019,15 @@ class FeedbackCanvasTool:
         rotation_frame.pack(fill=tk.X, pady=(10, 0))
         
         tk.Label(rotation_frame, text="회전 각도:", bg='white').pack(side=tk.LEFT, padx=(0, 5))
-        rotation_var = tk.IntVar(value=annotation.get('rotation', 0))
+        rotation_var = tk.IntVar()
         rotation_spin = tk.Spinbox(rotation_frame, from_=-180, to=180, textvariable=rotation_var,
                                   width=5, command=on_rotation_change)
         rotation_spin.pack(side=tk.LEFT)
         tk.Label(rotation_frame, text="도", bg='white').pack(side=tk.LEFT)
         
-        # rotation_var 변경 추적
+        # rotation_var 변경 추적 (직접 입력용 - Spinbox command 와 같은 예약으로 합쳐짐)
         rotation_var.trace('w', lambda *args: on_rotation_change())
         
-        # 실행 취소를 위한 상태 저장 (편집 시작 시)
-        current_item = self.feedback_items[self.current_index]
-        self.undo_manager.save_state(current_item['id'], current_item['annotations'])
-        
         # 실시간 미리보기 상태 표시
         status_frame = tk.Frame(main_frame, bg='lightblue', relief='raised', bd=1)
         status_frame.pack(fill=tk.X, pady=(10, 10))
@@ -13973,22 +15042,27 @@ class FeedbackCanvasTool:
         
         def apply_and_close():
             """변경사항을 확정하고 다이얼로그 닫기"""
-            dialog.destroy()
+            # 아직 반영되지 않은 마지막 입력은 닫기 전에 반영
+            if cancel_scheduled_changes():
+                apply_realtime_changes()
+            hide_dialog()
             self.update_status_message("이미지 주석이 수정되었습니다")
         
         def cancel_and_restore():
             """변경사항을 취소하고 원래 값으로 복원"""
+            cancel_scheduled_changes()
             restore_original_values()
-            dialog.destroy()
+            hide_dialog()
             self.update_status_message("이미지 편집이 취소되었습니다")
         
-        # 버튼 스타일
-        button_style = {
-            'font': ('Arial', 10, 'bold'),
-            'relief': 'flat',
-            'height': 2,
-            'cursor': 'hand2'
-        }
+        def hide_dialog():
+            """다이얼로그 숨기기 (위젯은 다음 편집 때 재사용)"""
+            dialog.grab_release()
+            dialog.withdraw()
+            edit_state['annotation'] = None
+        
+        # 버튼 스타일 (앱 초기화 때 만든 공용 스타일)
+        button_style = self.button_styles['dialog_action']
         
         # 취소 버튼
         cancel_btn = tk.Button(button_frame, text="❌ 취소", command=cancel_and_restore,
@@ -14000,51 +15074,105 @@ class FeedbackCanvasTool:
                              bg='#4CAF50', fg='white', width=12, **button_style)
         apply_btn.pack(side=tk.RIGHT)
         
-        # Esc 키로 취소
+        # Esc 키로 취소, 창 닫기는 (이전처럼) 변경사항 유지
         dialog.bind('<Escape>', lambda e: cancel_and_restore())
+        dialog.protocol('WM_DELETE_WINDOW', apply_and_close)
+        
+        def open_dialog(annotation):
+            """편집할 주석의 값으로 위젯을 채우고 다이얼로그 표시"""
+            # 원본 크기 저장 (최초 이미지 크기)
+            original_width = annotation.get('original_width', annotation['width'])
+            original_height = annotation.get('original_height', annotation['height'])
+            annotation['original_width'] = original_width
+            annotation['original_height'] = original_height
+            
+            # 실시간 업데이트를 위한 원래 값 저장
+            original_values = {
+                'width': annotation['width'],
+                'height': annotation['height'],
+                'opacity': annotation.get('opacity', 100),
+                'outline': annotation.get('outline', False),
+                'outline_width': annotation.get('outline_width', 3),
+                'flip_horizontal': annotation.get('flip_horizontal', False),
+                'flip_vertical': annotation.get('flip_vertical', False),
+                'rotation': annotation.get('rotation', 0)
+            }
+            edit_state.update(annotation=annotation, original_values=original_values,
+                              original_width=original_width, original_height=original_height,
+                              original_ratio=original_width / original_height)
+            preview_state['applied'] = dict(original_values)
+            
+            # 위젯 값 채우기 (trace 가 비율 보정이나 반영 예약을 하지 않도록)
+            edit_state['loading'] = True
+            try:
+                width_var.set(original_values['width'])
+                height_var.set(original_values['height'])
+                maintain_ratio.set(True)
+                opacity_var.set(original_values['opacity'])
+                outline_var.set(original_values['outline'])
+                outline_width_var.set(original_values['outline_width'])
+                flip_h_var.set(original_values['flip_horizontal'])
+                flip_v_var.set(original_values['flip_vertical'])
+                rotation_var.set(original_values['rotation'])
+            finally:
+                edit_state['loading'] = False
+            opacity_label.config(text=f"{original_values['opacity']}%")
+            
+            # 실행 취소를 위한 상태 저장 (편집 시작 시)
+            current_item = self.feedback_items[self.current_index]
+            self.undo_manager.save_state(current_item['id'], current_item['annotations'])
+            
+            # 부모 창 중앙에 표시 (다이얼로그 크기는 고정이라 레이아웃 갱신 없이 계산)
+            try:
+                parent_x, parent_y, parent_width, parent_height = _parse_geometry(self.root.winfo_geometry())
+                x = parent_x + (parent_width - dialog_width) // 2
+                y = parent_y + (parent_height - dialog_height) // 2
+                dialog.geometry(f"+{x}+{y}")
+            except (tk.TclError, ValueError):
+                pass
+            
+            dialog.deiconify()
+            dialog.grab_set()
+            
+            # 포커스 설정
+            dialog.focus_set()
         
-        # 포커스 설정
-        dialog.focus_set()
+        return {'dialog': dialog, 'open': open_dialog}
 
     def show_custom_text_dialog(self, initial_text="", initial_font_size=None, initial_color=None, initial_bold=None):
         """커스텀 텍스트 입력 대화상자 - 스크롤 기능 개선"""
         try:
-            logger.info(f"📝 텍스트 입력 다이얼로그 시작: 초기값='{initial_text}', 크기={initial_font_size}, 색상={initial_color}")
-            logger.info("📝 다이얼로그 호출 스택 확인")
+            if DEBUG:
+                logger.debug(f"📝 텍스트 입력 다이얼로그 시작: 초기값='{initial_text}', 크기={initial_font_size}, 색상={initial_color}")
             dialog = tk.Toplevel(self.root)
             dialog.title("텍스트 입력")
             
             # 🔥 아이콘 설정
             setup_window_icon(dialog)
             
-            # 🔥 창 크기 개선 - 스크롤을 고려한 적응형 크기
-            screen_width = dialog.winfo_screenwidth()
-            screen_height = dialog.winfo_screenheight()
+            # 🔥 창 크기 개선 - 스크롤을 고려한 적응형 크기 (화면 크기는 처음 한 번만 조회)
+            if self._screen_wh is None:
+                self._screen_wh = (dialog.winfo_screenwidth(), dialog.winfo_screenheight())
+            screen_width, screen_height = self._screen_wh
             
             # 기본 크기 계산 (화면 크기의 35% 너비, 70% 높이, 최소/최대 제한)
             dialog_width = max(550, min(700, int(screen_width * 0.35)))
             dialog_height = max(500, min(800, int(screen_height * 0.7)))
             
-            dialog.geometry(f"{dialog_width}x{dialog_height}")
             dialog.resizable(True, True)
             dialog.minsize(500, 450)  # 최소 크기 설정
             dialog.maxsize(int(screen_width * 0.8), int(screen_height * 0.9))  # 최대 크기 설정
             dialog.transient(self.root)
             dialog.grab_set()
             
-            # 🔥 스마트 창 위치 조정 - 화면 경계 고려
-            dialog.update_idletasks()
-            
+            # 🔥 스마트 창 위치 조정 - 화면 경계 고려 (크기는 이미 계산했으므로 레이아웃 갱신 없이 부모 위치만 조회)
             try:
-                parent_x = self.root.winfo_x()
-                parent_y = self.root.winfo_y()
-                parent_width = self.root.winfo_width()
-                parent_height = self.root.winfo_height()
+                parent_x, parent_y, parent_width, parent_height = _parse_geometry(self.root.winfo_geometry())
                 
                 # 부모 창 중앙 계산
                 x = parent_x + (parent_width - dialog_width) // 2
                 y = parent_y + (parent_height - dialog_height) // 2
-            except tk.TclError:
+            except (tk.TclError, ValueError):
                 # 부모 창 정보를 가져올 수 없는 경우 화면 중앙으로
                 x = (screen_width - dialog_width) // 2
                 y = (screen_height - dialog_height) // 2
@@ -14060,7 +15188,7 @@ class FeedbackCanvasTool:
             if y < margin:
                 y = margin
             
-            dialog.geometry(f"+{x}+{y}")
+            dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
             
             # 🔥 상단 고정 영역 (설정 컨트롤)
             top_frame = tk.Frame(dialog, bg='white', relief='ridge', bd=1)
@@ -14171,8 +15299,12 @@ class FeedbackCanvasTool:
             # 시스템에서 사용 가능한 한글 폰트 우선순위로 설정
             stable_font = (self.font_manager.ui_font[0], 'Malgun Gothic', '맑은 고딕', 'Arial Unicode MS')  # 안정적인 폰트 우선순위
             
+            # 🔥 위젯과 'all' 태그가 함께 쓰는 이름 있는 폰트 - 크기/굵기는 이 객체만 바꾸면 Tk 가 바로 반영
+            text_font = font.Font(family=stable_font[0], size=text_font_size[0],
+                                  weight='bold' if text_bold[0] else 'normal')
+            
             text_widget = tk.Text(text_frame, height=8, wrap=tk.WORD, 
-                                 font=(stable_font, text_font_size[0]), relief='flat', bd=1,
+                                 font=text_font, relief='flat', bd=1,
                                  highlightthickness=2, highlightcolor='#6c757d',
                                  insertwidth=2,  # 🔥 커서 너비 고정
                                  insertborderwidth=0,  # 🔥 커서 테두리 제거
@@ -14180,25 +15312,37 @@ class FeedbackCanvasTool:
                                  insertontime=600,   # 🔥 커서 표시 시간 조정
                                  fg=text_color[0])   # 🔥 텍스트 색상 적용
             text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            text_widget.tag_configure('all', font=text_font, foreground=text_color[0])
+            
+            # 🔥 'all' 태그를 버퍼 전체로 - 폰트 적용과 입력 중 재태깅이 함께 쓰는 유일한 태깅 경로
+            text_tag_add = text_widget.tag_add
+            
+            def tag_all_text():
+                text_tag_add('all', '1.0', 'end')
             
             # 🔥 폰트 적용 함수
             def apply_font():
                 """현재 설정에 따라 폰트 적용"""
-                font_style = "bold" if text_bold[0] else "normal"
-                current_font = (stable_font[0], text_font_size[0], font_style)
-                text_widget.config(font=current_font)
-                # 전체 텍스트에 새 폰트 적용
-                text_widget.tag_add('all', '1.0', 'end')
-                text_widget.tag_configure('all', font=current_font, foreground=text_color[0])
+                text_font.configure(size=text_font_size[0], weight='bold' if text_bold[0] else 'normal')
+                # 전체 텍스트에 태그 적용 (폰트는 공유 객체라 색상만 다시 지정)
+                text_widget.tag_configure('all', foreground=text_color[0])
+                tag_all_text()
             
-            # 🔥 실시간 폰트 크기 변경
+            # 🔥 폰트 크기 변경 - 드래그 중에는 라벨만 갱신하고, 놓을 때 한 번만 폰트/태그 적용
             def update_font_size(value):
                 new_size = int(float(value))
                 text_font_size[0] = new_size
                 font_size_label.config(text=f"{new_size}px")
-                apply_font()
             
+            def commit_font_size(event=None):
+                if applied_font_size[0] != text_font_size[0]:
+                    applied_font_size[0] = text_font_size[0]
+                    apply_font()
+            
+            applied_font_size = [text_font_size[0]]
             font_size_scale.config(command=update_font_size)
+            font_size_scale.bind('<ButtonRelease-1>', commit_font_size)
+            font_size_scale.bind('<KeyRelease>', commit_font_size)  # 키보드로 조절한 경우
             
             # 🔥 볼드 토글 기능
             def toggle_bold():
@@ -14233,13 +15377,10 @@ class FeedbackCanvasTool:
                     selectforeground='black',  # 선택 시 글자색 고정
                     selectbackground='lightblue'  # 선택 배경색 고정
                 )
-                # 태그 기반 일관된 폰트 적용
-                text_widget.tag_configure('all', font=(stable_font, text_font_size[0]), foreground=text_color[0])
-                text_widget.tag_add('all', '1.0', 'end')
-                # IME 조합창 설정
-                text_widget.tk.call('tk::imestatus', text_widget, 'on')
-            except:
+            except tk.TclError:
                 pass
+            # IME 조합창 설정 (태그 폰트는 초기 텍스트 입력 후 apply_font / 입력 시 재태깅에서 한 번에 적용)
+            _enable_ime_status(text_widget)
             
             # 스크롤바
             scrollbar = tk.Scrollbar(text_frame, orient=tk.VERTICAL, 
@@ -14292,15 +15433,29 @@ class FeedbackCanvasTool:
                      bg='#4CAF50', fg='white', relief='flat', bd=0,
                      cursor='hand2').pack(side=tk.RIGHT)
             
-            # 키보드 단축키 및 폰트 일관성 유지
-            def handle_shortcuts(event):
-                # 🔥 한글 조합 중 폰트 일관성 유지
+            # 🔥 태그 재적용 예약 - 내용이 바뀐 경우(<<Modified>>)에만, 연속 변경은 유휴 시점에 한 번으로 합침
+            retag_state = {'pending': False}
+            
+            def do_retag():
+                retag_state['pending'] = False
+                if not text_widget.winfo_exists():  # 예약 후 다이얼로그가 닫힌 경우
+                    return
                 try:
-                    text_widget.tag_add('all', '1.0', 'end')
-                    text_widget.tag_configure('all', font=(stable_font, text_font_size[0]), foreground=text_color[0])
-                except:
+                    # 빈 버퍼면 생략 (내용을 복사하지 않고 인덱스 비교로 확인)
+                    if text_widget.compare('end-1c', '==', '1.0'):
+                        return
+                    # 태그 폰트/색상은 이미 설정돼 있으므로 범위만 다시 지정
+                    tag_all_text()
+                except tk.TclError:
                     pass
-                    
+            
+            def schedule_retag():
+                if not retag_state['pending']:
+                    retag_state['pending'] = True
+                    dialog.after_idle(do_retag)
+            
+            # 키보드 단축키 및 폰트 일관성 유지
+            def handle_shortcuts(event):
                 if event.state & 0x4 and event.keysym == 'Return':  # Ctrl+Enter
                     on_ok()
                     return "break"
@@ -14309,48 +15464,43 @@ class FeedbackCanvasTool:
             text_widget.bind('<KeyPress>', handle_shortcuts)
             dialog.bind('<Escape>', lambda e: on_cancel())
             
-            # 🔥 초기 텍스트 설정
-            if initial_text:
-                text_widget.insert('1.0', initial_text)
-                text_widget.tag_add('all', '1.0', 'end')
-                text_widget.tag_configure('all', font=(stable_font, text_font_size[0]), foreground=text_color[0])
-            
             # 🔥 텍스트 입력 상태 개선
             text_widget.config(state='normal')  # 입력 가능 상태 명시적 설정
             text_widget.config(insertborderwidth=1)  # 커서 표시 개선
             
-            # 🔥 텍스트 변경 시 폰트 일관성 유지 (디버그 로그 제거)
+            # 🔥 텍스트 변경 시 폰트 일관성 유지 (한글 조합 포함 - 실제 내용 변경 때만 호출됨)
             def on_text_change(event=None):
-                try:
-                    # 텍스트 변경 시 폰트 일관성 유지 (디버그 로그 완전 제거)
-                    content = text_widget.get('1.0', 'end-1c')
-                    if content:
-                        text_widget.tag_add('all', '1.0', 'end')
-                        text_widget.tag_configure('all', font=(stable_font, text_font_size[0]), foreground=text_color[0])
-                except Exception:
-                    # 로그 출력 완전 제거
-                    pass
+                # 수정 플래그를 내리면 <<Modified>> 가 한 번 더 오므로 플래그가 선 경우만 처리
+                if text_widget.edit_modified():
+                    text_widget.edit_modified(False)
+                    schedule_retag()
             
-            # 텍스트 변경 이벤트 바인딩
-            text_widget.bind('<KeyRelease>', on_text_change)
+            # 텍스트 변경 이벤트 바인딩 (초기 텍스트 입력으로 선 플래그는 내려 두어야 다음 변경이 감지됨)
+            text_widget.edit_modified(False)
+            text_widget.bind('<<Modified>>', on_text_change)
             
-            # 포커스 및 커서 위치 설정
-            dialog.after(100, lambda: (
-                text_widget.focus_force(),
-                text_widget.mark_set(tk.INSERT, '1.0'),
+            # 🔥 포커스 및 커서 위치 설정 - 고정 100ms 지연 대신 창이 매핑되는 즉시 처리
+            # (메인 창이 숨김/최소화 상태면 transient 대화상자는 매핑되지 않으므로 기다리지 않음)
+            try:
+                if self.root.winfo_viewable():
+                    dialog.wait_visibility()
+                text_widget.focus_force()
+                text_widget.mark_set(tk.INSERT, '1.0')
                 text_widget.see(tk.INSERT)
-            ))
+            except tk.TclError:
+                # 매핑 전에 창이 닫힌 경우 - 아래 대기 루프가 바로 반환됨
+                pass
             
-            # 대화상자 대기
-            logger.info("📝 텍스트 다이얼로그 대기 시작")
-            dialog.wait_window()
+            # 🔥 대화상자 대기 - 중첩 mainloop 대신 직접 이벤트 처리
+            logger.debug("📝 텍스트 다이얼로그 대기 시작")
+            _wait_dialog_closed(dialog)
             
-            logger.info(f"📝 텍스트 다이얼로그 종료, 결과: {result[0]}")
+            if DEBUG:
+                logger.debug(f"📝 텍스트 다이얼로그 종료, 결과: {result[0]}")
             return result[0]
             
         except Exception as e:
             logger.error(f"커스텀 텍스트 대화상자 오류: {e}")
-            from tkinter import simpledialog
             return simpledialog.askstring('텍스트 입력', '텍스트를 입력하세요:')
 
     def test_annotation_system(self):
@@ -14373,14 +15523,8 @@ class FeedbackCanvasTool:
         else:
             logger.debug("피드백 항목 없음")
         
-        # 활성 캔버스 확인
-        active_count = 0
-        for canvas in self.active_canvases:
-            try:
-                if canvas.winfo_exists():
-                    active_count += 1
-            except:
-                pass
+        # 활성 캔버스 확인 (파괴된 캔버스는 이때 정리)
+        active_count = len(_live_canvases(self.active_canvases))
         logger.debug(f"활성 캔버스 개수: {active_count}")
         
         logger.debug("✅ 주석 시스템 테스트 완료")
@@ -14417,21 +15561,26 @@ class FeedbackCanvasTool:
             return
         
         try:
-            # 진행률 다이얼로그 표시
-            progress = AdvancedProgressDialog(
-                self.root, 
-                "업데이트 확인", 
-                "GitHub에서 최신 버전을 확인하고 있습니다...",
-                auto_close_ms=None,
-                cancelable=False
-            )
+            # 진행률 다이얼로그 표시 (시작 시 조용한 확인은 창을 만들지 않고 백그라운드로만)
+            progress = None
+            if show_no_update:
+                progress = AdvancedProgressDialog(
+                    self.root, 
+                    "업데이트 확인", 
+                    "GitHub에서 최신 버전을 확인하고 있습니다...",
+                    auto_close_ms=None,
+                    cancelable=False
+                )
             
             def update_worker():
                 """업데이트 확인 작업자"""
+                # 작업자 스레드에서 실행 - 진행률 표시는 root.after 로 메인 스레드에 넘김
                 try:
-                    progress.update(30, "GitHub API 연결 중...")
+                    if progress:
+                        self.root.after(0, progress.update, 30, "GitHub API 연결 중...")
                     update_info = self.update_checker.check_for_updates()
-                    progress.update(100, "확인 완료!")
+                    if progress:
+                        self.root.after(0, progress.update, 100, "확인 완료!")
                     return update_info
                 except Exception as e:
                     logger.error(f"업데이트 확인 작업 오류: {e}")
@@ -14439,7 +15588,8 @@ class FeedbackCanvasTool:
             
             def on_update_complete(result):
                 """업데이트 확인 완료 콜백"""
-                progress.close()
+                if progress:
+                    progress.close()
                 
                 if 'error' in result:
                     logger.warning(f"업데이트 확인 실패: {result['error']}")
@@ -14459,7 +15609,8 @@ class FeedbackCanvasTool:
             
             def on_update_error(error):
                 """업데이트 확인 오류 콜백"""
-                progress.close()
+                if progress:
+                    progress.close()
                 logger.error(f"업데이트 확인 오류: {error}")
                 if show_no_update:
                     messagebox.showerror('업데이트 확인 오류', 
@@ -14509,21 +15660,24 @@ def setup_high_dpi():
     except Exception as e:
         logger.debug(f"DPI 설정 오류: {e}")
 
+# 🔥 플랫폼별 로캘 후보 - import 시점에 한 번 결정 (마지막 ''는 시스템 기본값)
+_LOCALE_CANDIDATES = (('Korean_Korea.utf8', '') if sys.platform == 'win32'
+                      else ('ko_KR.UTF-8', ''))
+
 def setup_encoding():
     """인코딩 설정"""
     try:
         import locale
         
-        try:
-            if sys.platform == 'win32':
-                locale.setlocale(locale.LC_ALL, 'Korean_Korea.utf8')
-            else:
-                locale.setlocale(locale.LC_ALL, 'ko_KR.UTF-8')
-        except:
+        # 🔥 후보를 순서대로 한 번씩만 시도 - 예외 중첩 없이 첫 성공에서 종료
+        for candidate in _LOCALE_CANDIDATES:
             try:
-                locale.setlocale(locale.LC_ALL, '')
-            except:
-                pass
+                locale.setlocale(locale.LC_ALL, candidate)
+                break
+            except locale.Error:
+                continue
+        else:
+            logger.debug("로캘 설정 실패 - 기본 로캘 유지")
         
         logger.info("✓ 인코딩 설정 완료")
         
@@ -14548,26 +15702,27 @@ def check_dependencies():
         warnings.append("psutil (메모리 모니터링 불가)")
     
     if missing_modules:
-        error_msg = f"다음 필수 모듈이 없습니다: {', '.join(missing_modules)}\n\n"
-        error_msg += "설치 방법:\n"
-        error_msg += "1. 명령 프롬프트(CMD)를 관리자 권한으로 실행\n"
-        for module in missing_modules:
-            error_msg += f"2. pip install {module} 입력\n"
-        error_msg += "3. 프로그램 재시작"
-        return False, error_msg
-    
-    if warnings:
-        warning_msg = f"다음 선택적 모듈이 없습니다: {', '.join(warnings)}\n\n"
-        warning_msg += "모든 기능을 사용하려면 다음 명령으로 설치해주세요:\n"
+        # 🔥 줄 목록을 모아 한 번에 join
+        error_parts = [f"다음 필수 모듈이 없습니다: {', '.join(missing_modules)}\n",
+                       "설치 방법:",
+                       "1. 명령 프롬프트(CMD)를 관리자 권한으로 실행"]
+        error_parts.extend(f"2. pip install {module} 입력" for module in missing_modules)
+        error_parts.append("3. 프로그램 재시작")
+        return False, "\n".join(error_parts)
+    
+    # 🔥 경고 메시지는 실제로 출력될 때만 조립
+    if warnings and logger.isEnabledFor(logging.WARNING):
+        warning_parts = [f"다음 선택적 모듈이 없습니다: {', '.join(warnings)}\n",
+                         "모든 기능을 사용하려면 다음 명령으로 설치해주세요:"]
         if not REPORTLAB_AVAILABLE:
-            warning_msg += "pip install reportlab\n"
+            warning_parts.append("pip install reportlab")
         if not PYAUTOGUI_AVAILABLE:
-            warning_msg += "pip install pyautogui\n"
+            warning_parts.append("pip install pyautogui")
         if not PANDAS_AVAILABLE:
-            warning_msg += "pip install pandas openpyxl\n"
+            warning_parts.append("pip install pandas openpyxl")
         if not PSUTIL_AVAILABLE:
-            warning_msg += "pip install psutil\n"
-        logger.warning(warning_msg)
+            warning_parts.append("pip install psutil")
+        logger.warning("\n".join(warning_parts) + "\n")
     
     return True, None
 
@@ -14659,6 +15814,160 @@ def main():
         logger.info("프로그램 종료")
 
 # 적응형 PDF 메서드 - 페이지 크기에 맞춤 최대 렌더링
+def _image_annotation_flags(annotations):
+    """(이미지 주석 존재 여부, 투명도 있는 이미지 주석 존재 여부) - 한 번 순회, 투명 이미지를 찾으면 바로 종료"""
+    has_images = False
+    for ann in annotations:
+        if ann.get('type') == 'image':
+            has_images = True
+            if ann.get('opacity', 100) < 100:
+                return True, True
+    return has_images, False
+
+# 🔥 페이지 배경 이미지 인코딩 캐시 - (id(원본), 목표 크기, 모드, DPI) -> (원본 weakref, 인코딩 바이트)
+# 내보내기 작업이 끝날 때 (finally) 비운다
+_ENCODED_IMAGE_CACHE_MAX = 64
+_encoded_image_cache = OrderedDict()
+
+# 🔥 배경 이미지 병렬 인코딩 - 키 -> Future (등록/소비는 PDF 작업 스레드 한 곳에서만)
+_page_encode_pool = None
+_pending_page_encodes = {}
+# 🔥 합성(폴백) 페이지의 주석 합성 이미지 - id(항목) -> Future
+_pending_combined_images = {}
+
+# 🔥 미리 준비하는 페이지 수 상한 - 페이지마다 전체 해상도 배경/합성 이미지를 쥐므로 코어 수와 무관하게 작게 유지
+_PAGE_PREFETCH_MAX = 3
+
+def _page_encode_workers():
+    """배경 이미지 인코딩 스레드 수 (Pillow 리샘플링/JPEG 인코딩은 GIL 을 놓지만, 미리 준비하는 페이지 수 이상은 쓸 일이 없음)"""
+    return min(os.cpu_count() or 2, _PAGE_PREFETCH_MAX)
+
+def _page_encode_executor():
+    """페이지 이미지 준비용 공용 스레드 풀 (처음 쓸 때 생성)"""
+    global _page_encode_pool
+    if _page_encode_pool is None:
+        _page_encode_pool = ThreadPoolExecutor(max_workers=_page_encode_workers(), thread_name_prefix="pdf-encode")
+    return _page_encode_pool
+
+def _shutdown_page_encode_executor():
+    """페이지 이미지 스레드 풀 종료 (프로그램 종료 시) - 다음에 쓰면 새로 생성"""
+    global _page_encode_pool
+    if _page_encode_pool is not None:
+        _discard_page_prefetch()
+        _page_encode_pool.shutdown(wait=False)
+        _page_encode_pool = None
+
+def _page_image_key(original_image, target_pixel_width, target_pixel_height, effective_dpi, fast_reduce):
+    return (id(original_image), target_pixel_width, target_pixel_height, original_image.mode, int(effective_dpi), fast_reduce)
+
+def _encode_page_image(original_image, target_pixel_width, target_pixel_height, dpi, fast_reduce):
+    """배경 이미지 리샘플링 + 인코딩 - 공유 캐시를 건드리지 않아 인코딩 스레드에서 병렬 실행 가능
+    
+    RGBA 는 인코딩 없이 리샘플링한 PIL 이미지를, 그 외는 JPEG 바이트를 반환
+    """
+    # 원본보다 크게 리샘플링하지 않음 (품질 저하 방지)
+    if target_pixel_width > original_image.width or target_pixel_height > original_image.height:
+        scaled_image = original_image  # 원본 사용
+        logger.debug("🔥 원본 해상도 사용 (확대 방지)")
+    elif fast_reduce:
+        scaled_image = _lanczos_resize(original_image, (target_pixel_width, target_pixel_height), reducing_gap=3.0)
+        if DEBUG:
+            logger.debug(f"🔥 고품질 리샘플링(reduce 선행): {target_pixel_width}x{target_pixel_height}px")
+    else:
+        scaled_image = _lanczos_resize(original_image, (target_pixel_width, target_pixel_height))
+        if DEBUG:
+            logger.debug(f"🔥 고품질 리샘플링: {target_pixel_width}x{target_pixel_height}px")
+    
+    if scaled_image.mode == 'RGBA':
+        return scaled_image
+    
+    img_buffer = _pdf_image_buffer()
+    scaled_image.save(img_buffer, format='JPEG', quality=98, optimize=False, dpi=(dpi, dpi))
+    return img_buffer.getvalue()
+
+def _prefetch_page_image(original_image, target_pixel_width, target_pixel_height, effective_dpi, fast_reduce=True):
+    """다음 페이지들의 배경 이미지 인코딩을 미리 인코딩 스레드에 맡김 (결과는 _page_image_reader 가 받아 감)"""
+    key = _page_image_key(original_image, target_pixel_width, target_pixel_height, effective_dpi, fast_reduce)
+    if key in _pending_page_encodes:
+        return
+    cached = _encoded_image_cache.get(key)
+    if cached is not None and cached[0]() is original_image:
+        return
+    # Future 가 원본 참조를 쥐고 있으므로 대기 중에는 id() 가 재사용되지 않음
+    _pending_page_encodes[key] = _page_encode_executor().submit(
+        _encode_page_image, original_image, target_pixel_width, target_pixel_height, int(effective_dpi), fast_reduce)
+
+def _prefetch_combined_image(pdf_generator, item):
+    """합성(폴백) 페이지의 주석 합성 이미지를 미리 스레드 풀에서 생성 (결과는 _take_combined_image 가 받아 감)"""
+    key = id(item)
+    if key not in _pending_combined_images:
+        _pending_combined_images[key] = _page_encode_executor().submit(
+            pdf_generator.create_high_quality_combined_image, item)
+
+def _take_combined_image(pdf_generator, item):
+    """미리 만든 합성 이미지가 있으면 그 결과, 없으면 지금 생성"""
+    pending = _pending_combined_images.pop(id(item), None)
+    if pending is not None:
+        return pending.result()
+    return pdf_generator.create_high_quality_combined_image(item)
+
+def _discard_page_prefetch():
+    """소비되지 않은 미리 인코딩/합성 작업 정리 (내보내기 종료/취소 시)"""
+    for pending in (_pending_page_encodes, _pending_combined_images):
+        for future in pending.values():
+            future.cancel()
+        pending.clear()
+
+def _page_image_reader(original_image, target_pixel_width, target_pixel_height, effective_dpi, fast_reduce=True):
+    """고정 레이아웃 배경 이미지를 리샘플링 + 인코딩한 ImageReader - 같은 원본/크기는 한 번만 인코딩
+    
+    RGBA 는 인코딩 없이 PIL 이미지를 그대로 넘긴다 (PNG 로 넣어도 reportlab 이 다시 디코딩해 원시 데이터로 저장).
+    그 외는 JPEG 로 인코딩해 PDF 에 그대로 들어가게 하고 결과 바이트를 캐시한다.
+    id() 재사용으로 다른 이미지가 걸리지 않도록 캐시 항목에 원본 weakref 를 함께 두고 확인한다.
+    _prefetch_page_image 로 미리 맡긴 인코딩이 있으면 그 결과를 기다려 쓴다.
+    fast_reduce: 크게 줄일 때 정수 배 박스 축소(reduce)를 먼저 거친 뒤 LANCZOS (웹툰 등 원본 해상도 우선이면 False)
+    """
+    dpi = int(effective_dpi)
+    key = _page_image_key(original_image, target_pixel_width, target_pixel_height, dpi, fast_reduce)
+    cached = _encoded_image_cache.get(key)
+    if cached is not None and cached[0]() is original_image:
+        _encoded_image_cache.move_to_end(key)
+        return ImageReader(io.BytesIO(cached[1]))
+    
+    pending = _pending_page_encodes.pop(key, None)
+    if pending is not None:
+        encoded = pending.result()
+    else:
+        encoded = _encode_page_image(original_image, target_pixel_width, target_pixel_height, dpi, fast_reduce)
+    if not isinstance(encoded, bytes):
+        return ImageReader(encoded)
+    
+    try:
+        _encoded_image_cache[key] = (weakref.ref(original_image), encoded)
+        if len(_encoded_image_cache) > _ENCODED_IMAGE_CACHE_MAX:
+            _encoded_image_cache.popitem(last=False)
+    except TypeError:
+        pass  # weakref 미지원 이미지 객체는 캐시하지 않음
+    
+    return ImageReader(io.BytesIO(encoded))
+
+def _adaptive_page_image_job(item, layout, readability_mode):
+    """적응형 페이지가 배경으로 쓸 _page_image_reader 인자 - 합성(폴백) 페이지면 None
+    
+    _adaptive_pdf_page_global 의 렌더링 방식 선택과 같은 규칙이어야 미리 인코딩한 결과가 그대로 쓰인다.
+    """
+    webtoon = layout.get('orientation', '세로형') == "세로 긴 이미지(웹툰)"
+    if not webtoon and _image_annotation_flags(item.get('annotations', []))[0]:
+        return None
+    image_width_pt = layout.get('image_width_pt', 400)
+    image_height_pt = layout.get('image_height_pt', 600)
+    effective_dpi = layout.get('effective_dpi', 300)
+    return (item['image'],
+            int((image_width_pt / 72) * effective_dpi),
+            int((image_height_pt / 72) * effective_dpi),
+            effective_dpi,
+            False if webtoon else not readability_mode)
+
 def _adaptive_pdf_page_global(pdf_generator, canvas, item, index, page_width, page_height):
     """적응형 PDF 페이지 생성 - 완전 재설계 (고정 레이아웃)"""
     try:
@@ -14681,11 +15990,13 @@ def _adaptive_pdf_page_global(pdf_generator, canvas, item, index, page_width, pa
         orientation = layout.get('orientation', '세로형')
         effective_dpi = layout.get('effective_dpi', 300)
         
-        logger.info(f"🔥 고정 레이아웃 렌더링 시작 (페이지 {index+1}):")
-        logger.info(f"   페이지: {page_width:.0f}x{page_height:.0f}pt")
-        logger.info(f"   이미지: {image_width_pt:.0f}x{image_height_pt:.0f}pt ({effective_dpi}DPI)")
-        logger.info(f"   텍스트: {text_area_height:.0f}pt (안전간격 {safe_gap}pt)")
-        logger.info(f"   여백: {margin_points:.1f}pt, 타입: {orientation}")
+        # 🔥 페이지 시작/완료만 INFO, 세부 레이아웃 로그는 디버그 모드에서만 (문자열 생성 자체를 건너뜀)
+        logger.info("고정 레이아웃 렌더링 시작 (페이지 %d)", index + 1)
+        if DEBUG:
+            logger.debug(f"   페이지: {page_width:.0f}x{page_height:.0f}pt")
+            logger.debug(f"   이미지: {image_width_pt:.0f}x{image_height_pt:.0f}pt ({effective_dpi}DPI)")
+            logger.debug(f"   텍스트: {text_area_height:.0f}pt (안전간격 {safe_gap}pt)")
+            logger.debug(f"   여백: {margin_points:.1f}pt, 타입: {orientation}")
         
         # 🔥 고정 레이아웃 위치 계산 (항상 일관됨, 겹침 완전 방지)
         # [상단여백] + [이미지] + [안전간격] + [텍스트영역] + [하단여백]
@@ -14711,108 +16022,92 @@ def _adaptive_pdf_page_global(pdf_generator, canvas, item, index, page_width, pa
             text_y = image_y - ultra_safe_gap  # 텍스트 위치 재계산
             logger.warning(f"⚠️ 겹침 방지: 이미지 위치 조정 {needed_space:.0f}pt 위로 이동")
         
-        logger.info(f"🎯 고정 위치: 이미지({image_x:.0f}, {image_y:.0f}), 텍스트({text_x:.0f}, {text_y:.0f})")
+        if DEBUG:
+            logger.debug(f"🎯 고정 위치: 이미지({image_x:.0f}, {image_y:.0f}), 텍스트({text_x:.0f}, {text_y:.0f})")
         
-        # 🔥 주석 분석 (디버깅 강화)
+        # 🔥 주석 분석 (첫 페이지 세부 확인은 디버그 모드에서만)
         annotations = item.get('annotations', [])
-        logger.info(f"🎯 페이지 {index+1} 주석 분석: 총 {len(annotations)}개")
-        if index == 0:
-            logger.info(f"🔍 첫번째 페이지 특별 확인:")
-            logger.info(f"  - item 키: {list(item.keys())}")
-            if annotations:
-                type_counts = {}
-                for ann in annotations:
-                    ann_type = ann.get('type', 'unknown')
-                    type_counts[ann_type] = type_counts.get(ann_type, 0) + 1
-                for ann_type, count in type_counts.items():
-                    logger.info(f"    {ann_type}: {count}개")
-            else:
-                logger.error(f"❌ 첫번째 페이지에 주석이 없습니다!")
+        if DEBUG:
+            logger.debug(f"🎯 페이지 {index+1} 주석 분석: 총 {len(annotations)}개")
+            if index == 0:
+                logger.debug("🔍 첫번째 페이지 특별 확인:")
+                logger.debug(f"  - item 키: {list(item.keys())}")
+                if annotations:
+                    type_counts = {}
+                    for ann in annotations:
+                        ann_type = ann.get('type', 'unknown')
+                        type_counts[ann_type] = type_counts.get(ann_type, 0) + 1
+                    for ann_type, count in type_counts.items():
+                        logger.debug(f"    {ann_type}: {count}개")
+                else:
+                    logger.debug("❌ 첫번째 페이지에 주석이 없습니다!")
         
-        # 투명도가 있는 이미지 주석 확인
-        image_annotations = [ann for ann in annotations if ann.get('type') == 'image']
-        has_transparent_images = any(
-            ann.get('opacity', 100) < 100 
-            for ann in image_annotations
-        )
+        # 투명도가 있는 이미지 주석 확인 (주석 목록 한 번 순회)
+        has_image_annotations, has_transparent_images = _image_annotation_flags(annotations)
         
-        logger.info(f"주석 분석: 전체 {len(annotations)}개, 이미지 {len(image_annotations)}개, 투명도: {has_transparent_images}")
+        if DEBUG:
+            logger.debug(f"주석 분석: 전체 {len(annotations)}개, 이미지 주석: {has_image_annotations}, 투명도: {has_transparent_images}")
         
-        # 🔥 고정 크기 이미지 준비 (레이아웃에 맞는 정확한 크기)
+        # 🔥 고정 크기 이미지 준비 (레이아웃에 맞는 정확한 크기 - 리샘플링/인코딩은 실제 그릴 때 캐시 경유)
         target_pixel_width = int((image_width_pt / 72) * effective_dpi)
         target_pixel_height = int((image_height_pt / 72) * effective_dpi)
         
-        # 원본보다 크게 리샘플링하지 않음 (품질 저하 방지)
-        if target_pixel_width > original_image.width or target_pixel_height > original_image.height:
-            scaled_image = original_image  # 원본 사용
-            logger.info("🔥 원본 해상도 사용 (확대 방지)")
-        else:
-            scaled_image = original_image.resize((target_pixel_width, target_pixel_height), 
-                                               Image.Resampling.LANCZOS)
-            logger.info(f"🔥 고품질 리샘플링: {target_pixel_width}x{target_pixel_height}px")
-        
         # PDF 생성기에 안전한 속성 설정
         if not hasattr(pdf_generator, 'pdf_readability_mode'):
             pdf_generator.pdf_readability_mode = False
         
         # 🔥 고정 레이아웃 렌더링 방식 선택
         if orientation == "세로 긴 이미지(웹툰)":
-            logger.info("고정 레이아웃 - 웹툰 모드: 해상도 우선 벡터 렌더링")
+            logger.debug("고정 레이아웃 - 웹툰 모드: 해상도 우선 벡터 렌더링")
             
             # 웹툰은 투명도가 있어도 벡터 우선 (해상도 보존)
             if has_transparent_images:
-                logger.info("웹툰 - 투명도 있지만 벡터 우선: 고해상도 유지")
+                logger.debug("웹툰 - 투명도 있지만 벡터 우선: 고해상도 유지")
                 
             # 배경 이미지 렌더링 (고정 위치와 크기)
-            img_buffer = io.BytesIO()
-            if scaled_image.mode == 'RGBA':
-                scaled_image.save(img_buffer, format='PNG', optimize=False, dpi=(int(effective_dpi), int(effective_dpi)))
-            else:
-                scaled_image.save(img_buffer, format='JPEG', quality=98, optimize=False, dpi=(int(effective_dpi), int(effective_dpi)))
-            img_buffer.seek(0)
-            
-            canvas.drawImage(ImageReader(img_buffer), image_x, image_y, image_width_pt, image_height_pt)
-            logger.info(f"🎯 웹툰 고해상도 렌더링: 위치({image_x:.0f}, {image_y:.0f}), 크기({image_width_pt:.0f}x{image_height_pt:.0f}pt)")
+            page_reader = _page_image_reader(original_image, target_pixel_width, target_pixel_height, effective_dpi,
+                                             fast_reduce=False)
+            canvas.drawImage(page_reader, image_x, image_y, image_width_pt, image_height_pt)
+            if DEBUG:
+                logger.debug(f"🎯 웹툰 고해상도 렌더링: 위치({image_x:.0f}, {image_y:.0f}), 크기({image_width_pt:.0f}x{image_height_pt:.0f}pt)")
             
             # 벡터 주석 렌더링 (고정 위치 기준)
             pdf_generator.draw_vector_annotations_on_pdf(canvas, item, image_x, image_y, image_width_pt, image_height_pt)
                 
         else:
             # 일반 이미지 처리
-            if has_transparent_images or len(image_annotations) > 0:
-                logger.info("고정 레이아웃 - 투명도/이미지주석 감지: 고품질 합성 방식 사용")
+            if has_image_annotations:
+                logger.debug("고정 레이아웃 - 투명도/이미지주석 감지: 고품질 합성 방식 사용")
                 # 투명도나 이미지 주석이 있으면 fallback 사용
                 pdf_generator._fallback_pdf_page(canvas, item, index, page_width, page_height)
             else:
-                logger.info("고정 레이아웃 - 벡터 모드 사용")
+                logger.debug("고정 레이아웃 - 벡터 모드 사용")
                 
                 # 벡터 모드 배경 이미지 렌더링 (고정 위치와 크기)
-                img_buffer = io.BytesIO()
-                if scaled_image.mode == 'RGBA':
-                    scaled_image.save(img_buffer, format='PNG', optimize=False, dpi=(int(effective_dpi), int(effective_dpi)))
-                else:
-                    scaled_image.save(img_buffer, format='JPEG', quality=98, optimize=False, dpi=(int(effective_dpi), int(effective_dpi)))
-                img_buffer.seek(0)
-                
-                canvas.drawImage(ImageReader(img_buffer), image_x, image_y, image_width_pt, image_height_pt)
-                logger.info(f"🎯 고정 레이아웃 배경 이미지: 위치({image_x:.0f}, {image_y:.0f}), 크기({image_width_pt:.0f}x{image_height_pt:.0f}pt)")
+                page_reader = _page_image_reader(original_image, target_pixel_width, target_pixel_height, effective_dpi,
+                                                 fast_reduce=not pdf_generator.pdf_readability_mode)
+                canvas.drawImage(page_reader, image_x, image_y, image_width_pt, image_height_pt)
+                if DEBUG:
+                    logger.debug(f"🎯 고정 레이아웃 배경 이미지: 위치({image_x:.0f}, {image_y:.0f}), 크기({image_width_pt:.0f}x{image_height_pt:.0f}pt)")
                 
                 # 벡터 주석 렌더링 (고정 위치 기준)
                 pdf_generator.draw_vector_annotations_on_pdf(canvas, item, image_x, image_y, image_width_pt, image_height_pt)
         
-        logger.info(f"✅ 고정 레이아웃 이미지 렌더링 완료")
+        logger.debug("✅ 고정 레이아웃 이미지 렌더링 완료")
         
         # 🔥 고정 레이아웃 피드백 텍스트 렌더링
         if text_area_height > 0:
             feedback_text = item.get('feedback_text', '').strip()
             if feedback_text:
-                logger.info(f"📝 고정 레이아웃 텍스트 렌더링: {len(feedback_text)}자, 위치({text_x:.0f}, {text_y:.0f})")
+                if DEBUG:
+                    logger.debug(f"📝 고정 레이아웃 텍스트 렌더링: {len(feedback_text)}자, 위치({text_x:.0f}, {text_y:.0f})")
                 
                 # 고정 위치에 텍스트 렌더링 (위치는 이미 계산됨)
                 _add_adaptive_feedback_text_natural(pdf_generator, canvas, item, index, text_y, text_area_height, page_width, margin_points, orientation)
-                logger.info(f"📝 고정 레이아웃 텍스트 완료: 위치={text_y:.0f}, 높이={text_area_height:.0f}pt")
+                if DEBUG:
+                    logger.debug(f"📝 고정 레이아웃 텍스트 완료: 위치={text_y:.0f}, 높이={text_area_height:.0f}pt")
             else:
-                logger.info("📝 피드백 텍스트 없음")
+                logger.debug("📝 피드백 텍스트 없음")
         
         # 🔥 페이지 번호
         skip_title = getattr(pdf_generator.app, 'skip_title_page', False) if pdf_generator.app else False
@@ -14821,7 +16116,7 @@ def _adaptive_pdf_page_global(pdf_generator, canvas, item, index, page_width, pa
         canvas.setFont('Helvetica', 9)
         canvas.drawString(page_width - 80, 15, f"{page_number}")
         
-        logger.info(f"🎯 고정 레이아웃 PDF 페이지 생성 완료: 페이지 {page_number}")
+        logger.info("고정 레이아웃 PDF 페이지 생성 완료: 페이지 %d", page_number)
         
     except Exception as e:
         logger.error(f"적응형 PDF 페이지 생성 오류: {e}")
@@ -14838,23 +16133,21 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
         color = annotation.get('color', '#FF0000')
         width = annotation.get('width', 2)
         
-        logger.debug(f"🎯 주석 렌더링: type={ann_type}, points={len(points)}개, color={color}, width={width}")
+        if DEBUG:
+            logger.debug(f"🎯 주석 렌더링: type={ann_type}, points={len(points)}개, color={color}, width={width}")
         
         if not points and ann_type != 'image':
-            logger.debug(f"⚠️ 주석 건너뜀: {ann_type} - 포인트 없음")
+            if DEBUG:
+                logger.debug(f"⚠️ 주석 건너뜀: {ann_type} - 포인트 없음")
             return
         
         # 이미지 높이 정보
         image_height = original_image.height
         
-        # 색상 변환
-        if color.startswith('#'):
-            color = color[1:]
+        # 색상 변환 (색상 문자열별 캐시)
         try:
-            r = int(color[0:2], 16) / 255.0
-            g = int(color[2:4], 16) / 255.0
-            b = int(color[4:6], 16) / 255.0
-        except:
+            r, g, b = _hex_to_rgb(color)
+        except ValueError:
             r, g, b = 1.0, 0.0, 0.0  # 기본값: 빨간색
         
         # 선 굵기 스케일링 (고화질)
@@ -14878,21 +16171,19 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
                 end_point = (annotation['end_x'], annotation['end_y'])
                 start_x, start_y = transform_point(start_point)
                 end_x, end_y = transform_point(end_point)
-                logger.debug(f"🎯 A4 호환 화살표 좌표: ({annotation['start_x']}, {annotation['start_y']}) → ({annotation['end_x']}, {annotation['end_y']})")
+                if DEBUG:
+                    logger.debug(f"🎯 A4 호환 화살표 좌표: ({annotation['start_x']}, {annotation['start_y']}) → ({annotation['end_x']}, {annotation['end_y']})")
             elif len(points) >= 2:
                 # 새로운 방식: points 배열
                 start_x, start_y = transform_point(points[0])
                 end_x, end_y = transform_point(points[-1])
-                logger.debug(f"🎯 점 배열 화살표 좌표: {points[0]} → {points[-1]}")
+                if DEBUG:
+                    logger.debug(f"🎯 점 배열 화살표 좌표: {points[0]} → {points[-1]}")
             else:
                 logger.warning(f"⚠️ 화살표 좌표 데이터 없음: {annotation}")
                 return
             
-            # 화살표 본체
-            canvas.line(start_x, start_y, end_x, end_y)
-            
             # 화살표 머리 (고화질)
-            import math
             angle = math.atan2(end_y - start_y, end_x - start_x)
             arrow_size = max(scaled_width * 4, 8)
             
@@ -14902,9 +16193,12 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
             arrow_x2 = end_x - arrow_size * math.cos(angle + 0.5)
             arrow_y2 = end_y - arrow_size * math.sin(angle + 0.5)
             
-            canvas.line(end_x, end_y, arrow_x1, arrow_y1)
-            canvas.line(end_x, end_y, arrow_x2, arrow_y2)
-            logger.debug(f"🎯 벡터 화살표 렌더링: ({start_x:.0f},{start_y:.0f}) → ({end_x:.0f},{end_y:.0f}), 두께={scaled_width:.1f}")
+            # 🔥 본체 + 머리 두 획을 한 경로로 출력
+            canvas.lines([(start_x, start_y, end_x, end_y),
+                          (end_x, end_y, arrow_x1, arrow_y1),
+                          (end_x, end_y, arrow_x2, arrow_y2)])
+            if DEBUG:
+                logger.debug(f"🎯 벡터 화살표 렌더링: ({start_x:.0f},{start_y:.0f}) → ({end_x:.0f},{end_y:.0f}), 두께={scaled_width:.1f}")
         
         elif ann_type == 'line':
             # 🔥 A4 고정과 호환되는 라인 좌표 처리
@@ -14914,32 +16208,36 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
                 end_point = (annotation['end_x'], annotation['end_y'])
                 start_x, start_y = transform_point(start_point)
                 end_x, end_y = transform_point(end_point)
-                logger.debug(f"🎯 A4 호환 라인 좌표: ({annotation['start_x']}, {annotation['start_y']}) → ({annotation['end_x']}, {annotation['end_y']})")
+                if DEBUG:
+                    logger.debug(f"🎯 A4 호환 라인 좌표: ({annotation['start_x']}, {annotation['start_y']}) → ({annotation['end_x']}, {annotation['end_y']})")
             elif len(points) >= 2:
                 # 새로운 방식: points 배열
                 start_x, start_y = transform_point(points[0])
                 end_x, end_y = transform_point(points[-1])
-                logger.debug(f"🎯 점 배열 라인 좌표: {points[0]} → {points[-1]}")
+                if DEBUG:
+                    logger.debug(f"🎯 점 배열 라인 좌표: {points[0]} → {points[-1]}")
             else:
                 logger.warning(f"⚠️ 라인 좌표 데이터 없음: {annotation}")
                 return
             
             canvas.line(start_x, start_y, end_x, end_y)
-            logger.debug(f"🎯 벡터 라인 렌더링: ({start_x:.0f},{start_y:.0f}) → ({end_x:.0f},{end_y:.0f}), 두께={scaled_width:.1f}")
+            if DEBUG:
+                logger.debug(f"🎯 벡터 라인 렌더링: ({start_x:.0f},{start_y:.0f}) → ({end_x:.0f},{end_y:.0f}), 두께={scaled_width:.1f}")
         
         elif ann_type == 'pen':
             # 🔥 벡터 펜 스트로크
             if len(points) >= 2:
+                # 🔥 점 변환은 한 번에 처리 후 하나의 폴리라인 경로로 출력 (선 연결부 유지)
+                pdf_points = _pdf_points(points, base_x, base_y, scale_x, scale_y, image_height)
                 path = canvas.beginPath()
-                start_x, start_y = transform_point(points[0])
-                path.moveTo(start_x, start_y)
-                
-                for point in points[1:]:
-                    x, y = transform_point(point)
-                    path.lineTo(x, y)
+                path.moveTo(*pdf_points[0])
+                line_to = path.lineTo
+                for x, y in pdf_points[1:]:
+                    line_to(x, y)
                 
                 canvas.drawPath(path, stroke=1, fill=0)
-                logger.debug(f"🎯 벡터 펜 렌더링: {len(points)}점, 두께={scaled_width:.1f}")
+                if DEBUG:
+                    logger.debug(f"🎯 벡터 펜 렌더링: {len(points)}점, 두께={scaled_width:.1f}")
         
         elif ann_type in ['rectangle', 'circle', 'rect', 'oval']:
             # 🔥 A4 고정과 호환되는 도형 좌표 처리
@@ -14949,12 +16247,14 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
                 point2 = (annotation['x2'], annotation['y2'])
                 x1, y1 = transform_point(point1)
                 x2, y2 = transform_point(point2)
-                logger.debug(f"🎯 A4 호환 도형 좌표: ({annotation['x1']}, {annotation['y1']}) → ({annotation['x2']}, {annotation['y2']})")
+                if DEBUG:
+                    logger.debug(f"🎯 A4 호환 도형 좌표: ({annotation['x1']}, {annotation['y1']}) → ({annotation['x2']}, {annotation['y2']})")
             elif len(points) >= 2:
                 # 새로운 방식: points 배열
                 x1, y1 = transform_point(points[0])
                 x2, y2 = transform_point(points[1])
-                logger.debug(f"🎯 점 배열 도형 좌표: {points[0]} → {points[1]}")
+                if DEBUG:
+                    logger.debug(f"🎯 점 배열 도형 좌표: {points[0]} → {points[1]}")
             else:
                 logger.warning(f"⚠️ 도형 좌표 데이터 없음: {annotation}")
                 return
@@ -14964,7 +16264,8 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
             
             if ann_type in ['rectangle', 'rect']:
                 canvas.rect(min_x, min_y, max_x - min_x, max_y - min_y, stroke=1, fill=0)
-                logger.debug(f"🎯 벡터 사각형 렌더링: ({min_x:.0f},{min_y:.0f}), 크기=({max_x-min_x:.0f}x{max_y-min_y:.0f})")
+                if DEBUG:
+                    logger.debug(f"🎯 벡터 사각형 렌더링: ({min_x:.0f},{min_y:.0f}), 크기=({max_x-min_x:.0f}x{max_y-min_y:.0f})")
             else:  # circle, oval
                 center_x = (min_x + max_x) / 2
                 center_y = (min_y + max_y) / 2
@@ -14975,7 +16276,8 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
                 canvas.ellipse(center_x - width/2, center_y - height/2,
                              center_x + width/2, center_y + height/2,
                              stroke=1, fill=0)
-                logger.debug(f"🎯 벡터 타원 렌더링: 중심=({center_x:.0f},{center_y:.0f}), 크기=({width:.0f}x{height:.0f})")
+                if DEBUG:
+                    logger.debug(f"🎯 벡터 타원 렌더링: 중심=({center_x:.0f},{center_y:.0f}), 크기=({width:.0f}x{height:.0f})")
         
         elif ann_type == 'text':
             # 🔥 A4 고정과 호환되는 텍스트 좌표 처리
@@ -14983,11 +16285,13 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
                 # A4 고정 방식: x, y
                 text_point = (annotation['x'], annotation['y'])
                 x, y = transform_point(text_point)
-                logger.debug(f"🎯 A4 호환 텍스트 좌표: ({annotation['x']}, {annotation['y']})")
+                if DEBUG:
+                    logger.debug(f"🎯 A4 호환 텍스트 좌표: ({annotation['x']}, {annotation['y']})")
             elif points and len(points) > 0:
                 # 새로운 방식: points 배열
                 x, y = transform_point(points[0])
-                logger.debug(f"🎯 점 배열 텍스트 좌표: {points[0]}")
+                if DEBUG:
+                    logger.debug(f"🎯 점 배열 텍스트 좌표: {points[0]}")
             else:
                 logger.warning(f"⚠️ 텍스트 좌표 데이터 없음: {annotation}")
                 return
@@ -15010,17 +16314,17 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
             
             # A4 고정과 동일한 텍스트 위치 보정
             canvas.drawString(x, y - font_size, text_content)
-            logger.debug(f"🎯 벡터 텍스트 렌더링: '{text_content[:20]}...', 위치=({x:.0f},{y:.0f}), 크기={font_size:.1f}")
+            if DEBUG:
+                logger.debug(f"🎯 벡터 텍스트 렌더링: '{text_content[:20]}...', 위치=({x:.0f},{y:.0f}), 크기={font_size:.1f}")
         
         elif ann_type == 'image':
             # 🔥 주석 이미지 (견본 캡처, 투명도 이미지 포함)
             image_data = annotation.get('image_data')
             if image_data:
                 try:
-                    # Base64 이미지 데이터 디코딩
-                    import base64
-                    decoded_data = base64.b64decode(image_data)
-                    ann_image = Image.open(io.BytesIO(decoded_data))
+                    # Base64 이미지 데이터 디코딩 (주석별 캐시 - 공유 이미지이므로 아래에서 직접 수정하지 않음)
+                    ann_image = _annotation_pil(annotation)
+                    shared_image = ann_image
                     
                     # 주석 이미지 위치 및 크기 정보
                     ann_x = annotation.get('x', 0)
@@ -15034,53 +16338,40 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
                     pdf_width = ann_width * scale_x
                     pdf_height = ann_height * scale_y
                     
-                    # 🔥 회전 처리
                     rotation = annotation.get('rotation', 0)
-                    if rotation != 0:
-                        # 회전된 이미지 생성
-                        ann_image = ann_image.rotate(-rotation, expand=True, fillcolor=(255, 255, 255, 0))
-                    
-                    # 🔥 반전 처리
-                    if annotation.get('flip_horizontal', False):
-                        ann_image = ann_image.transpose(Image.FLIP_LEFT_RIGHT)
-                    if annotation.get('flip_vertical', False):
-                        ann_image = ann_image.transpose(Image.FLIP_TOP_BOTTOM)
-                    
-                    # 🔥 A4 고정과 동일한 투명도 처리 (완전 개선)
+                    flip_horizontal = annotation.get('flip_horizontal', False)
+                    flip_vertical = annotation.get('flip_vertical', False)
                     opacity = annotation.get('opacity', 100) / 100.0
-                    logger.debug(f"🎨 주석 이미지 투명도: {opacity:.2f} ({annotation.get('opacity', 100)}%)")
-                    
-                    # 🔥 A4 고정과 동일한 투명도 처리 방식 적용
-                    if opacity < 1.0 and ann_image.mode == 'RGBA':
-                        alpha = ann_image.split()[-1]
-                        alpha = alpha.point(lambda p: int(p * opacity))
-                        ann_image.putalpha(alpha)
-                        logger.debug(f"🎨 A4 고정 방식 투명도 적용: {opacity:.2f}")
-                    
-                    # 이미지 버퍼 준비
-                    img_buffer = io.BytesIO()
-                    
-                    # 🔥 A4 고정과 동일한 저장 방식 (RGB 변환 + 알파 블렌딩)
-                    if ann_image.mode == 'RGBA':
-                        # 투명한 배경을 흰색으로 변환 (고품질 알파 블렌딩)
-                        rgb_img = Image.new('RGB', ann_image.size, (255, 255, 255))
-                        if opacity < 1.0:
-                            # 투명도가 있는 경우 고품질 알파 블렌딩
-                            rgb_img.paste(ann_image, mask=ann_image.split()[-1])
-                        else:
-                            rgb_img.paste(ann_image, mask=ann_image.split()[-1])
-                        ann_image = rgb_img
-                        logger.debug("🎨 A4 고정 방식 RGBA → RGB 변환 완료")
-                    elif ann_image.mode != 'RGB':
-                        ann_image = ann_image.convert('RGB')
-                        logger.debug(f"🎨 {ann_image.mode} → RGB 변환")
                     
-                    # 🔥 최고 품질로 저장 (A4 고정과 동일)
-                    ann_image.save(img_buffer, format='PNG', 
-                                  optimize=False, compress_level=0)
-                    logger.debug(f"🎨 투명도 이미지 고품질 PNG 저장 완료: opacity={opacity:.2f}")
+                    def build_pdf_image(ann_image=ann_image):
+                        """회전/반전/투명도를 적용해 흰 배경에 합성한 RGB 이미지"""
+                        # 🔥 회전 후 반전 - 한 번의 변환으로
+                        ann_image = _oriented_image(ann_image, rotation, flip_horizontal, flip_vertical,
+                                                    flip_first=False, fillcolor=(255, 255, 255, 0))
+                        
+                        # 🔥 A4 고정과 동일한 투명도 처리 방식 적용
+                        if opacity < 1.0 and ann_image.mode == 'RGBA':
+                            alpha = ann_image.split()[-1]
+                            alpha = alpha.point(_opacity_lut(opacity))
+                            if ann_image is shared_image:
+                                ann_image = ann_image.copy()
+                            ann_image.putalpha(alpha)
+                        
+                        # 🔥 A4 고정과 동일한 저장 방식 (RGB 변환 + 알파 블렌딩)
+                        if ann_image.mode == 'RGBA':
+                            rgb_img = Image.new('RGB', ann_image.size, (255, 255, 255))
+                            rgb_img.paste(ann_image, mask=ann_image.split()[-1])
+                            ann_image = rgb_img
+                        elif ann_image.mode != 'RGB':
+                            ann_image = ann_image.convert('RGB')
+                        return ann_image
                     
-                    img_buffer.seek(0)
+                    # 🔥 같은 견본/변형은 한 번만 인코딩
+                    cache_key = (_annotation_image_digest(annotation), flip_horizontal, flip_vertical,
+                                 rotation, opacity, 0)
+                    encoded = _cached_annotation_png(cache_key, build_pdf_image)
+                    if DEBUG:
+                        logger.debug(f"🎨 주석 이미지 준비 완료: opacity={opacity:.2f}")
                     
                     # 🔥 흰색 아웃라인 처리 (UI 다이얼로그와 동일한 방식)
                     if annotation.get('outline', False):
@@ -15095,11 +16386,13 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
                                       pdf_width + (offset * 2), pdf_height + (offset * 2), 
                                       stroke=1, fill=0)
                         
-                        logger.debug(f"🎨 흰색 아웃라인 PDF 렌더링: 너비={outline_width:.1f}pt")
+                        if DEBUG:
+                            logger.debug(f"🎨 흰색 아웃라인 PDF 렌더링: 너비={outline_width:.1f}pt")
                     
                     # PDF에 이미지 추가
-                    canvas.drawImage(ImageReader(img_buffer), pdf_x, pdf_y, pdf_width, pdf_height)
-                    logger.debug(f"🎨 주석 이미지 렌더링 완료: 위치({pdf_x:.0f}, {pdf_y:.0f}), 크기({pdf_width:.0f}x{pdf_height:.0f}), 투명도={opacity:.2f}, 회전={rotation}°")
+                    canvas.drawImage(ImageReader(io.BytesIO(encoded)), pdf_x, pdf_y, pdf_width, pdf_height)
+                    if DEBUG:
+                        logger.debug(f"🎨 주석 이미지 렌더링 완료: 위치({pdf_x:.0f}, {pdf_y:.0f}), 크기({pdf_width:.0f}x{pdf_height:.0f}), 투명도={opacity:.2f}, 회전={rotation}°")
                     
                 except Exception as img_e:
                     logger.error(f"주석 이미지 렌더링 오류: {img_e}")
@@ -15118,7 +16411,8 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
                     except:
                         pass
         
-        logger.debug(f"🎨 벡터 주석 렌더링: {ann_type}, 크기={scaled_width:.1f}")
+        if DEBUG:
+            logger.debug(f"🎨 벡터 주석 렌더링: {ann_type}, 크기={scaled_width:.1f}")
         
     except Exception as e:
         logger.error(f"벡터 주석 렌더링 오류: {e}")
@@ -15126,6 +16420,80 @@ def _render_vector_annotation_adaptive(pdf_generator, canvas, annotation, base_x
         logger.error(traceback.format_exc())
 
 
+@lru_cache(maxsize=256)
+def _adaptive_text_layout(feedback_text, max_text_width, available_height, font_name, initial_font_size):
+    """적응형 피드백 텍스트의 (폰트 크기, 줄 간격, 줄 목록) - 순수 계산이므로 같은 텍스트/영역/폰트면 캐시에서 바로 반환
+    
+    키는 텍스트/크기/폰트 이름뿐 (생성기 객체를 잡아 두지 않음)
+    """
+    wrapped = {}
+    
+    def wrap(font_size):
+        """font_size 별 줄바꿈 결과 (탐색 중 계산한 것을 최종 렌더링에서 재사용)"""
+        text_lines = wrapped.get(font_size)
+        if text_lines is None:
+            text_lines = wrapped[font_size] = _wrap_pdf_text(
+                feedback_text, max_text_width, font_name, font_size)
+        return text_lines
+    
+    def fits(font_size):
+        """font_size 로 줄바꿈한 텍스트가 영역 높이에 들어가는지 (줄 간격 = 폰트 + 4)
+        
+        들어가는 줄 수를 넘는 순간 줄바꿈을 멈추므로 큰 크기의 실패 판정은 앞 몇 줄만 처리 (다 들어간 결과만 재사용 캐시)
+        """
+        if font_size in wrapped:
+            return len(wrapped[font_size]) * (font_size + 4) <= available_height
+        line_limit = int(available_height // (font_size + 4))
+        text_lines = _wrap_pdf_text(feedback_text, max_text_width, font_name, font_size, max_lines=max(line_limit, 0))
+        if len(text_lines) > line_limit:
+            return False
+        wrapped[font_size] = text_lines
+        return True
+    
+    # 🔥 면적 기반 초기 추정 - 줄 수 ≈ 전체 폭 / 줄 폭, 높이 ≈ 줄 수 × (크기 + 4) 를 크기에 대해 풀어
+    # 탐색 범위를 추정값 위/아래 한쪽으로 좁힘 (잘 맞는 텍스트는 1~2번 줄바꿈으로 끝남)
+    text_units = _pdf_text_units(feedback_text.replace('\n', ' '), font_name)
+    if text_units > 0 and max_text_width > 0 and available_height > 0:
+        guess = int(-2 + math.sqrt(4 + available_height * max_text_width / text_units))
+        guess = min(max(guess, 7), initial_font_size)
+    else:
+        guess = initial_font_size
+    
+    # 🔥 최적 폰트 크기 찾기 - 7pt ~ 초기 크기 중 들어가는 가장 큰 크기를 이진 탐색
+    # (폰트가 작을수록 줄 수와 줄 간격이 함께 줄어드는 단조 관계)
+    if fits(guess):
+        low, high = guess, initial_font_size
+    elif guess > 7 and fits(7):
+        low, high = 7, guess - 1
+    else:
+        low = None
+    
+    if low is not None:
+        while low < high:
+            mid = (low + high + 1) // 2
+            if fits(mid):
+                low = mid
+            else:
+                high = mid - 1
+        # 줄바꿈 위치가 달라져 단조성이 깨진 경우 대비 - 한 단계 위도 들어가면 선형으로 올라감
+        while low < initial_font_size and fits(low + 1):
+            low += 1
+        best_font_size = low
+        best_line_height = low + 4
+    else:
+        # 🔥 최소 폰트로도 맞지 않는 매우 긴 텍스트: 줄 간격을 더욱 줄임
+        best_font_size = 7
+        best_line_height = 9  # 최소 줄 간격
+        logger.warning("매우 긴 텍스트 감지: 최소 폰트(7pt) 및 줄간격(9pt) 적용")
+    
+    # 🔥 탐색 결과가 초기 크기와 같으면 최소 폰트로 강제 (7pt 에 맞으면 줄 간격 11, 아니면 9)
+    if best_font_size == initial_font_size:
+        best_font_size = 7
+        best_line_height = 11 if fits(7) else 9
+    
+    return best_font_size, best_line_height, tuple(wrap(best_font_size))
+
+
 def _add_adaptive_feedback_text_natural(pdf_generator, canvas, item, index, text_y, text_area_height, page_width, margin, orientation='일반'):
     """적응형 PDF에 피드백 텍스트 추가 - 고정 레이아웃 (글로벌 함수)"""
     try:
@@ -15200,57 +16568,35 @@ def _add_adaptive_feedback_text_natural(pdf_generator, canvas, item, index, text
         else:
             initial_font_size = 13  # 매우 긴 텍스트
         
-        # 🔥 최적 폰트 크기 찾기 (텍스트가 잘리지 않도록 개선)
-        best_font_size = initial_font_size
-        best_line_height = 18  # 줄 간격
-        
-        # 더 작은 폰트 크기까지 시도 (7pt까지)
-        for font_size in range(initial_font_size, 6, -1):  # 최소 7까지 (10 → 7)
-            canvas.setFont(korean_font, font_size)
-            text_lines = pdf_generator._wrap_text_for_pdf(feedback_text, max_text_width, korean_font, font_size, canvas)
-            line_height = font_size + 4  # 줄 간격 최적화 (5 → 4)
-            total_height = len(text_lines) * line_height
-            
-            if total_height <= available_height:
-                best_font_size = font_size
-                best_line_height = line_height
-                break
-        
-        # 🔥 여전히 맞지 않으면 최소 폰트로 강제 설정
-        if best_font_size == initial_font_size:
-            canvas.setFont(korean_font, 7)
-            text_lines = pdf_generator._wrap_text_for_pdf(feedback_text, max_text_width, korean_font, 7, canvas)
-            total_height = len(text_lines) * 11
-            if total_height > available_height:
-                # 매우 긴 텍스트: 줄 간격을 더욱 줄임
-                best_font_size = 7
-                best_line_height = 9  # 최소 줄 간격
-                logger.warning(f"매우 긴 텍스트 감지: 최소 폰트(7pt) 및 줄간격(9pt) 적용")
-            else:
-                best_font_size = 7
-                best_line_height = 11
+        # 🔥 폰트 크기 탐색 + 줄바꿈 (같은 보고서를 다시 만들면 캐시 적중)
+        best_font_size, best_line_height, text_lines = _adaptive_text_layout(
+            feedback_text, max_text_width, available_height, korean_font, initial_font_size)
         
         # 최종 텍스트 렌더링 (잘리지 않도록 모든 텍스트 출력)
         canvas.setFont(korean_font, best_font_size)
-        text_lines = pdf_generator._wrap_text_for_pdf(feedback_text, max_text_width, korean_font, best_font_size, canvas)
         
         content_y = title_y - 30
         
         # 웹툰에서는 텍스트 내부 여백도 축소 (미리 계산)
         inner_text_margin = 8 if adaptive_orientation == "세로 긴 이미지(웹툰)" else 15
         
-        # 🔥 텍스트 영역이 동적으로 계산되었으므로 모든 텍스트 출력
-        for i, line in enumerate(text_lines):
-            # 하단 여백 체크만 유지 (max_lines 제한 제거)
-            if content_y < text_y - text_area_height + 2:  
-                # 마지막 라인에서 텍스트가 잘릴 경우에만 "... (더보기)" 표시
-                if i < len(text_lines) - 1:
-                    canvas.setFont(korean_font, max(7, best_font_size - 1))
-                    canvas.setFillColorRGB(0.5, 0.5, 0.5)
-                    canvas.drawString(text_box_margin + inner_text_margin, content_y + best_line_height, "... (내용이 더 있습니다)")
-                break
-            canvas.drawString(text_box_margin + inner_text_margin, content_y, line)
-            content_y -= best_line_height
+        # 🔥 텍스트 영역이 동적으로 계산되었으므로 모든 텍스트 출력 (하단 여백 체크만 유지)
+        # 하단 여백 안에 들어가는 줄 수(max_lines)를 먼저 구하고 한 텍스트 객체로 출력 (줄 간격은 leading 으로)
+        text_bottom = text_y - text_area_height + 2
+        max_lines = 0 if content_y < text_bottom else int((content_y - text_bottom) // best_line_height) + 1
+        
+        if max_lines:
+            truncated = len(text_lines) > max_lines
+            text_object = canvas.beginText(text_box_margin + inner_text_margin, content_y)
+            text_object.setFont(korean_font, best_font_size, leading=best_line_height)
+            for line in (text_lines[:max_lines - 1] if truncated else text_lines):
+                text_object.textLine(line)
+            if truncated:
+                # 텍스트가 잘리면 마지막 줄 자리에 "... (더보기)" 표시
+                text_object.setFont(korean_font, max(7, best_font_size - 1), leading=best_line_height)
+                text_object.setFillColorRGB(0.5, 0.5, 0.5)
+                text_object.textLine("... (내용이 더 있습니다)")
+            canvas.drawText(text_object)
         
         logger.debug(f"적응형 스마트 폰트 적용: {best_font_size}pt, {len(text_lines)}줄, 여백최적화: {adaptive_orientation}")
         
@@ -15258,63 +16604,24 @@ def _add_adaptive_feedback_text_natural(pdf_generator, canvas, item, index, text
         logger.error(f"A4 동일 레이아웃 피드백 텍스트 추가 오류: {e}")
 
 
-def _add_adaptive_feedback_text_global(pdf_generator, canvas, item, index, text_y, text_area_height, page_width, margin):
-    """적응형 PDF에 피드백 텍스트 추가 (글로벌 함수) - 호환성 유지"""
-    # 🔥 text_y는 이미 올바르게 계산되어 전달됨 (이미지 아래 위치)
-    _add_adaptive_feedback_text_natural(pdf_generator, canvas, item, index, text_y, text_area_height, page_width, margin)
+# 적응형 PDF에 피드백 텍스트 추가 (글로벌 함수) - 호환성 유지용 별칭 (전달만 하던 함수 대신 같은 함수 객체)
+_add_adaptive_feedback_text_global = _add_adaptive_feedback_text_natural
 
-# PDF 생성기 클래스에 적응형 메서드 동적 추가
-def add_adaptive_methods_to_pdf_generator():
-    """PDF 생성기 클래스에 적응형 메서드를 동적으로 추가"""
-    try:
-        # 🔥 글로벌 스코프에서 HighQualityPDFGenerator 클래스 찾기
-        pdf_gen_class = None
-        for name, obj in globals().items():
-            if isinstance(obj, type) and name == 'HighQualityPDFGenerator':
-                pdf_gen_class = obj
-                break
-        
-        if pdf_gen_class is None:
-            logger.error("HighQualityPDFGenerator 클래스를 찾을 수 없습니다")
-            return
-        
-        # 🔥 적응형 메서드를 클래스에 동적으로 추가
-        def _adaptive_pdf_page(self, canvas, item, index, page_width, page_height):
-            return _adaptive_pdf_page_global(self, canvas, item, index, page_width, page_height)
-        
-        def _add_adaptive_feedback_text(self, canvas, item, index, text_y, text_area_height, page_width, margin):
-            return _add_adaptive_feedback_text_global(self, canvas, item, index, text_y, text_area_height, page_width, margin)
-        
-        def _add_adaptive_feedback_text_natural(self, canvas, item, index, text_y, text_area_height, page_width, margin):
-            return _add_adaptive_feedback_text_natural(self, canvas, item, index, text_y, text_area_height, page_width, margin)
-        
-        def _render_vector_annotation_adaptive(self, canvas, annotation, base_x, base_y, scale_x, scale_y, original_image):
-            return _render_vector_annotation_adaptive(self, canvas, annotation, base_x, base_y, scale_x, scale_y, original_image)
-        
-        # 클래스에 메서드 추가
-        setattr(pdf_gen_class, '_adaptive_pdf_page', _adaptive_pdf_page)
-        setattr(pdf_gen_class, '_add_adaptive_feedback_text', _add_adaptive_feedback_text)
-        setattr(pdf_gen_class, '_add_adaptive_feedback_text_natural', _add_adaptive_feedback_text_natural)
-        setattr(pdf_gen_class, '_render_vector_annotation_adaptive', _render_vector_annotation_adaptive)
-        
-        logger.info(f"✅ HighQualityPDFGenerator 클래스에 적응형 PDF 메서드 4개 추가 완료")
-        
-    except Exception as e:
-        logger.error(f"적응형 메서드 동적 추가 오류: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+# 🔥 PDF 생성기 클래스의 적응형 메서드 - 모듈 로드 시 클래스 속성으로 바로 연결
+# (글로벌 함수는 첫 인자가 pdf_generator 이므로 그대로 메서드가 됨 - 전달용 래퍼 없음, import 해서 써도 동일)
+HighQualityPDFGenerator._adaptive_pdf_page = _adaptive_pdf_page_global
+HighQualityPDFGenerator._add_adaptive_feedback_text = _add_adaptive_feedback_text_global
+HighQualityPDFGenerator._add_adaptive_feedback_text_natural = _add_adaptive_feedback_text_natural
+HighQualityPDFGenerator._render_vector_annotation_adaptive = _render_vector_annotation_adaptive
 
 if __name__ == '__main__':
-    # 프로덕션 모드에서는 콘솔 창 숨김
-    if os.name == 'nt' and not ('--debug' in sys.argv or os.getenv('DEBUG_MODE') == '1'):
+    # 프로덕션 모드에서 콘솔이 남아 있는 경우(콘솔 빌드 실행 파일, pythonw.exe 가 없는 환경)만 콘솔 창 숨김
+    if os.name == 'nt' and not DEBUG and os.path.basename(sys.executable).lower() != 'pythonw.exe':
         try:
             import ctypes
             ctypes.windll.user32.ShowWindow(ctypes.windll.kernel32.GetConsoleWindow(), 0)
         except:
             pass
     
-    # 적응형 메서드 동적 추가
-    add_adaptive_methods_to_pdf_generator()
-    
     main()
     
\ No newline at end of file